@@ -1,7 +1,15 @@
 """AppConfig from Auth."""
+from __future__ import annotations
+
 from django.apps import AppConfig
 
 
 class AuthConfig(AppConfig):  # noqa: D101
     default_auto_field = "django.db.models.BigAutoField"
     name = "auth"
+    # "auth" is taken by django.contrib.auth.
+    label = "remindme_auth"
+
+    def ready(self: AuthConfig) -> None:
+        """Connect the token cache eviction signals."""
+        from auth import authentication  # noqa: F401
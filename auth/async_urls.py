@@ -0,0 +1,12 @@
+"""Urls module for auth under ASGI."""
+
+from django.urls import path
+
+from .async_views import AsyncLoginView, AsyncLogoutView
+from .views import SignupView
+
+urlpatterns = [
+    path("signup/", SignupView.as_view(), name="signup"),
+    path("login/", AsyncLoginView.as_view(), name="login"),
+    path("logout/", AsyncLogoutView.as_view(), name="logout"),
+]
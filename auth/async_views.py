@@ -0,0 +1,73 @@
+"""Async auth views, served by ``config.asgi_urls`` under ASGI."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.contrib.auth.models import AnonymousUser, User
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.response import Response
+
+from auth import hashing
+from config.async_api import AsyncAPIView
+from config.querybudget import query_budget
+
+if TYPE_CHECKING:
+    from rest_framework.request import Request
+
+
+class AsyncLoginView(AsyncAPIView):
+    """Async counterpart of ``LoginView``."""
+
+    # A first login also creates the token: a lookup and an insert in a
+    # savepoint.
+    @query_budget(5)
+    async def post(self: AsyncLoginView, request: Request) -> Response:
+        """Login."""
+        username = request.data.get("username")
+        password = request.data.get("password")
+
+        if not (username and password):
+            return Response(
+                {
+                    "success": False,
+                    "data": {"detail": "Username or password is missing."},
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        user = (
+            await User.objects.select_related("auth_token")
+            .filter(username=username)
+            .afirst()
+        )
+
+        if not user or not await hashing.acheck_password(user, password):
+            return Response(
+                {"success": False, "data": {"detail": "Invalid username or password."}},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        try:
+            token = user.auth_token
+        except Token.DoesNotExist:
+            token, _ = await Token.objects.aget_or_create(user=user)
+        return Response({"success": True, "data": {"token": token.key}})
+
+
+class AsyncLogoutView(AsyncAPIView):
+    """Async counterpart of ``LogoutView``."""
+
+    @query_budget(2)
+    async def post(self: AsyncLogoutView, request: Request) -> Response:
+        """Logout."""
+        user: User = request.user
+        if type(user) is AnonymousUser:
+            return Response(
+                {"detail": "Authentication credentials required"},
+                status=status.HTTP_401_UNAUTHORIZED,
+            )
+        user_token: Token = request.auth or await Token.objects.aget(user=user)
+        await user_token.adelete()
+        return Response({"detail": "Logout Successful"}, status=status.HTTP_200_OK)
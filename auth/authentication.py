@@ -0,0 +1,139 @@
+"""Token authentication backed by a token to user lookup cache.
+
+Resolved tokens are kept in the ``AUTH_TOKEN_CACHE_ALIAS`` cache as the
+user's id and ``is_active`` flag only; the other user fields are loaded on
+first access. Entries expire after ``AUTH_TOKEN_CACHE_TIMEOUT`` and the
+cache backend bounds the number of entries. Deleting a token, or saving or
+deleting its user, evicts the entry at once, so logout takes effect on the
+next request.
+
+Evictions only reach the processes that share the cache, so the alias must
+name a shared backend such as Redis or memcached. With no alias, or a
+process-local backend such as locmem, where a token deleted in one worker
+would keep authenticating in the others, tokens are looked up in the
+database on every request, as by ``TokenAuthentication``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import router
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+from config.stats import Counters
+
+if TYPE_CHECKING:
+    from django.core.cache.backends.base import BaseCache
+
+TOKEN_KEY = "auth:token:{digest}"  # noqa: S105
+
+
+stats = Counters("hits", "misses", "evictions")
+
+
+def cache_is_shared(cache: BaseCache) -> bool:
+    """Check whether every worker process sees the same ``cache``."""
+    return not isinstance(cache, LocMemCache)
+
+
+def token_cache_key(key: str) -> str:
+    """Return the cache key of a token.
+
+    The token is a credential, so only its digest is used as the key.
+    """
+    digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    return TOKEN_KEY.format(digest=digest)
+
+
+def evict_token(key: str) -> None:
+    """Drop a token from the lookup cache."""
+    alias = settings.AUTH_TOKEN_CACHE_ALIAS
+    if alias is None:
+        return
+    caches[alias].delete(token_cache_key(key))
+    stats.incr("evictions")
+
+
+def cached_credentials(
+    user_id: int,
+    key: str,
+    *,
+    is_active: bool,
+) -> tuple[User, Token]:
+    """Rebuild a token and its user from the cached fields.
+
+    The other fields are deferred and loaded from the database on first
+    access, so password hashes and the like never reach the cache.
+    """
+    db = router.db_for_read(User)
+    user = User.from_db(db, ["id", "is_active"], [user_id, is_active])
+    token = Token.from_db(db, ["key", "user_id"], [key, user_id])
+    token.user = user
+    return (user, token)
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """TokenAuthentication that caches the Token and User join."""
+
+    def authenticate_credentials(
+        self: CachedTokenAuthentication,
+        key: str,
+    ) -> tuple[User, Token]:
+        """Resolve a token from the cache, falling back to the database."""
+        alias = settings.AUTH_TOKEN_CACHE_ALIAS
+        if alias is None or not cache_is_shared(caches[alias]):
+            return super().authenticate_credentials(key)
+        cache = caches[alias]
+        cache_key = token_cache_key(key)
+        cached = cache.get(cache_key)
+        if cached is None:
+            stats.incr("misses")
+            # Unknown tokens raise here and are never cached.
+            user, token = super().authenticate_credentials(key)
+            cache.set(
+                cache_key,
+                (user.pk, user.is_active),
+                timeout=settings.AUTH_TOKEN_CACHE_TIMEOUT,
+            )
+            return (user, token)
+
+        stats.incr("hits")
+        user_id, is_active = cached
+        if not is_active:
+            raise exceptions.AuthenticationFailed(_("User inactive or deleted."))
+        return cached_credentials(user_id, key, is_active=is_active)
+
+
+@receiver(post_delete, sender=Token, dispatch_uid="auth_evict_deleted_token")
+def evict_deleted_token(
+    sender: type[Token],  # noqa: ARG001
+    instance: Token,
+    **_kwargs: object,
+) -> None:
+    """Evict a token as soon as it is deleted."""
+    evict_token(instance.key)
+
+
+@receiver(post_save, sender=User, dispatch_uid="auth_evict_saved_user_token")
+def evict_saved_user_token(
+    sender: type[User],  # noqa: ARG001
+    instance: User,
+    created: bool,  # noqa: FBT001
+    **_kwargs: object,
+) -> None:
+    """Evict a user's token so cached copies never carry stale user fields."""
+    if created or settings.AUTH_TOKEN_CACHE_ALIAS is None:
+        return
+    for key in Token.objects.filter(user=instance).values_list("key", flat=True):
+        evict_token(key)
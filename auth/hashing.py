@@ -0,0 +1,182 @@
+"""Bounded worker pool for password hashing.
+
+PBKDF2 costs tens of milliseconds of CPU per call. Running it on a small,
+dedicated pool caps how many cores a login storm can take. Work beyond the
+pool's queue limit is shed at once with a 503 instead of piling up behind
+every other request. ``hashlib`` releases the GIL while hashing, so threads
+run in parallel and no user or password has to cross a process boundary.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, TypeVar
+
+from django.conf import settings
+from django.contrib.auth import hashers
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from config.stats import Counters, percentile
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from django.contrib.auth.models import User
+
+T = TypeVar("T")
+
+# Upper bounds, in seconds, of the queue wait histogram buckets.
+WAIT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+
+
+class PasswordHashingUnavailable(APIException):
+    """The hashing pool is saturated; the client should retry shortly."""
+
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "Too many concurrent login or signup requests, try again shortly."
+    default_code = "hashing_unavailable"
+    wait = 1
+
+
+class HashingPoolStats(Counters):
+    """Process-local pool counters and wait times over a bounded reservoir."""
+
+    def __init__(self: HashingPoolStats, size: int = 10_000) -> None:
+        """Keep the most recent ``size`` wait samples."""
+        self._size = size
+        super().__init__("submitted", "rejected", "completed")
+
+    def record_wait(self: HashingPoolStats, wait: float) -> None:
+        """Record how long one task queued before a worker picked it up."""
+        with self._lock:
+            self._waits.append(wait)
+            self._wait_counts[bisect_left(WAIT_BUCKETS, wait)] += 1
+            self._wait_sum += wait
+
+    def wait_histogram(self: HashingPoolStats) -> list[float]:
+        """Return every wait so far as bucket counts, +Inf, then the sum."""
+        with self._lock:
+            return [*self._wait_counts, self._wait_sum]
+
+    def snapshot(self: HashingPoolStats) -> dict[str, float]:
+        """Return the counters and nearest-rank wait percentiles in ms."""
+        with self._lock:
+            ordered = sorted(self._waits)
+            result = dict(self._counts)
+        for point in (50, 95, 99):
+            result[f"wait_p{point}_ms"] = round(percentile(ordered, point) * 1000, 3)
+        return result
+
+    def reset(self: HashingPoolStats) -> None:
+        """Zero every counter and drop the samples."""
+        super().reset()
+        self._waits: deque[float] = deque(maxlen=self._size)
+        self._wait_counts = [0] * (len(WAIT_BUCKETS) + 1)
+        self._wait_sum = 0.0
+
+
+stats = HashingPoolStats()
+
+
+class HashingPool:
+    """A fixed number of hashing threads plus a bounded queue."""
+
+    def __init__(self: HashingPool, workers: int, max_queue: int) -> None:
+        """Admit at most ``workers + max_queue`` tasks at a time."""
+        self._executor = ThreadPoolExecutor(
+            workers,
+            thread_name_prefix="password-hashing",
+        )
+        self._slots = threading.BoundedSemaphore(workers + max_queue)
+
+    def submit(self: HashingPool, fn: Callable[..., T], *args: object) -> Future[T]:
+        """Queue ``fn(*args)``, or raise :class:`PasswordHashingUnavailable` if full."""
+        if not self._slots.acquire(blocking=False):
+            stats.incr("rejected")
+            raise PasswordHashingUnavailable
+        stats.incr("submitted")
+        queued = time.perf_counter()
+
+        def task() -> T:
+            stats.record_wait(time.perf_counter() - queued)
+            try:
+                return fn(*args)
+            finally:
+                self._slots.release()
+                stats.incr("completed")
+
+        return self._executor.submit(task)
+
+    def run(self: HashingPool, fn: Callable[..., T], *args: object) -> T:
+        """Run ``fn(*args)`` on the pool and wait for the result."""
+        return self.submit(fn, *args).result()
+
+    async def arun(self: HashingPool, fn: Callable[..., T], *args: object) -> T:
+        """Async version of :meth:`run`."""
+        return await asyncio.wrap_future(self.submit(fn, *args))
+
+    def shutdown(self: HashingPool) -> None:
+        """Stop the worker threads once queued work is done."""
+        self._executor.shutdown()
+
+
+_pool: HashingPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> HashingPool:
+    """Return the process-wide pool, created from settings on first use."""
+    global _pool  # noqa: PLW0603
+    with _pool_lock:
+        if _pool is None:
+            _pool = HashingPool(
+                settings.AUTH_HASHING_POOL_WORKERS,
+                settings.AUTH_HASHING_POOL_MAX_QUEUE,
+            )
+        return _pool
+
+
+def make_password(raw_password: str) -> str:
+    """Hash a password on the pool."""
+    return get_pool().run(hashers.make_password, raw_password)
+
+
+def check_password(user: User, raw_password: str) -> bool:
+    """Verify a user's password on the pool.
+
+    Unlike ``User.check_password`` the upgrade of an outdated hash is saved
+    from the request thread, so pool threads never touch the database.
+    """
+    outdated: list[str] = []
+    valid = get_pool().run(
+        hashers.check_password,
+        raw_password,
+        user.password,
+        outdated.append,
+    )
+    if valid and outdated:
+        user.password = make_password(raw_password)
+        user.save(update_fields=["password"])
+    return valid
+
+
+async def acheck_password(user: User, raw_password: str) -> bool:
+    """Async version of :func:`check_password`."""
+    pool = get_pool()
+    outdated: list[str] = []
+    valid = await pool.arun(
+        hashers.check_password,
+        raw_password,
+        user.password,
+        outdated.append,
+    )
+    if valid and outdated:
+        user.password = await pool.arun(hashers.make_password, raw_password)
+        await user.asave(update_fields=["password"])
+    return valid
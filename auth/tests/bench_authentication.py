@@ -0,0 +1,79 @@
+"""Token authentication benchmark.
+
+Not collected by the default test run. Execute with::
+
+    python manage.py test auth.tests.bench_authentication
+"""
+from __future__ import annotations
+
+import tempfile
+import time
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient, APITestCase
+
+from auth.authentication import CachedTokenAuthentication
+from reminder.views.reminder import ReminderView
+
+REQUESTS = 2000
+
+
+class BenchTokenAuthentication(APITestCase):
+    """Authenticated listing requests per second with and without the cache."""
+
+    def setUp(self: BenchTokenAuthentication) -> None:
+        """Testcase setup."""
+        caches["default"].clear()
+        # A file cache stands in for Redis: shared between processes, with
+        # its own cost per lookup.
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        shared = override_settings(
+            CACHES={
+                **settings.CACHES,
+                "auth_tokens": {
+                    "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                    "LOCATION": tmp.name,
+                },
+            },
+            AUTH_TOKEN_CACHE_ALIAS="auth_tokens",
+        )
+        shared.enable()
+        self.addCleanup(shared.disable)
+        self.url = reverse("reminder")
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username="bench-user",
+            password="bench-pass",
+        )
+        token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+    def rate(self: BenchTokenAuthentication, auth_class: type) -> float:
+        """Return authenticated GETs per second using ``auth_class``."""
+        with mock.patch.object(ReminderView, "authentication_classes", [auth_class]):
+            # Warm the listing cache so the request is dominated by auth.
+            self.client.get(self.url)
+            start = time.perf_counter()
+            for _ in range(REQUESTS):
+                res = self.client.get(self.url)
+            elapsed = time.perf_counter() - start
+        self.assertEqual(res.status_code, 200)
+        return REQUESTS / elapsed
+
+    def test_plain_vs_cached(self: BenchTokenAuthentication) -> None:
+        """Time ``REQUESTS`` authenticated GETs with each class."""
+        plain = self.rate(TokenAuthentication)
+        cached = self.rate(CachedTokenAuthentication)
+        print(  # noqa: T201
+            f"\n{REQUESTS} authenticated GETs: TokenAuthentication {plain:,.0f} req/s,"
+            f" CachedTokenAuthentication {cached:,.0f} req/s, {cached / plain:.2f}x",
+        )
+        self.assertGreater(cached, plain)
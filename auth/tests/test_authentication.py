@@ -0,0 +1,206 @@
+"""Cached token authentication test module."""
+from __future__ import annotations
+
+import tempfile
+from typing import TYPE_CHECKING
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.cache.backends.filebased import FileBasedCache
+from django.db import connection
+from django.test import SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient, APITestCase
+
+from auth import authentication
+from config.checks import LOCMEM_BACKEND, token_cache
+
+if TYPE_CHECKING:
+    from rest_framework.response import Response
+
+
+class TestCachedTokenAuthentication(APITestCase):
+    """Token lookup cache tests."""
+
+    def setUp(self: TestCachedTokenAuthentication) -> None:
+        """Testcase setup."""
+        # A file cache is shared by every process on the host, like Redis.
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.location = tmp.name
+        self.local_caches = {
+            **settings.CACHES,
+            "auth_tokens": {"BACKEND": LOCMEM_BACKEND},
+        }
+        shared = override_settings(
+            CACHES={
+                **settings.CACHES,
+                "auth_tokens": {
+                    "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                    "LOCATION": self.location,
+                },
+            },
+            AUTH_TOKEN_CACHE_ALIAS="auth_tokens",
+        )
+        shared.enable()
+        self.addCleanup(shared.disable)
+        caches["default"].clear()
+        authentication.stats.reset()
+        self.url = reverse("reminder")
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username="test-user",
+            password="test-pass",
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
+
+    def token_queries(self: TestCachedTokenAuthentication) -> int:
+        """GET the listing and count the queries that touch the token table."""
+        with CaptureQueriesContext(connection) as ctx:
+            res: Response = self.client.get(self.url)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        return sum("authtoken_token" in query["sql"] for query in ctx.captured_queries)
+
+    def test_second_request_skips_the_lookup(
+        self: TestCachedTokenAuthentication,
+    ) -> None:
+        """Only the first request resolves the token in the database."""
+        self.assertEqual(self.token_queries(), 1)
+        self.assertEqual(self.token_queries(), 0)
+        self.assertEqual(
+            authentication.stats.snapshot(),
+            {"hits": 1, "misses": 1, "evictions": 0},
+        )
+
+    def test_only_the_user_id_is_cached(self: TestCachedTokenAuthentication) -> None:
+        """The cache holds no user fields beyond what authentication checks."""
+        self.token_queries()
+        cached = caches["auth_tokens"].get(
+            authentication.token_cache_key(self.token.key),
+        )
+        self.assertEqual(cached, (self.user.pk, True))
+
+    def test_cached_user_loads_on_access(self: TestCachedTokenAuthentication) -> None:
+        """A user rebuilt from the cache loads its other fields when read."""
+        self.token_queries()
+        (
+            user,
+            token,
+        ) = authentication.CachedTokenAuthentication().authenticate_credentials(
+            self.token.key,
+        )
+        self.assertEqual(authentication.stats.snapshot()["hits"], 1)
+        self.assertEqual(
+            (user.pk, token.key, token.user),
+            (self.user.pk, self.token.key, user),
+        )
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(user.username, "test-user")
+        self.assertEqual(len(ctx.captured_queries), 1)
+
+    def test_raw_token_is_not_a_cache_key(self: TestCachedTokenAuthentication) -> None:
+        """Only a digest of the credential reaches the cache."""
+        self.assertNotIn(self.token.key, authentication.token_cache_key(self.token.key))
+
+    def test_invalid_token(self: TestCachedTokenAuthentication) -> None:
+        """Unknown tokens are rejected every time and never cached."""
+        self.client.credentials(HTTP_AUTHORIZATION="Token not-a-token")
+        for _ in range(2):
+            res: Response = self.client.get(self.url)
+            self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(authentication.stats.snapshot()["hits"], 0)
+
+    def test_logout_evicts(self: TestCachedTokenAuthentication) -> None:
+        """A logged out token is refused on the very next request."""
+        self.token_queries()
+        res: Response = self.client.post(reverse("logout"))
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertFalse(Token.objects.filter(user=self.user).exists())
+        res = self.client.get(self.url)
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_token_delete_evicts(self: TestCachedTokenAuthentication) -> None:
+        """Deleting a token outside the API also evicts it."""
+        self.token_queries()
+        Token.objects.filter(user=self.user).delete()
+        res: Response = self.client.get(self.url)
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_user_delete_evicts(self: TestCachedTokenAuthentication) -> None:
+        """Deleting the user cascades to the token and evicts it."""
+        self.token_queries()
+        self.user.delete()
+        res: Response = self.client.get(self.url)
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_deactivated_user_is_refused(self: TestCachedTokenAuthentication) -> None:
+        """Deactivating a user evicts the cached user along with the token."""
+        self.token_queries()
+        self.user.is_active = False
+        self.user.save()
+        res: Response = self.client.get(self.url)
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_logout_reaches_other_processes(
+        self: TestCachedTokenAuthentication,
+    ) -> None:
+        """The eviction is seen by another process's client of the shared cache."""
+        self.token_queries()
+        other = FileBasedCache(self.location, {})
+        cache_key = authentication.token_cache_key(self.token.key)
+        self.assertIsNotNone(other.get(cache_key))
+        self.client.post(reverse("logout"))
+        self.assertIsNone(other.get(cache_key))
+
+    def test_process_local_cache_is_skipped(
+        self: TestCachedTokenAuthentication,
+    ) -> None:
+        """With locmem every request looks the token up in the database."""
+        with override_settings(CACHES=self.local_caches):
+            self.assertEqual(self.token_queries(), 1)
+            # Another worker deletes the token; this one has nothing to evict.
+            with mock.patch.object(authentication, "evict_token"):
+                Token.objects.filter(user=self.user).delete()
+            res: Response = self.client.get(self.url)
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(
+            authentication.stats.snapshot(),
+            {"hits": 0, "misses": 0, "evictions": 0},
+        )
+
+    @override_settings(AUTH_TOKEN_CACHE_ALIAS=None)
+    def test_no_alias(self: TestCachedTokenAuthentication) -> None:
+        """Without an alias every request looks the token up in the database."""
+        self.assertEqual(self.token_queries(), 1)
+        self.assertEqual(self.token_queries(), 1)
+        self.client.post(reverse("logout"))
+        res: Response = self.client.get(self.url)
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(
+            authentication.stats.snapshot(),
+            {"hits": 0, "misses": 0, "evictions": 0},
+        )
+
+
+class TestTokenCacheCheck(SimpleTestCase):
+    """config.W003."""
+
+    def test_no_alias(self: TestTokenCacheCheck) -> None:
+        """Leaving the cache off is not a warning."""
+        self.assertEqual(token_cache(None, {}), [])
+
+    def test_shared_backend(self: TestTokenCacheCheck) -> None:
+        """A shared backend passes."""
+        caches = {"tokens": {"BACKEND": "django.core.cache.backends.redis.RedisCache"}}
+        self.assertEqual(token_cache("tokens", caches), [])
+
+    def test_locmem_backend(self: TestTokenCacheCheck) -> None:
+        """A locmem alias warns that tokens are not cached."""
+        caches = {"tokens": {"BACKEND": LOCMEM_BACKEND}}
+        self.assertEqual([m.id for m in token_cache("tokens", caches)], ["config.W003"])
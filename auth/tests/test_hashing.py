@@ -0,0 +1,103 @@
+"""Password hashing pool test module."""
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+from unittest import mock
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from auth import hashing
+
+if TYPE_CHECKING:
+    from rest_framework.response import Response
+
+
+class TestHashingPool(APITestCase):
+    """Bounded pool and view integration tests."""
+
+    def setUp(self: TestHashingPool) -> None:
+        """Testcase setup."""
+        hashing.stats.reset()
+        self.client = APIClient()
+        self.release = threading.Event()
+        self.pool = hashing.HashingPool(workers=1, max_queue=1)
+        self.addCleanup(self.pool.shutdown)
+        self.addCleanup(self.release.set)
+        self.user = User.objects.create_user(
+            username="test-user",
+            password="test-pass",
+        )
+
+    def saturate(self: TestHashingPool) -> list:
+        """Fill the worker and the queue with tasks blocked on ``release``."""
+        return [self.pool.submit(self.release.wait) for _ in range(2)]
+
+    def test_sheds_load_when_saturated(self: TestHashingPool) -> None:
+        """A task beyond workers plus queue is rejected immediately."""
+        futures = self.saturate()
+        with self.assertRaises(hashing.PasswordHashingUnavailable):
+            self.pool.submit(self.release.wait)
+        self.release.set()
+        for future in futures:
+            self.assertTrue(future.result(timeout=5))
+        self.assertTrue(self.pool.run(lambda: True))
+        snapshot = hashing.stats.snapshot()
+        self.assertEqual(snapshot["submitted"], 3)
+        self.assertEqual(snapshot["rejected"], 1)
+        self.assertEqual(snapshot["completed"], 3)
+
+    def test_records_wait_time(self: TestHashingPool) -> None:
+        """Queued tasks record how long they waited for a worker."""
+        futures = self.saturate()
+        threading.Timer(0.05, self.release.set).start()
+        for future in futures:
+            future.result(timeout=5)
+        self.assertGreaterEqual(hashing.stats.snapshot()["wait_p99_ms"], 40)
+
+    def test_login_returns_503_when_saturated(self: TestHashingPool) -> None:
+        """Login sheds with a 503 and Retry-After instead of queueing."""
+        self.saturate()
+        # drf-standardized-errors reports 5xx responses as request exceptions.
+        self.client.raise_request_exception = False
+        with mock.patch.object(hashing, "_pool", self.pool):
+            res: Response = self.client.post(
+                reverse("login"),
+                data={"username": "test-user", "password": "test-pass"},
+            )
+        self.assertEqual(res.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(res["Retry-After"], "1")
+        self.assertEqual(res.data["errors"][0]["code"], "hashing_unavailable")
+
+    def test_signup_hashes_on_the_pool(self: TestHashingPool) -> None:
+        """Signup stores a usable hash computed by the pool."""
+        with mock.patch.object(hashing, "_pool", self.pool):
+            res: Response = self.client.post(
+                reverse("signup"),
+                data={"username": "new-user", "password": "Str0ng-pass!"},
+            )
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(
+            User.objects.get(username="new-user").check_password("Str0ng-pass!"),
+        )
+        self.assertEqual(hashing.stats.snapshot()["completed"], 1)
+
+    @override_settings(
+        PASSWORD_HASHERS=[
+            "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+            "django.contrib.auth.hashers.MD5PasswordHasher",
+        ],
+    )
+    def test_outdated_hash_is_upgraded(self: TestHashingPool) -> None:
+        """A valid password stored with an old hasher is rehashed and saved."""
+        self.user.password = make_password("test-pass", hasher="md5")
+        self.user.save()
+        self.assertTrue(hashing.check_password(self.user, "test-pass"))
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith("pbkdf2_sha256$"))
+        self.assertFalse(hashing.check_password(self.user, "wrong-pass"))
@@ -13,7 +13,9 @@ from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from auth import hashing
 from auth.serializers import UserSerializer
+from config.querybudget import query_budget
 
 if TYPE_CHECKING:
     from rest_framework.request import Request
@@ -24,6 +26,7 @@ class SignupView(APIView):
 
     permission_classes: typing.ClassVar = [AllowAny]
 
+    @query_budget(2)
     def post(self: SignupView, request: Request) -> Response:
         """Signup."""
         serializer = UserSerializer(data=request.data)
@@ -40,9 +43,10 @@ class SignupView(APIView):
 
         password: str = request.data["password"]
         validate_password(password=password)
-        User.objects.create_user(
-            username=request.data["username"],
-            password=request.data["password"],
+        # Same as create_user, with the hashing done on the hashing pool.
+        User.objects.create(
+            username=User.normalize_username(request.data["username"]),
+            password=hashing.make_password(password),
         )
         return Response(
             {
@@ -58,6 +62,9 @@ class SignupView(APIView):
 class LoginView(APIView):
     """Login."""
 
+    # A first login also creates the token: a lookup and an insert in a
+    # savepoint.
+    @query_budget(5)
     def post(self: LoginView, request: Request) -> Response:
         """Login."""
         username = request.data.get("username")
@@ -72,15 +79,21 @@ class LoginView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        user = User.objects.filter(username=username).first()
+        # The token comes in the same query; only a first login creates one.
+        user = (
+            User.objects.select_related("auth_token").filter(username=username).first()
+        )
 
-        if not user or not user.check_password(password):
+        if not user or not hashing.check_password(user, password):
             return Response(
                 {"success": False, "data": {"detail": "Invalid username or password."}},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        token, created = Token.objects.get_or_create(user=user)
+        try:
+            token = user.auth_token
+        except Token.DoesNotExist:
+            token, _ = Token.objects.get_or_create(user=user)
         return Response({"success": True, "data": {"token": token.key}})
 
 
@@ -89,6 +102,7 @@ class LogoutView(APIView):
 
     permission_classe: typing.ClassVar = [IsAuthenticated]
 
+    @query_budget(2)
     def post(self: LogoutView, request: Request) -> Response:
         """Logout."""
         user: User = request.user
@@ -97,6 +111,8 @@ class LogoutView(APIView):
                 {"detail": "Authentication credentials required"},
                 status=status.HTTP_401_UNAUTHORIZED,
             )
-        user_token: Token = user.auth_token
+        # The authenticated token is already loaded; deleting it also evicts
+        # it from the token lookup cache.
+        user_token: Token = request.auth or user.auth_token
         user_token.delete()
         return Response({"detail": "Logout Successful"}, status=status.HTTP_200_OK)
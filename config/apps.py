@@ -0,0 +1,26 @@
+"""AppConfig for project-wide wiring."""
+from __future__ import annotations
+
+import atexit
+
+from django.apps import AppConfig
+from django.conf import settings
+from django.db.backends.signals import connection_created
+
+
+class ProjectConfig(AppConfig):
+    """Registers the project's system checks, metrics and profiling hooks."""
+
+    name = "config"
+
+    def ready(self: ProjectConfig) -> None:
+        """Register the system checks and the database query hooks."""
+        from config import checks  # noqa: F401
+        from config.metrics import install_query_wrapper, store
+        from config.profiling import install_query_logger
+
+        connection_created.connect(install_query_wrapper)
+        connection_created.connect(install_query_logger)
+        if settings.METRICS_DIR is not None:
+            # Counts since the last periodic flush would be lost otherwise.
+            atexit.register(store.flush, settings.METRICS_DIR)
@@ -4,6 +4,10 @@ It exposes the ASGI callable as a module-level variable named ``application``.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.0/howto/deployment/asgi/
+
+Serve it with an ASGI server, for example::
+
+    gunicorn config.asgi:application -k uvicorn.workers.UvicornWorker
 """
 
 import os
@@ -11,5 +15,8 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+os.environ.setdefault("DJANGO_ROOT_URLCONF", "config.asgi_urls")
+# Turns persistent database connections off by default (config.database).
+os.environ.setdefault("DJANGO_ASGI", "1")
 
 application = get_asgi_application()
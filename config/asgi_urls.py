@@ -0,0 +1,21 @@
+"""URL configuration used under ASGI.
+
+Same routes as ``config.urls``, with the async reminder and auth views.
+"""
+
+from django.contrib import admin
+from django.urls import include, path
+from django.views.generic.base import RedirectView
+from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
+
+from config.metrics import metrics_view
+
+urlpatterns = [
+    path("", RedirectView.as_view(url="/api/schema/docs")),
+    path("admin/", admin.site.urls),
+    path("auth/", include("auth.async_urls")),
+    path("api/reminder/", include("reminder.async_urls")),
+    path("api/schema", SpectacularAPIView.as_view(), name="schema"),
+    path("api/schema/docs", SpectacularSwaggerView.as_view(url_name="schema")),
+    path("metrics", metrics_view, name="metrics"),
+]
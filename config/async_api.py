@@ -0,0 +1,68 @@
+"""Native async DRF views.
+
+DRF's ``APIView`` only dispatches synchronously. :class:`AsyncAPIView` keeps
+its request, authentication, permission and exception handling, but awaits
+``async def`` handlers so they can use Django's async ORM under ASGI.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from asgiref.sync import markcoroutinefunction, sync_to_async
+from rest_framework.views import APIView
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from django.http import HttpRequest
+    from rest_framework.response import Response
+
+
+class AsyncAPIView(APIView):
+    """APIView whose handlers are coroutines."""
+
+    @classmethod
+    def as_view(cls: type[AsyncAPIView], **initkwargs: object) -> Callable:
+        """Return a view function Django's handlers recognise as async."""
+        view = super().as_view(**initkwargs)
+        # APIView wraps the view in csrf_exempt, which hides that it is async.
+        markcoroutinefunction(view)
+        return view
+
+    async def dispatch(
+        self: AsyncAPIView,
+        request: HttpRequest,
+        *args: object,
+        **kwargs: object,
+    ) -> Response:
+        """Await the handler; everything else follows ``APIView.dispatch``."""
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            # Authentication may hit the database, so it leaves the event loop.
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(
+                    self,
+                    request.method.lower(),
+                    self.http_method_not_allowed,
+                )
+            else:
+                handler = self.http_method_not_allowed
+
+            response = handler(request, *args, **kwargs)
+            if asyncio.iscoroutine(response):
+                response = await response
+
+        except Exception as exc:  # noqa: BLE001
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
@@ -0,0 +1 @@
+"""Custom database backends."""
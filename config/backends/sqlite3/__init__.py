@@ -0,0 +1 @@
+"""SQLite backend with WAL, tuned pragmas and BEGIN IMMEDIATE."""
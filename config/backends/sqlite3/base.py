@@ -0,0 +1,56 @@
+"""SQLite backend tuned for several concurrent web workers.
+
+Enabled with ``DB_SQLITE_TUNED=1`` (see ``config.database``). Every new
+connection gets :data:`PRAGMAS`, overridable through
+``OPTIONS["pragmas"]``:
+
+* WAL journaling lets readers run alongside the single writer, and
+  ``synchronous=NORMAL`` syncs at checkpoints instead of on every commit.
+* ``busy_timeout`` makes a blocked writer wait instead of failing.
+* ``cache_size`` and ``mmap_size`` keep hot pages in memory.
+
+Transactions start with ``BEGIN IMMEDIATE``. A deferred transaction that
+reads first and then writes cannot wait for the lock; SQLite fails it at
+once with "database is locked". Taking the write lock up front makes it
+queue on ``busy_timeout`` instead.
+"""
+
+from __future__ import annotations
+
+from typing import ClassVar
+
+from django.db.backends.sqlite3 import base
+
+PRAGMAS: dict[str, str | int] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,  # ms
+    "cache_size": -20000,  # KiB
+    "mmap_size": 128 * 1024 * 1024,
+    "temp_store": "MEMORY",
+}
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """SQLite wrapper applying :data:`PRAGMAS` and ``BEGIN IMMEDIATE``."""
+
+    pragmas: ClassVar[dict[str, str | int]] = PRAGMAS
+
+    def get_connection_params(self: DatabaseWrapper) -> dict:
+        """Split the pragmas off the ``sqlite3.connect`` arguments."""
+        params = super().get_connection_params()
+        self.pragmas = {**PRAGMAS, **params.pop("pragmas", {})}
+        return params
+
+    def get_new_connection(
+        self: DatabaseWrapper,
+        conn_params: dict,
+    ) -> base.Database.Connection:
+        """Open a connection and apply the pragmas to it."""
+        conn = super().get_new_connection(conn_params)
+        for name, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {name} = {value}")
+        return conn
+
+    def _start_transaction_under_autocommit(self: DatabaseWrapper) -> None:
+        self.cursor().execute("BEGIN IMMEDIATE")
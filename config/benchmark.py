@@ -0,0 +1,288 @@
+"""Benchmark suite for the REST API.
+
+:func:`seed` bulk-inserts users, tokens and reminders; :func:`run_suite`
+then drives signup, login, list, create and delete through Django's
+``WSGIHandler``, the same entry point gunicorn calls, with every middleware
+in place. Each scenario reports its throughput and nearest-rank p50, p95
+and p99 latency. ``manage.py benchmark_api`` runs the suite against a
+throwaway test database and writes the results as JSON;
+``manage.py compare_benchmarks`` flags regressions against a baseline,
+such as ``benchmarks/baseline.json``::
+
+    python manage.py benchmark_api --output current.json
+    python manage.py compare_benchmarks benchmarks/baseline.json current.json
+
+Requests are issued one at a time, so throughput is that of a single
+worker thread.
+"""
+
+from __future__ import annotations
+
+import datetime
+import io
+import json
+import platform
+import sys
+import time
+from itertools import count, cycle
+from typing import TYPE_CHECKING
+
+import django
+from django.conf import settings
+from django.contrib.auth.hashers import get_hasher, make_password
+from django.contrib.auth.models import User
+from django.core.handlers.wsgi import WSGIHandler
+from django.db import connection
+from rest_framework.authtoken.models import Token
+
+from config.stats import percentile
+from reminder.models import Reminder
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    # Lazily built requests of one scenario, each returning its status code.
+    Requests = Iterator[Callable[[], int]]
+
+PASSWORD = "bench-Passw0rd-4-RemindMe"  # noqa: S105
+BATCH_SIZE = 1000
+WARMUP = 5  # untimed requests before each scenario
+# Latency figures compared by compare_benchmarks; higher is worse.
+LATENCY_KEYS = ("p50_ms", "p95_ms", "p99_ms")
+
+
+def seed(users: int, reminders: int) -> list[tuple[User, str]]:
+    """Bulk-insert ``users`` users with a token and ``reminders`` reminders each.
+
+    Returns each user with its token key.
+    """
+    # One hash shared by every user; hashing per user would dominate seeding.
+    password = make_password(PASSWORD)
+    created = User.objects.bulk_create(
+        (User(username=f"bench-{n}", password=password) for n in range(users)),
+        batch_size=BATCH_SIZE,
+    )
+    if not connection.features.can_return_rows_from_bulk_insert:
+        created = list(User.objects.filter(username__startswith="bench-"))
+    tokens = Token.objects.bulk_create(
+        (Token(user=user, key=Token.generate_key()) for user in created),
+        batch_size=BATCH_SIZE,
+    )
+    base = datetime.datetime.now(tz=datetime.timezone.utc) + datetime.timedelta(
+        days=1,
+    )
+    Reminder.objects.bulk_create(
+        (
+            Reminder(
+                reminder_title=f"Bench {n}",
+                user=user,
+                end_date_time=base + datetime.timedelta(minutes=n),
+            )
+            for user in created
+            for n in range(reminders)
+        ),
+        batch_size=BATCH_SIZE,
+    )
+    return [(token.user, token.key) for token in tokens]
+
+
+class WSGIClient:
+    """Minimal WSGI client that calls Django's ``WSGIHandler`` directly."""
+
+    def __init__(self: WSGIClient) -> None:
+        """Load the middleware once, as a server worker does."""
+        self.handler = WSGIHandler()
+
+    def request(
+        self: WSGIClient,
+        method: str,
+        path: str,
+        body: object = None,
+        token: str | None = None,
+    ) -> int:
+        """Issue one request, read the whole body and return the status code."""
+        data = b"" if body is None else json.dumps(body).encode()
+        environ = {
+            "REQUEST_METHOD": method,
+            "PATH_INFO": path,
+            "QUERY_STRING": "",
+            "SERVER_NAME": "testserver",
+            "SERVER_PORT": "80",
+            "SERVER_PROTOCOL": "HTTP/1.1",
+            "REMOTE_ADDR": "127.0.0.1",
+            "CONTENT_TYPE": "application/json",
+            "CONTENT_LENGTH": str(len(data)),
+            "wsgi.version": (1, 0),
+            "wsgi.url_scheme": "http",
+            "wsgi.input": io.BytesIO(data),
+            "wsgi.errors": sys.stderr,
+            "wsgi.multithread": False,
+            "wsgi.multiprocess": True,
+            "wsgi.run_once": False,
+        }
+        if token is not None:
+            environ["HTTP_AUTHORIZATION"] = f"Token {token}"
+        status_line = []
+        response = self.handler(
+            environ,
+            lambda status, _headers, _exc_info=None: status_line.append(status),
+        )
+        try:
+            for _chunk in response:
+                pass
+        finally:
+            response.close()
+        return int(status_line[0].split()[0])
+
+
+def measure(requests: Requests, number: int) -> dict[str, float]:
+    """Time ``number`` requests and summarise their latency and throughput."""
+    # Untimed, so lazy imports and first-use setup stay out of the tail.
+    for _ in range(WARMUP):
+        next(requests)()
+    samples = []
+    errors = 0
+    started = time.perf_counter()
+    for _ in range(number):
+        issue = next(requests)
+        start = time.perf_counter()
+        status = issue()
+        samples.append((time.perf_counter() - start) * 1000)
+        errors += status >= 400  # noqa: PLR2004
+    elapsed = time.perf_counter() - started
+    samples.sort()
+    return {
+        "requests": number,
+        "errors": errors,
+        "throughput_rps": round(number / elapsed, 2) if elapsed else 0.0,
+        **{
+            f"p{point}_ms": round(percentile(samples, point), 3)
+            for point in (50, 95, 99)
+        },
+    }
+
+
+def signups(client: WSGIClient, _seeded: list) -> Requests:
+    """Sign up new users."""
+    for n in count():
+        yield lambda n=n: client.request(
+            "POST",
+            "/auth/signup/",
+            {"username": f"bench-signup-{n}", "password": PASSWORD},
+        )
+
+
+def logins(client: WSGIClient, seeded: list) -> Requests:
+    """Log the seeded users in, round robin."""
+    for user, _key in cycle(seeded):
+        yield lambda user=user: client.request(
+            "POST",
+            "/auth/login/",
+            {"username": user.username, "password": PASSWORD},
+        )
+
+
+def listings(client: WSGIClient, seeded: list) -> Requests:
+    """List the reminders of the seeded users, round robin."""
+    for _user, key in cycle(seeded):
+        yield lambda key=key: client.request("GET", "/api/reminder/", token=key)
+
+
+def creates(client: WSGIClient, seeded: list) -> Requests:
+    """Create a reminder for each seeded user in turn."""
+    end = datetime.datetime.now(tz=datetime.timezone.utc) + datetime.timedelta(
+        days=30,
+    )
+    for n, (_user, key) in enumerate(cycle(seeded)):
+        body = {"reminder_title": f"Created {n}", "end_date_time": end.isoformat()}
+        yield lambda key=key, body=body: client.request(
+            "POST",
+            "/api/reminder/",
+            body,
+            token=key,
+        )
+
+
+def deletes(client: WSGIClient, seeded: list) -> Requests:
+    """Delete the reminders :func:`creates` made."""
+    keys = {user.id: key for user, key in seeded}
+    for reminder_id, user_id in Reminder.objects.filter(
+        reminder_title__startswith="Created ",
+    ).values_list("id", "user_id"):
+        yield lambda reminder_id=reminder_id, key=keys[user_id]: client.request(
+            "DELETE",
+            f"/api/reminder/{reminder_id}/",
+            token=key,
+        )
+
+
+SCENARIOS = {
+    "signup": signups,
+    "login": logins,
+    "list": listings,
+    "create": creates,
+    "delete": deletes,
+}
+
+
+def run_suite(users: int, reminders: int, requests: int) -> dict:
+    """Seed the database, run every scenario in order and return the results."""
+    seeded = seed(users, reminders)
+    client = WSGIClient()
+    # Each scenario's requests are built lazily, so delete sees what create
+    # made.
+    results = {
+        name: measure(scenario(client, seeded), requests)
+        for name, scenario in SCENARIOS.items()
+    }
+    return {"meta": environment(users, reminders, requests), "results": results}
+
+
+def environment(users: int, reminders: int, requests: int) -> dict:
+    """Describe what the results were measured on."""
+    return {
+        "created": datetime.datetime.now(tz=datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "django": django.get_version(),
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+        "database": connection.vendor,
+        "password_hasher": get_hasher().algorithm,
+        "listing_cache": settings.REMINDER_LISTING_CACHE_ENABLED,
+        "users": users,
+        "reminders_per_user": reminders,
+        "requests_per_scenario": requests,
+        "warmup_per_scenario": WARMUP,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list[str]:
+    """Return a line per scenario metric more than ``threshold`` worse than baseline.
+
+    ``threshold`` is a fraction: 0.1 flags anything 10% slower.
+    """
+    regressions = []
+    for name, base in baseline["results"].items():
+        now = current["results"].get(name)
+        if now is None:
+            regressions.append(f"{name}: missing from the current run")
+            continue
+        if now["errors"] > base["errors"]:
+            regressions.append(
+                f"{name}: errors {base['errors']} -> {now['errors']}",
+            )
+        regressions.extend(
+            f"{name}: {key} {base[key]} -> {now[key]}"
+            f" (+{now[key] / base[key] - 1:.0%})"
+            for key in LATENCY_KEYS
+            if base[key] and now[key] > base[key] * (1 + threshold)
+        )
+        if base["throughput_rps"] and now["throughput_rps"] < base["throughput_rps"] * (
+            1 - threshold
+        ):
+            regressions.append(
+                f"{name}: throughput_rps {base['throughput_rps']}"
+                f" -> {now['throughput_rps']}"
+                f" ({now['throughput_rps'] / base['throughput_rps'] - 1:.0%})",
+            )
+    return regressions
@@ -0,0 +1,103 @@
+"""System checks for the project configuration."""
+
+from __future__ import annotations
+
+import os
+import shlex
+
+from django.conf import settings
+from django.core.checks import CheckMessage, Info, register
+from django.core.checks import Warning as CheckWarning
+from gunicorn.config import Config
+
+from config.database import SQLITE_ENGINES
+
+LOCMEM_BACKEND = "django.core.cache.backends.locmem.LocMemCache"
+
+
+def gunicorn_concurrency() -> tuple[int, int]:
+    """Return the ``(workers, threads)`` gunicorn will start with.
+
+    Uses gunicorn's own defaults, so ``WEB_CONCURRENCY`` and
+    ``GUNICORN_CMD_ARGS`` are honoured exactly as the server would.
+    """
+    config = Config()
+    args, _ = config.parser().parse_known_args(
+        shlex.split(os.environ.get("GUNICORN_CMD_ARGS", "")),
+    )
+    return args.workers or config.workers, args.threads or config.threads
+
+
+def connection_budget(
+    database: dict,
+    workers: int,
+    threads: int,
+    limit: int,
+) -> list[CheckMessage]:
+    """Report how many connections ``workers`` processes can open against ``limit``."""
+    if database["ENGINE"] in SQLITE_ENGINES:
+        return []
+
+    pool = database.get("OPTIONS", {}).get("pool")
+    # Without a pool every thread holds its own connection.
+    per_worker = pool["max_size"] if pool else threads
+    total = workers * per_worker
+    sizing = (
+        f"{workers} gunicorn worker(s) x {per_worker} connection(s)"
+        f" {'pool' if pool else 'per worker'} = {total} connection(s),"
+        f" DATABASE_MAX_CONNECTIONS is {limit}."
+    )
+
+    messages: list[CheckMessage] = []
+    if total > limit:
+        messages.append(
+            CheckWarning(
+                sizing,
+                hint="Lower DB_POOL_MAX_SIZE or the worker count, or raise the server's max_connections.",
+                id="config.W001",
+            ),
+        )
+    else:
+        messages.append(Info(sizing, id="config.I001"))
+    if pool and pool["max_size"] < threads:
+        messages.append(
+            CheckWarning(
+                f"DB_POOL_MAX_SIZE={pool['max_size']} is below the {threads} gunicorn threads per worker.",
+                hint="Threads will wait for a connection; raise DB_POOL_MAX_SIZE to at least the thread count.",
+                id="config.W002",
+            ),
+        )
+    return messages
+
+
+@register("database")
+def check_connection_budget(**_kwargs: object) -> list[CheckMessage]:
+    """Compare the connections gunicorn can open with the server's limit."""
+    workers, threads = gunicorn_concurrency()
+    return connection_budget(
+        settings.DATABASES["default"],
+        workers,
+        threads,
+        settings.DATABASE_MAX_CONNECTIONS,
+    )
+
+
+def token_cache(alias: str | None, caches: dict) -> list[CheckMessage]:
+    """Warn if the token lookup cache names a process-local backend."""
+    if alias is None:
+        return []
+    if caches.get(alias, {}).get("BACKEND") != LOCMEM_BACKEND:
+        return []
+    return [
+        CheckWarning(
+            f"AUTH_TOKEN_CACHE_ALIAS={alias!r} is a locmem cache, so token lookups are not cached.",
+            hint="Evictions must reach every worker; point the alias at Redis or memcached, or set it to None.",
+            id="config.W003",
+        ),
+    ]
+
+
+@register("caches")
+def check_token_cache(**_kwargs: object) -> list[CheckMessage]:
+    """Check that CachedTokenAuthentication has a shared cache to use."""
+    return token_cache(settings.AUTH_TOKEN_CACHE_ALIAS, settings.CACHES)
@@ -0,0 +1,106 @@
+"""Environment driven database settings.
+
+``DATABASE_URL`` selects the backend (``postgres://``, ``mysql://`` or
+``sqlite:///``); without it the project keeps using ``db.sqlite3``.
+
+``DB_CONN_MAX_AGE`` (seconds, default 60) keeps connections open across
+requests. Under ASGI (``config.asgi`` sets ``DJANGO_ASGI``) it defaults to
+0: Django opens a connection per ``sync_to_async`` thread and cannot reuse
+them safely, so keep it 0 there. ``DB_CONN_HEALTH_CHECKS`` (default on)
+pings a reused connection before its first query in a request. On PostgreSQL with
+Django 5.1 or later, ``DB_POOL`` (default on) replaces persistent
+connections with psycopg's pool of ``DB_POOL_MIN_SIZE`` to
+``DB_POOL_MAX_SIZE`` connections per worker process.
+
+``DB_SQLITE_TUNED`` (default off) switches SQLite to
+``config.backends.sqlite3``: WAL, tuned pragmas and ``BEGIN IMMEDIATE``.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+import django
+from django.core.exceptions import ImproperlyConfigured
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from pathlib import Path
+
+ENGINES = {
+    "postgres": "django.db.backends.postgresql",
+    "postgresql": "django.db.backends.postgresql",
+    "pgsql": "django.db.backends.postgresql",
+    "mysql": "django.db.backends.mysql",
+    "sqlite": "django.db.backends.sqlite3",
+}
+POSTGRESQL = "django.db.backends.postgresql"
+TUNED_SQLITE = "config.backends.sqlite3"
+SQLITE_ENGINES = {ENGINES["sqlite"], TUNED_SQLITE}
+
+
+def env_bool(environ: Mapping[str, str], name: str, *, default: bool) -> bool:
+    """Read a boolean flag such as ``1``, ``true`` or ``off``."""
+    value = environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def parse_database_url(url: str) -> dict:
+    """Turn a ``DATABASE_URL`` into a ``DATABASES`` entry."""
+    parts = urlsplit(url)
+    engine = ENGINES.get(parts.scheme)
+    if engine is None:
+        msg = f"Unsupported DATABASE_URL scheme {parts.scheme!r}."
+        raise ImproperlyConfigured(msg)
+    if engine == ENGINES["sqlite"]:
+        # sqlite:///relative.db and sqlite:////absolute/path.db
+        return {"ENGINE": engine, "NAME": unquote(parts.path[1:]) or ":memory:"}
+    return {
+        "ENGINE": engine,
+        "NAME": unquote(parts.path.lstrip("/")),
+        "USER": unquote(parts.username or ""),
+        "PASSWORD": unquote(parts.password or ""),
+        "HOST": parts.hostname or "",
+        "PORT": str(parts.port or ""),
+        "OPTIONS": dict(parse_qsl(parts.query)),
+    }
+
+
+def database_from_env(environ: Mapping[str, str], base_dir: Path) -> dict:
+    """Return the ``default`` database settings for this environment."""
+    url = environ.get("DATABASE_URL")
+    config = (
+        parse_database_url(url)
+        if url
+        else {"ENGINE": ENGINES["sqlite"], "NAME": base_dir / "db.sqlite3"}
+    )
+    config.setdefault("OPTIONS", {})
+    asgi = env_bool(environ, "DJANGO_ASGI", default=False)
+    config["CONN_MAX_AGE"] = int(environ.get("DB_CONN_MAX_AGE", "0" if asgi else "60"))
+    config["CONN_HEALTH_CHECKS"] = env_bool(
+        environ,
+        "DB_CONN_HEALTH_CHECKS",
+        default=True,
+    )
+    if config["ENGINE"] == ENGINES["sqlite"] and env_bool(
+        environ,
+        "DB_SQLITE_TUNED",
+        default=False,
+    ):
+        config["ENGINE"] = TUNED_SQLITE
+    if (
+        config["ENGINE"] == POSTGRESQL
+        and django.VERSION >= (5, 1)
+        and env_bool(environ, "DB_POOL", default=True)
+    ):
+        config["OPTIONS"]["pool"] = {
+            "min_size": int(environ.get("DB_POOL_MIN_SIZE", "2")),
+            "max_size": int(environ.get("DB_POOL_MAX_SIZE", "4")),
+            "timeout": int(environ.get("DB_POOL_TIMEOUT", "10")),
+        }
+        # Django refuses persistent connections on top of a pool.
+        config["CONN_MAX_AGE"] = 0
+    return config
@@ -0,0 +1,322 @@
+"""Load generator that replays a traffic mix against a local server.
+
+A traffic mix is a JSON Lines file, one action per line::
+
+    {"name": "poll", "weight": 85, "path": "/api/reminder/", "think": 3}
+    {"name": "create", "weight": 10, "method": "POST", "path": "/api/reminder/",
+     "body": {"reminder_title": "Load {n}", "end_date_time": "{end_date_time}"},
+     "repeat": 5}
+
+Each simulated client repeatedly picks an action by ``weight``, sends it
+``repeat`` times back to back (a burst), then sleeps ``think`` seconds,
+jittered by half either way. Requests are token-authenticated unless
+``"auth": false``. Strings in ``path`` and ``body`` may use ``{username}``,
+``{password}``, ``{n}`` (a per-client counter) and ``{end_date_time}`` (a
+day from now).
+
+:func:`run_step` runs a number of clients for a fixed time and reports
+throughput and latency percentiles. Stepping the client count up, without
+think time, shows where throughput stops growing: that is the server's
+saturation point. Only loopback servers are accepted.
+"""
+
+from __future__ import annotations
+
+import datetime
+import http.client
+import ipaddress
+import json
+import random
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+from config.stats import percentile
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+PASSWORD = "load-Passw0rd-4-RemindMe"  # noqa: S105
+FIELDS = {"name", "weight", "method", "path", "body", "auth", "repeat", "think"}
+# Throughput growth below which a step counts as saturated.
+SATURATION_GAIN = 0.1
+HTTP_ERROR = 400
+
+
+class Action:
+    """One line of a traffic mix."""
+
+    __slots__ = ("name", "weight", "method", "path", "body", "auth", "repeat", "think")
+
+    def __init__(self: Action, spec: dict) -> None:
+        """Validate a parsed line."""
+        unknown = set(spec) - FIELDS
+        if unknown:
+            msg = f"unknown field(s) {', '.join(sorted(unknown))}"
+            raise ValueError(msg)
+        if "name" not in spec or "path" not in spec:
+            msg = "every action needs a name and a path"
+            raise ValueError(msg)
+        self.name: str = spec["name"]
+        self.path: str = spec["path"]
+        self.method: str = spec.get("method", "GET").upper()
+        self.body: object = spec.get("body")
+        self.auth: bool = spec.get("auth", True)
+        self.weight: float = spec.get("weight", 1)
+        self.repeat: int = spec.get("repeat", 1)
+        self.think: float = spec.get("think", 0)
+        if self.weight <= 0 or self.repeat < 1 or self.think < 0:
+            msg = f"{self.name}: weight must be positive, repeat at least 1, think not negative"
+            raise ValueError(msg)
+
+
+def load_mix(path: Path) -> list[Action]:
+    """Read a traffic mix, skipping blank lines."""
+    actions = []
+    for number, line in enumerate(path.read_text().splitlines(), 1):
+        if not line.strip():
+            continue
+        try:
+            actions.append(Action(json.loads(line)))
+        except ValueError as exc:
+            msg = f"{path}:{number}: {exc}"
+            raise ValueError(msg) from exc
+    if not actions:
+        msg = f"{path}: no actions"
+        raise ValueError(msg)
+    return actions
+
+
+def fill(template: object, values: dict[str, object]) -> object:
+    """Substitute ``{placeholders}`` in every string of a JSON value."""
+    if isinstance(template, str):
+        return template.format_map(values)
+    if isinstance(template, list):
+        return [fill(item, values) for item in template]
+    if isinstance(template, dict):
+        return {key: fill(item, values) for key, item in template.items()}
+    return template
+
+
+def check_local(url: str) -> tuple[str, int]:
+    """Return the host and port of ``url``; refuse anything but a loopback HTTP server."""
+    parts = urlsplit(url)
+    if parts.scheme != "http" or not parts.hostname:
+        msg = f"{url}: only http:// URLs are supported"
+        raise ValueError(msg)
+    port = parts.port or 80
+    addresses = {info[4][0] for info in socket.getaddrinfo(parts.hostname, port)}
+    if not all(ipaddress.ip_address(address).is_loopback for address in addresses):
+        msg = f"{parts.hostname} is not a loopback address; load tests only run locally"
+        raise ValueError(msg)
+    return parts.hostname, port
+
+
+class Connection:
+    """A keep-alive connection that reconnects when the server closes it."""
+
+    def __init__(self: Connection, host: str, port: int, timeout: float) -> None:
+        """Connect lazily on the first request."""
+        self.http = http.client.HTTPConnection(host, port, timeout=timeout)
+
+    def send(
+        self: Connection,
+        method: str,
+        path: str,
+        body: object = None,
+        token: str | None = None,
+    ) -> tuple[int, bytes]:
+        """Send one request and return its status and body; status 0 on a network error."""
+        headers = {"Content-Type": "application/json"}
+        if token is not None:
+            headers["Authorization"] = f"Token {token}"
+        data = None if body is None else json.dumps(body).encode()
+        try:
+            self.http.request(method, path, body=data, headers=headers)
+            response = self.http.getresponse()
+            return response.status, response.read()
+        except (OSError, http.client.HTTPException):
+            self.http.close()
+            return 0, b""
+
+    def close(self: Connection) -> None:
+        """Close the socket."""
+        self.http.close()
+
+
+def create_accounts(
+    host: str,
+    port: int,
+    count: int,
+    prefix: str,
+    timeout: float = 30,
+) -> list[tuple[str, str]]:
+    """Sign up and log in ``count`` users; return their usernames and tokens."""
+
+    def account(n: int) -> tuple[str, str]:
+        connection = Connection(host, port, timeout)
+        username = f"{prefix}-{n}"
+        credentials = {"username": username, "password": PASSWORD}
+        try:
+            connection.send("POST", "/auth/signup/", credentials)
+            status, body = connection.send("POST", "/auth/login/", credentials)
+        finally:
+            connection.close()
+        if status != http.client.OK:
+            msg = f"could not log {username} in: HTTP {status}"
+            raise RuntimeError(msg)
+        return username, json.loads(body)["data"]["token"]
+
+    # Signup and login hash a password each; a few at a time keeps setup
+    # short without saturating the server before the test starts.
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        return list(pool.map(account, range(count)))
+
+
+class Client(threading.Thread):
+    """One simulated client, recording per-action latencies until stopped."""
+
+    def __init__(  # noqa: PLR0913
+        self: Client,
+        connection: Connection,
+        actions: list[Action],
+        account: tuple[str, str],
+        stop: threading.Event,
+        *,
+        think: bool,
+    ) -> None:
+        """Prepare the client; :meth:`start` runs it."""
+        super().__init__(daemon=True)
+        self.connection = connection
+        self.actions = actions
+        self.weights = [action.weight for action in actions]
+        self.username, self.token = account
+        self.stop = stop
+        self.think = think
+        # Only this thread writes these, so recording takes no lock.
+        self.samples: dict[str, list[float]] = {action.name: [] for action in actions}
+        self.errors: dict[str, int] = dict.fromkeys(self.samples, 0)
+        self.rng = random.Random()  # noqa: S311
+
+    def run(self: Client) -> None:
+        """Send actions until the stop event is set."""
+        end = datetime.datetime.now(tz=datetime.timezone.utc) + datetime.timedelta(
+            days=1,
+        )
+        values = {
+            "username": self.username,
+            "password": PASSWORD,
+            "end_date_time": end.isoformat(),
+        }
+        n = 0
+        try:
+            while not self.stop.is_set():
+                action = self.rng.choices(self.actions, self.weights)[0]
+                for _ in range(action.repeat):
+                    n += 1
+                    values["n"] = n
+                    self.send(action, values)
+                    if self.stop.is_set():
+                        return
+                if self.think and action.think:
+                    self.stop.wait(action.think * self.rng.uniform(0.5, 1.5))
+        finally:
+            self.connection.close()
+
+    def send(self: Client, action: Action, values: dict[str, object]) -> None:
+        """Send one request of ``action`` and record it."""
+        start = time.perf_counter()
+        status, _body = self.connection.send(
+            action.method,
+            fill(action.path, values),
+            fill(action.body, values),
+            self.token if action.auth else None,
+        )
+        self.samples[action.name].append(time.perf_counter() - start)
+        if status == 0 or status >= HTTP_ERROR:
+            self.errors[action.name] += 1
+
+
+def summarise(samples: list[float], errors: int, elapsed: float) -> dict[str, float]:
+    """Summarise latencies in seconds as throughput and millisecond percentiles."""
+    samples.sort()
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "throughput_rps": round(len(samples) / elapsed, 2),
+        **{
+            f"p{point}_ms": round(percentile(samples, point) * 1000, 3)
+            for point in (50, 95, 99)
+        },
+    }
+
+
+def run_step(  # noqa: PLR0913
+    host: str,
+    port: int,
+    actions: list[Action],
+    accounts: list[tuple[str, str]],
+    clients: int,
+    duration: float,
+    *,
+    think: bool = True,
+    timeout: float = 30,
+) -> dict:
+    """Run ``clients`` clients for ``duration`` seconds and report the results."""
+    stop = threading.Event()
+    workers = [
+        Client(
+            Connection(host, port, timeout),
+            actions,
+            accounts[n % len(accounts)],
+            stop,
+            think=think,
+        )
+        for n in range(clients)
+    ]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    stop.wait(duration)
+    stop.set()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - started
+
+    by_action = {}
+    for action in actions:
+        by_action[action.name] = summarise(
+            [s for worker in workers for s in worker.samples[action.name]],
+            sum(worker.errors[action.name] for worker in workers),
+            elapsed,
+        )
+    overall = summarise(
+        [
+            s
+            for worker in workers
+            for samples in worker.samples.values()
+            for s in samples
+        ],
+        sum(sum(worker.errors.values()) for worker in workers),
+        elapsed,
+    )
+    return {"clients": clients, **overall, "actions": by_action}
+
+
+def saturation(steps: Iterable[dict]) -> dict | None:
+    """Return the first step after which more clients added under 10% throughput.
+
+    ``None`` if throughput kept growing, i.e. the server was not saturated.
+    """
+    previous = None
+    for step in steps:
+        if previous is not None and step["throughput_rps"] < previous[
+            "throughput_rps"
+        ] * (1 + SATURATION_GAIN):
+            return previous
+        previous = step
+    return None
@@ -0,0 +1 @@
+"""Project management commands."""
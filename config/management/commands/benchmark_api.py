@@ -0,0 +1,79 @@
+"""Benchmark the REST API against a throwaway database."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from django.core.management.base import BaseCommand
+from django.test.utils import setup_databases, teardown_databases
+
+from config.benchmark import SCENARIOS, run_suite
+
+if TYPE_CHECKING:
+    from argparse import ArgumentParser
+
+
+class Command(BaseCommand):
+    """Seed a test database, run the benchmark suite and write the results."""
+
+    help = (
+        "Seed a throwaway test database with bulk inserts, then measure"
+        " throughput and p50/p95/p99 latency of signup, login, list, create"
+        " and delete through the WSGI handler. Compare runs with"
+        " compare_benchmarks."
+    )
+
+    def add_arguments(self: Command, parser: ArgumentParser) -> None:
+        """Add command arguments."""
+        parser.add_argument("--users", type=int, default=100, help="Users seeded.")
+        parser.add_argument(
+            "--reminders",
+            type=int,
+            default=50,
+            help="Reminders seeded per user.",
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=200,
+            help="Requests timed per scenario.",
+        )
+        parser.add_argument(
+            "--output",
+            type=Path,
+            help="Write the JSON results here instead of to stdout.",
+        )
+
+    def handle(
+        self: Command,
+        *_args: str,
+        users: int,
+        reminders: int,
+        requests: int,
+        output: Path | None,
+        **_options: object,
+    ) -> None:
+        """Run the suite on a fresh test database and report it."""
+        # The same databases the test runner creates, so the real ones are
+        # never touched.
+        old_config = setup_databases(verbosity=0, interactive=False)
+        try:
+            results = run_suite(users, reminders, requests)
+        finally:
+            teardown_databases(old_config, verbosity=0)
+
+        for name in SCENARIOS:
+            result = results["results"][name]
+            self.stderr.write(
+                f"{name:>7}: {result['throughput_rps']:>9.2f} req/s"
+                f"  p50={result['p50_ms']}ms p95={result['p95_ms']}ms"
+                f" p99={result['p99_ms']}ms errors={result['errors']}",
+            )
+        text = json.dumps(results, indent=2) + "\n"
+        if output is None:
+            self.stdout.write(text, ending="")
+        else:
+            output.parent.mkdir(parents=True, exist_ok=True)
+            output.write_text(text)
@@ -0,0 +1,72 @@
+"""Compare two benchmark_api result files."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from django.core.management.base import BaseCommand, CommandError
+
+from config.benchmark import compare
+
+if TYPE_CHECKING:
+    from argparse import ArgumentParser
+
+# Metadata that has to match for the numbers to be comparable.
+COMPARABLE = (
+    "database",
+    "password_hasher",
+    "listing_cache",
+    "users",
+    "reminders_per_user",
+    "requests_per_scenario",
+    "warmup_per_scenario",
+    "machine",
+)
+
+
+class Command(BaseCommand):
+    """Flag scenarios slower than the baseline by more than a threshold."""
+
+    help = (
+        "Compare benchmark_api results with a baseline and exit non-zero if"
+        " any scenario's latency or throughput regressed beyond --threshold."
+    )
+
+    def add_arguments(self: Command, parser: ArgumentParser) -> None:
+        """Add command arguments."""
+        parser.add_argument("baseline", type=Path, help="Baseline results JSON.")
+        parser.add_argument("current", type=Path, help="Current results JSON.")
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=10.0,
+            help="Percent change tolerated before a metric counts as a regression.",
+        )
+
+    def handle(
+        self: Command,
+        *_args: str,
+        baseline: Path,
+        current: Path,
+        threshold: float,
+        **_options: object,
+    ) -> None:
+        """Print a regression per line, or confirm there are none."""
+        base = json.loads(baseline.read_text())
+        now = json.loads(current.read_text())
+        for key in COMPARABLE:
+            if base["meta"].get(key) != now["meta"].get(key):
+                self.stderr.write(
+                    f"warning: {key} differs: {base['meta'].get(key)!r}"
+                    f" vs {now['meta'].get(key)!r}",
+                )
+
+        regressions = compare(base, now, threshold / 100)
+        for line in regressions:
+            self.stdout.write(line)
+        if regressions:
+            msg = f"{len(regressions)} regression(s) beyond {threshold:g}%."
+            raise CommandError(msg)
+        self.stdout.write(f"No regressions beyond {threshold:g}%.")
@@ -0,0 +1,174 @@
+"""Replay a traffic mix against a local server and report saturation."""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from config.loadtest import (
+    check_local,
+    create_accounts,
+    load_mix,
+    run_step,
+    saturation,
+)
+
+if TYPE_CHECKING:
+    from argparse import ArgumentParser
+
+
+def client_counts(value: str) -> list[int]:
+    """Parse ``--clients`` as ascending comma-separated counts."""
+    counts = [int(part) for part in value.split(",")]
+    if any(count < 1 for count in counts) or counts != sorted(counts):
+        msg = "client counts must be positive and ascending"
+        raise ValueError(msg)
+    return counts
+
+
+class Command(BaseCommand):
+    """Drive a running gunicorn or ASGI server with simulated clients."""
+
+    help = (
+        "Replay a JSON Lines traffic mix against a server on localhost, at"
+        " each client count in --clients, and report throughput, tail"
+        " latency and where throughput stops growing. Start the server"
+        " first, e.g. gunicorn config.wsgi -w 4 -b 127.0.0.1:8000."
+    )
+
+    def add_arguments(self: Command, parser: ArgumentParser) -> None:
+        """Add command arguments."""
+        parser.add_argument(
+            "url",
+            nargs="?",
+            default="http://127.0.0.1:8000",
+            help="Base URL of the server; must resolve to a loopback address.",
+        )
+        parser.add_argument(
+            "--mix",
+            type=Path,
+            default=settings.BASE_DIR / "benchmarks" / "mobile_polling.jsonl",
+            help="Traffic mix, one JSON action per line.",
+        )
+        parser.add_argument(
+            "--clients",
+            type=client_counts,
+            default=[10, 25, 50, 100],
+            help="Comma-separated client counts, one step each.",
+        )
+        parser.add_argument(
+            "--duration",
+            type=float,
+            default=20.0,
+            help="Seconds per step.",
+        )
+        parser.add_argument(
+            "--users",
+            type=int,
+            help="Accounts shared by the clients; defaults to the largest client count.",
+        )
+        parser.add_argument(
+            "--no-think",
+            action="store_true",
+            help="Skip think time, so every client sends as fast as it can.",
+        )
+        parser.add_argument(
+            "--timeout",
+            type=float,
+            default=30.0,
+            help="Seconds before a request counts as failed.",
+        )
+        parser.add_argument(
+            "--output",
+            type=Path,
+            help="Also write the results as JSON here.",
+        )
+
+    def handle(  # noqa: PLR0913
+        self: Command,
+        *_args: str,
+        url: str,
+        mix: Path,
+        clients: list[int],
+        duration: float,
+        users: int | None,
+        no_think: bool,
+        timeout: float,
+        output: Path | None,
+        **_options: object,
+    ) -> None:
+        """Create the accounts, run every step and print the report."""
+        try:
+            host, port = check_local(url)
+            actions = load_mix(mix)
+        except (OSError, ValueError) as exc:
+            raise CommandError(exc) from exc
+
+        users = users or clients[-1]
+        self.stdout.write(f"Creating {users} account(s) on {url}...")
+        try:
+            accounts = create_accounts(
+                host,
+                port,
+                users,
+                prefix=f"load-{time.time_ns()}",
+                timeout=timeout,
+            )
+        except RuntimeError as exc:
+            raise CommandError(exc) from exc
+
+        steps = []
+        for count in clients:
+            step = run_step(
+                host,
+                port,
+                actions,
+                accounts,
+                count,
+                duration,
+                think=not no_think,
+                timeout=timeout,
+            )
+            steps.append(step)
+            self.stdout.write(
+                f"{count:>5} client(s): {step['throughput_rps']:>9.2f} req/s"
+                f"  p50={step['p50_ms']}ms p95={step['p95_ms']}ms"
+                f" p99={step['p99_ms']}ms errors={step['errors']}",
+            )
+            for name, result in step["actions"].items():
+                self.stdout.write(
+                    f"      {name:>12}: {result['requests']:>7} req"
+                    f"  p99={result['p99_ms']}ms errors={result['errors']}",
+                )
+
+        saturated = saturation(steps)
+        if saturated is None:
+            self.stdout.write(
+                "Throughput was still growing at the last step; add more clients"
+                " (and --no-think) to find the saturation point.",
+            )
+        else:
+            self.stdout.write(
+                f"Saturated at {saturated['clients']} client(s):"
+                f" {saturated['throughput_rps']} req/s, p99={saturated['p99_ms']}ms.",
+            )
+        if output is not None:
+            output.write_text(
+                json.dumps(
+                    {
+                        "url": url,
+                        "mix": str(mix),
+                        "think": not no_think,
+                        "duration": duration,
+                        "steps": steps,
+                        "saturation": saturated,
+                    },
+                    indent=2,
+                )
+                + "\n",
+            )
@@ -0,0 +1,26 @@
+"""Print an X-Profile header value that turns on profiling for a request."""
+
+from __future__ import annotations
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from config.profiling import make_token
+
+
+class Command(BaseCommand):
+    """Mint a signed profiling token."""
+
+    help = (
+        "Print a signed X-Profile header value. Requests to the reminder and"
+        " auth endpoints carrying it are profiled into PROFILING_DIR until it"
+        " expires after PROFILING_TOKEN_MAX_AGE seconds."
+    )
+
+    def handle(self: Command, *_args: str, **_options: object) -> None:
+        """Print the token and how long it lasts."""
+        self.stdout.write(make_token())
+        self.stderr.write(
+            f"valid for {settings.PROFILING_TOKEN_MAX_AGE}s; profiles are"
+            f" written to {settings.PROFILING_DIR}",
+        )
@@ -0,0 +1,411 @@
+"""Prometheus metrics for every request, served at ``/metrics``.
+
+:class:`MetricsMiddleware` records per-route latency, database query count
+and time, and response size histograms. The cache counters of
+:mod:`reminder.cache`, :mod:`auth.authentication` and :mod:`auth.hashing`,
+and the hashing pool's queue wait histogram, are read when the metrics are
+collected.
+
+Each thread writes to its own shard of :data:`store`, so recording takes no
+lock. A gunicorn worker only sees its own requests; with ``METRICS_DIR``
+set, every worker writes its totals to ``METRICS_DIR/<pid>.json`` at most
+every ``METRICS_FLUSH_INTERVAL`` seconds and ``/metrics`` sums the files of
+all workers. Empty the directory before the server starts, or the totals of
+the previous run carry over.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import json
+import os
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.http import HttpResponse
+
+from auth import authentication, hashing
+from reminder import cache as listing_cache
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from django.http import HttpRequest
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+HISTOGRAMS = {
+    "http_request_duration_seconds": (
+        "Time from the first middleware to the response, by route.",
+        DURATION_BUCKETS,
+    ),
+    "http_request_db_queries": (
+        "Database queries per request, by route.",
+        (0, 1, 2, 3, 5, 10, 25, 50, 100),
+    ),
+    "http_request_db_seconds": (
+        "Time spent in database queries per request, by route.",
+        (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1),
+    ),
+    "http_response_size_bytes": (
+        "Response body size, by route. Streaming responses are not counted.",
+        (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304),
+    ),
+    "auth_hashing_pool_wait_seconds": (
+        "Time password hashes queued before a pool worker picked them up.",
+        hashing.WAIT_BUCKETS,
+    ),
+}
+COUNTERS = {
+    "http_requests_total": "Requests by route, method and status.",
+    "reminder_listing_cache_hits_total": "Reminder listings served from cache.",
+    "reminder_listing_cache_misses_total": "Reminder listings not found in cache.",
+    "reminder_listing_cache_invalidations_total": "Reminder listing cache invalidations.",
+    "auth_token_cache_hits_total": "Token lookups served from cache.",
+    "auth_token_cache_misses_total": "Token lookups that hit the database.",
+    "auth_token_cache_evictions_total": "Tokens evicted from the cache.",
+    "auth_hashing_pool_submitted_total": "Password hashes queued on the pool.",
+    "auth_hashing_pool_rejected_total": "Password hashes shed with a 503.",
+    "auth_hashing_pool_completed_total": "Password hashes completed.",
+}
+# Hit ratios derived from the summed counters: (gauge, hits, misses).
+RATIOS = [
+    (
+        "reminder_listing_cache_hit_ratio",
+        "reminder_listing_cache_hits_total",
+        "reminder_listing_cache_misses_total",
+    ),
+    (
+        "auth_token_cache_hit_ratio",
+        "auth_token_cache_hits_total",
+        "auth_token_cache_misses_total",
+    ),
+]
+STATS = [
+    ("reminder_listing_cache_{}_total", listing_cache.stats),
+    ("auth_token_cache_{}_total", authentication.stats),
+    ("auth_hashing_pool_{}_total", hashing.stats),
+]
+# Histograms kept by their own module: (name, sample in MetricsStore layout).
+HISTOGRAM_STATS = [
+    ("auth_hashing_pool_wait_seconds", hashing.stats.wait_histogram),
+]
+
+# Samples are keyed by metric name and rendered label string.
+Key = tuple[str, str]
+
+
+def escape(value: str) -> str:
+    """Escape a label value for the text exposition format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def labels(**values: object) -> str:
+    """Render labels in the text exposition format, without braces."""
+    return ",".join(f'{name}="{escape(str(value))}"' for name, value in values.items())
+
+
+class MetricsStore:
+    """Counters and histograms sharded per thread.
+
+    A shard is only written by its own thread, so recording takes no lock;
+    the lock is held only to register a new thread's shard.
+    """
+
+    def __init__(self: MetricsStore) -> None:
+        """Start without shards."""
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self.reset()
+
+    def _shard(self: MetricsStore) -> dict[Key, list[float]]:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard: dict[Key, list[float]] = {}
+            with self._lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+            return shard
+
+    def inc(self: MetricsStore, name: str, label_str: str, amount: float = 1) -> None:
+        """Add ``amount`` to a counter."""
+        shard = self._shard()
+        key = (name, label_str)
+        if key in shard:
+            shard[key][0] += amount
+        else:
+            shard[key] = [amount]
+
+    def observe(self: MetricsStore, name: str, label_str: str, value: float) -> None:
+        """Record one observation in a histogram."""
+        shard = self._shard()
+        key = (name, label_str)
+        buckets = HISTOGRAMS[name][1]
+        # One count per bucket, then +Inf, then the sum.
+        sample = shard.get(key)
+        if sample is None:
+            sample = shard[key] = [0] * (len(buckets) + 2)
+        sample[bisect_left(buckets, value)] += 1
+        sample[-1] += value
+
+    def collect(self: MetricsStore) -> dict[Key, list[float]]:
+        """Return this process's samples, summed over every thread."""
+        with self._lock:
+            shards = list(self._shards)
+        totals: dict[Key, list[float]] = {}
+        for shard in shards:
+            # dict.copy is atomic under the GIL; the lists may still be
+            # mid-update, which only means one observation is early or late.
+            for key, sample in shard.copy().items():
+                merge_sample(totals, key, sample)
+        for template, source in STATS:
+            for counter, value in source.snapshot().items():
+                name = template.format(counter)
+                if name in COUNTERS:
+                    totals[(name, "")] = [value]
+        for name, source in HISTOGRAM_STATS:
+            totals[(name, "")] = source()
+        return totals
+
+    def flush(self: MetricsStore, directory: str) -> None:
+        """Write this process's samples to ``directory/<pid>.json``."""
+        rows = [
+            [name, label_str, sample]
+            for (name, label_str), sample in self.collect().items()
+        ]
+        path = Path(directory)
+        path.mkdir(parents=True, exist_ok=True)
+        # Written aside and renamed, so readers never see a partial file.
+        with tempfile.NamedTemporaryFile(
+            "w",
+            dir=path,
+            prefix=".",
+            suffix=".tmp",
+            delete=False,
+        ) as tmp:
+            json.dump(rows, tmp)
+        Path(tmp.name).replace(path / f"{os.getpid()}.json")
+        self._flushed = time.monotonic()
+
+    def maybe_flush(self: MetricsStore) -> None:
+        """Flush to ``METRICS_DIR`` if it is set and the interval has passed."""
+        directory = settings.METRICS_DIR
+        if (
+            directory is None
+            or time.monotonic() - self._flushed < settings.METRICS_FLUSH_INTERVAL
+        ):
+            return
+        # Another thread flushing already covers this request.
+        if self._flush_lock.acquire(blocking=False):
+            try:
+                self.flush(directory)
+            finally:
+                self._flush_lock.release()
+
+    def reset(self: MetricsStore) -> None:
+        """Drop every shard."""
+        with self._lock:
+            self._shards: list[dict[Key, list[float]]] = []
+            self._local = threading.local()
+        self._flushed = 0.0
+
+
+store = MetricsStore()
+
+
+def merge_sample(totals: dict[Key, list[float]], key: Key, sample: list[float]) -> None:
+    """Add ``sample`` into ``totals[key]`` element-wise."""
+    total = totals.get(key)
+    if total is None:
+        totals[key] = list(sample)
+    else:
+        for i, value in enumerate(sample):
+            total[i] += value
+
+
+def collect_all() -> dict[Key, list[float]]:
+    """Return the samples of every worker writing to ``METRICS_DIR``.
+
+    Without ``METRICS_DIR`` that is only this process.
+    """
+    directory = settings.METRICS_DIR
+    if directory is None:
+        return store.collect()
+    store.flush(directory)
+    totals: dict[Key, list[float]] = {}
+    for path in Path(directory).glob("*.json"):
+        try:
+            rows = json.loads(path.read_text())
+        except (OSError, ValueError):
+            continue
+        for name, label_str, sample in rows:
+            merge_sample(totals, (name, label_str), sample)
+    return totals
+
+
+def _series(name: str, label_str: str, value: float) -> str:
+    return f"{name}{{{label_str}}} {value:g}" if label_str else f"{name} {value:g}"
+
+
+def render(samples: dict[Key, list[float]]) -> str:
+    """Render samples in the Prometheus text exposition format."""
+    by_name: dict[str, list[tuple[str, list[float]]]] = {}
+    for (name, label_str), sample in sorted(samples.items()):
+        by_name.setdefault(name, []).append((label_str, sample))
+
+    lines = []
+    for name, (help_text, buckets) in HISTOGRAMS.items():
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+        for label_str, sample in by_name.get(name, ()):
+            sep = "," if label_str else ""
+            cumulative = 0
+            for bound, count in zip([*buckets, "+Inf"], sample[:-1]):
+                cumulative += count
+                bucket_labels = f'{label_str}{sep}le="{bound}"'
+                lines.append(_series(f"{name}_bucket", bucket_labels, cumulative))
+            lines.append(_series(f"{name}_sum", label_str, sample[-1]))
+            lines.append(_series(f"{name}_count", label_str, cumulative))
+    for name, help_text in COUNTERS.items():
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+        lines += [
+            _series(name, label_str, sample[0])
+            for label_str, sample in by_name.get(name, ())
+        ]
+    for name, hits_name, misses_name in RATIOS:
+        hits = samples.get((hits_name, ""), [0])[0]
+        misses = samples.get((misses_name, ""), [0])[0]
+        lines += [
+            f"# HELP {name} Share of lookups served from cache.",
+            f"# TYPE {name} gauge",
+            _series(name, "", hits / (hits + misses) if hits + misses else 0),
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def metrics_view(_request: HttpRequest) -> HttpResponse:
+    """Serve the metrics of every worker."""
+    return HttpResponse(render(collect_all()), content_type=CONTENT_TYPE)
+
+
+class QueryStats:
+    """Database queries run on behalf of the current request."""
+
+    __slots__ = ("count", "seconds")
+
+    def __init__(self: QueryStats) -> None:
+        """Start at zero."""
+        self.count = 0
+        self.seconds = 0.0
+
+
+# Context variables are copied into sync_to_async threads, so queries run
+# there are charged to the request too.
+request_queries: contextvars.ContextVar[QueryStats | None] = contextvars.ContextVar(
+    "request_queries",
+    default=None,
+)
+
+
+def record_query(
+    execute: Callable,
+    sql: str,
+    params: object,
+    many: bool,  # noqa: FBT001
+    context: dict,
+) -> object:
+    """Database execute wrapper that charges each query to the current request."""
+    current = request_queries.get()
+    if current is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        current.seconds += time.perf_counter() - start
+        current.count += 1
+
+
+def install_query_wrapper(connection: object, **_kwargs: object) -> None:
+    """``connection_created`` receiver that adds :func:`record_query` once."""
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+class MetricsMiddleware:
+    """Record latency, query and response size histograms per route.
+
+    Place it first, so the latency covers every other middleware.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(
+        self: MetricsMiddleware,
+        get_response: Callable[[HttpRequest], HttpResponse | Awaitable[HttpResponse]],
+    ) -> None:
+        """Wrap ``get_response``, async if it is."""
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self: MetricsMiddleware, request: HttpRequest) -> HttpResponse:
+        """Time the request and record its metrics."""
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        start = time.perf_counter()
+        queries = QueryStats()
+        token = request_queries.set(queries)
+        try:
+            response = self.get_response(request)
+        finally:
+            request_queries.reset(token)
+        record(request, response, queries, time.perf_counter() - start)
+        return response
+
+    async def __acall__(self: MetricsMiddleware, request: HttpRequest) -> HttpResponse:
+        """Async version of :meth:`__call__`."""
+        start = time.perf_counter()
+        queries = QueryStats()
+        token = request_queries.set(queries)
+        try:
+            response = await self.get_response(request)
+        finally:
+            request_queries.reset(token)
+        record(request, response, queries, time.perf_counter() - start)
+        return response
+
+
+def route_of(request: HttpRequest) -> str:
+    """Return the URL pattern a request matched, so ids do not become labels."""
+    match = getattr(request, "resolver_match", None)
+    return "/" + match.route if match is not None else "unmatched"
+
+
+def record(
+    request: HttpRequest,
+    response: HttpResponse,
+    queries: QueryStats,
+    duration: float,
+) -> None:
+    """Record the metrics of one finished request."""
+    name = route_of(request)
+    route = labels(route=name)
+    store.inc(
+        "http_requests_total",
+        labels(route=name, method=request.method, status=response.status_code),
+    )
+    store.observe("http_request_duration_seconds", route, duration)
+    store.observe("http_request_db_queries", route, queries.count)
+    store.observe("http_request_db_seconds", route, queries.seconds)
+    if not response.streaming:
+        store.observe("http_response_size_bytes", route, len(response.content))
+    store.maybe_flush()
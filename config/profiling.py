@@ -0,0 +1,224 @@
+"""Opt-in profiling of sampled reminder and auth requests.
+
+A request under one of ``PROFILING_PATH_PREFIXES`` is profiled when
+``PROFILING_ENABLED`` is on and it falls in the ``PROFILING_SAMPLE_RATE``
+sample, or whenever it carries a valid ``X-Profile`` header minted by
+``manage.py profile_token``. Each profile is a cProfile dump,
+``<id>.prof``, and ``<id>.json`` with the request and every SQL query it
+ran. The id is returned in the ``X-Profile-Id`` response header. Only the
+newest ``PROFILING_MAX_PROFILES`` are kept in ``PROFILING_DIR``.
+
+Under ASGI the profile covers the event loop thread, so it misses work done
+in ``sync_to_async`` threads and may include other requests interleaved on
+the loop; the SQL log is exact either way.
+
+One request per process is profiled at a time; others picked meanwhile
+run unprofiled. Requests that are not picked cost a path check and a
+header lookup.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import cProfile
+import datetime
+import json
+import logging
+import random
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core import signing
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from django.http import HttpRequest, HttpResponse
+
+logger = logging.getLogger(__name__)
+
+HEADER = "HTTP_X_PROFILE"
+SALT = "config.profiling"
+TOKEN_VALUE = "profile"  # noqa: S105
+
+# Held while a request is profiled. Two profilers on one thread, as with
+# concurrent requests on an event loop, would corrupt each other.
+_active = threading.Lock()
+
+
+def make_token() -> str:
+    """Return a value for the ``X-Profile`` header, valid for ``PROFILING_TOKEN_MAX_AGE``."""
+    return signing.TimestampSigner(salt=SALT).sign(TOKEN_VALUE)
+
+
+def token_is_valid(token: str) -> bool:
+    """Check an ``X-Profile`` header value."""
+    try:
+        value = signing.TimestampSigner(salt=SALT).unsign(
+            token,
+            max_age=settings.PROFILING_TOKEN_MAX_AGE,
+        )
+    except signing.BadSignature:
+        return False
+    return value == TOKEN_VALUE
+
+
+def should_profile(request: HttpRequest) -> bool:
+    """Decide whether to profile a request."""
+    if not request.path_info.startswith(settings.PROFILING_PATH_PREFIXES):
+        return False
+    token = request.META.get(HEADER)
+    if token is not None:
+        return token_is_valid(token)
+    return (
+        settings.PROFILING_ENABLED
+        and random.random() < settings.PROFILING_SAMPLE_RATE  # noqa: S311
+    )
+
+
+# The SQL log of the request being profiled. Context variables are copied
+# into sync_to_async threads, so their queries are logged too.
+request_sql: contextvars.ContextVar[list[dict] | None] = contextvars.ContextVar(
+    "request_sql",
+    default=None,
+)
+
+
+def log_query(
+    execute: Callable,
+    sql: str,
+    params: object,
+    many: bool,  # noqa: FBT001
+    context: dict,
+) -> object:
+    """Database execute wrapper that logs queries of profiled requests."""
+    log = request_sql.get()
+    if log is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        # Parameters are left out: they include tokens and password hashes.
+        log.append(
+            {
+                "sql": sql,
+                "many": many,
+                "seconds": round(time.perf_counter() - start, 6),
+            },
+        )
+
+
+def install_query_logger(connection: object, **_kwargs: object) -> None:
+    """``connection_created`` receiver that adds :func:`log_query` once."""
+    if log_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(log_query)
+
+
+class Capture:
+    """One profiled request: the profiler, its SQL log and the timings."""
+
+    def __init__(self: Capture, request: HttpRequest) -> None:
+        """Start profiling and logging SQL."""
+        self.request = request
+        now = datetime.datetime.now(tz=datetime.timezone.utc)
+        self.profile_id = f"{now:%Y%m%dT%H%M%S%f}-{uuid.uuid4().hex[:8]}"
+        self.sql: list[dict] = []
+        self._token = request_sql.set(self.sql)
+        self.profiler = cProfile.Profile()
+        self.start = time.perf_counter()
+        self.profiler.enable()
+
+    def finish(self: Capture, response: HttpResponse | None) -> None:
+        """Stop profiling, write the profile and tag the response with its id."""
+        self.profiler.disable()
+        duration = time.perf_counter() - self.start
+        request_sql.reset(self._token)
+        _active.release()
+        try:
+            self.write(response, duration)
+        except OSError:
+            logger.exception("Could not write profile %s", self.profile_id)
+            return
+        if response is not None:
+            response["X-Profile-Id"] = self.profile_id
+
+    def write(self: Capture, response: HttpResponse | None, duration: float) -> None:
+        """Write ``<id>.prof`` and ``<id>.json``, then drop the oldest profiles."""
+        directory = Path(settings.PROFILING_DIR)
+        directory.mkdir(parents=True, exist_ok=True)
+        self.profiler.dump_stats(directory / f"{self.profile_id}.prof")
+        summary = {
+            "id": self.profile_id,
+            "method": self.request.method,
+            "path": self.request.get_full_path(),
+            "user_id": getattr(getattr(self.request, "user", None), "id", None),
+            "status": None if response is None else response.status_code,
+            "seconds": round(duration, 6),
+            "sql_count": len(self.sql),
+            "sql_seconds": round(sum(query["seconds"] for query in self.sql), 6),
+            "sql": self.sql,
+        }
+        (directory / f"{self.profile_id}.json").write_text(
+            json.dumps(summary, indent=2),
+        )
+        rotate(directory, settings.PROFILING_MAX_PROFILES)
+
+
+def rotate(directory: Path, keep: int) -> None:
+    """Delete all but the newest ``keep`` profiles in ``directory``."""
+    # Ids start with a timestamp, so they sort oldest first.
+    profiles = sorted(directory.glob("*.prof"))
+    for path in profiles[: max(0, len(profiles) - keep)]:
+        path.unlink(missing_ok=True)
+        path.with_suffix(".json").unlink(missing_ok=True)
+
+
+class ProfilingMiddleware:
+    """Profile the requests :func:`should_profile` picks."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(
+        self: ProfilingMiddleware,
+        get_response: Callable[[HttpRequest], HttpResponse | Awaitable[HttpResponse]],
+    ) -> None:
+        """Wrap ``get_response``, async if it is."""
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self: ProfilingMiddleware, request: HttpRequest) -> HttpResponse:
+        """Profile the request if it is picked."""
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not should_profile(request) or not _active.acquire(blocking=False):
+            return self.get_response(request)
+        capture = Capture(request)
+        response = None
+        try:
+            response = self.get_response(request)
+        finally:
+            capture.finish(response)
+        return response
+
+    async def __acall__(
+        self: ProfilingMiddleware,
+        request: HttpRequest,
+    ) -> HttpResponse:
+        """Async version of :meth:`__call__`."""
+        if not should_profile(request) or not _active.acquire(blocking=False):
+            return await self.get_response(request)
+        capture = Capture(request)
+        response = None
+        try:
+            response = await self.get_response(request)
+        finally:
+            capture.finish(response)
+        return response
@@ -0,0 +1,160 @@
+"""Per-view database query budgets.
+
+Decorate a view handler with :func:`query_budget` to declare the most
+queries one request to it may run, counted from the first middleware to the
+response; queries a streaming response runs while streaming are not
+counted. :class:`QueryBudgetMiddleware` checks every request against its
+budget and, per ``QUERY_BUDGET_ACTION``, logs a warning (the default) or
+raises :class:`QueryBudgetExceeded`, which the test runner
+(``config.runner.TestRunner``) turns on so any test that goes over fails.
+
+A budget is a number, or a callable taking the request and the response for
+handlers whose queries grow with the input, such as batched inserts.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from typing import TYPE_CHECKING, TypeVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections, router
+
+from config.metrics import QueryStats, request_queries
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from django.db.models import Model
+    from django.http import HttpRequest, HttpResponse
+
+    Budget = int | Callable[[HttpRequest, HttpResponse], int]
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound="Callable")
+
+
+class QueryBudgetExceeded(Exception):  # noqa: N818
+    """A request ran more queries than its view's budget."""
+
+
+def query_budget(limit: Budget) -> Callable[[F], F]:
+    """Declare the most queries one request to the decorated handler may run."""
+
+    def decorate(handler: F) -> F:
+        handler.query_budget = limit
+        return handler
+
+    return decorate
+
+
+def batches(items: int, batch_size: int) -> int:
+    """Return how many batches of ``batch_size`` hold ``items``."""
+    return math.ceil(items / batch_size)
+
+
+def insert_batches(model: type[Model], items: int, batch_size: int) -> int:
+    """Return how many INSERTs ``bulk_create(batch_size=batch_size)`` runs.
+
+    The backend splits batches further when their rows would take more query
+    parameters than it allows, such as 999 on SQLite.
+    """
+    connection = connections[router.db_for_write(model)]
+    fields = model._meta.concrete_fields  # noqa: SLF001
+    limit = max(connection.ops.bulk_batch_size(fields, []), 1)
+    return batches(items, min(batch_size, limit))
+
+
+def view_handler(request: HttpRequest) -> Callable | None:
+    """Return the function that handled ``request``: a view method, or a function view."""
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return None
+    view_class = getattr(match.func, "view_class", None)
+    if view_class is None:
+        return match.func
+    return getattr(view_class, request.method.lower(), None)
+
+
+def budget_for(request: HttpRequest, response: HttpResponse) -> int | None:
+    """Return the query budget of the request's view, or ``None`` if it has none."""
+    budget = getattr(view_handler(request), "query_budget", None)
+    if callable(budget):
+        return budget(request, response)
+    return budget
+
+
+def check(request: HttpRequest, response: HttpResponse, queries: QueryStats) -> None:
+    """Warn or raise, per ``QUERY_BUDGET_ACTION``, if ``queries`` is over budget."""
+    action = settings.QUERY_BUDGET_ACTION
+    if action is None:
+        return
+    budget = budget_for(request, response)
+    if budget is None or queries.count <= budget:
+        return
+    handler = view_handler(request)
+    msg = (
+        f"{request.method} {request.path} ran {queries.count} queries,"
+        f" over the budget of {budget} set on {handler.__qualname__}."
+    )
+    if action == "raise":
+        raise QueryBudgetExceeded(msg)
+    logger.warning(msg)
+
+
+class QueryBudgetMiddleware:
+    """Hold every request to its view's query budget.
+
+    Place it after ``config.metrics.MetricsMiddleware`` to share its query
+    count; on its own it counts queries itself.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(
+        self: QueryBudgetMiddleware,
+        get_response: Callable[[HttpRequest], HttpResponse | Awaitable[HttpResponse]],
+    ) -> None:
+        """Wrap ``get_response``, async if it is."""
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self: QueryBudgetMiddleware, request: HttpRequest) -> HttpResponse:
+        """Check the request's queries once it has a response."""
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        queries = request_queries.get()
+        token = None
+        if queries is None:
+            queries = QueryStats()
+            token = request_queries.set(queries)
+        try:
+            response = self.get_response(request)
+        finally:
+            if token is not None:
+                request_queries.reset(token)
+        check(request, response, queries)
+        return response
+
+    async def __acall__(
+        self: QueryBudgetMiddleware,
+        request: HttpRequest,
+    ) -> HttpResponse:
+        """Async version of :meth:`__call__`."""
+        queries = request_queries.get()
+        token = None
+        if queries is None:
+            queries = QueryStats()
+            token = request_queries.set(queries)
+        try:
+            response = await self.get_response(request)
+        finally:
+            if token is not None:
+                request_queries.reset(token)
+        check(request, response, queries)
+        return response
@@ -0,0 +1,25 @@
+"""Test runner."""
+
+from __future__ import annotations
+
+from django.test.runner import DiscoverRunner
+from django.test.utils import override_settings
+
+
+class TestRunner(DiscoverRunner):
+    """Run the tests with query budgets enforced.
+
+    Any request over its view's budget raises
+    ``config.querybudget.QueryBudgetExceeded`` and fails its test.
+    """
+
+    def setup_test_environment(self: TestRunner, **kwargs: object) -> None:
+        """Turn on ``QUERY_BUDGET_ACTION = "raise"``."""
+        super().setup_test_environment(**kwargs)
+        self.budgets = override_settings(QUERY_BUDGET_ACTION="raise")
+        self.budgets.enable()
+
+    def teardown_test_environment(self: TestRunner, **kwargs: object) -> None:
+        """Restore ``QUERY_BUDGET_ACTION``."""
+        self.budgets.disable()
+        super().teardown_test_environment(**kwargs)
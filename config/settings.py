@@ -9,8 +9,11 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.0/ref/settings/
 """
 
+import os
 from pathlib import Path
 
+from config.database import database_from_env
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -44,9 +47,14 @@ INSTALLED_APPS = [
     "corsheaders",
     "rest_framework.authtoken",
     "drf_standardized_errors",
+    "auth.apps.AuthConfig",
+    "config.apps.ProjectConfig",
 ]
 
 MIDDLEWARE = [
+    "config.metrics.MetricsMiddleware",
+    "config.profiling.ProfilingMiddleware",
+    "config.querybudget.QueryBudgetMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
@@ -57,7 +65,8 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
-ROOT_URLCONF = "config.urls"
+# config/asgi.py switches to config.asgi_urls, which serves the async views.
+ROOT_URLCONF = os.environ.get("DJANGO_ROOT_URLCONF", "config.urls")
 
 TEMPLATES = [
     {
@@ -80,14 +89,16 @@ WSGI_APPLICATION = "config.wsgi.application"
 
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
+# Configured from DATABASE_URL and the DB_* variables, see config/database.py.
 
 DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
-    },
+    "default": database_from_env(os.environ, BASE_DIR),
 }
 
+# Connection limit of the database server, checked against the gunicorn
+# worker count at startup (config.checks).
+DATABASE_MAX_CONNECTIONS = int(os.environ.get("DB_MAX_CONNECTIONS", "100"))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
@@ -134,7 +145,7 @@ REST_FRAMEWORK = {
     # YOUR SETTINGS
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework.authentication.TokenAuthentication",  # Add this line
+        "auth.authentication.CachedTokenAuthentication",
     ],
     "EXCEPTION_HANDLER": "drf_standardized_errors.handler.exception_handler",
 }
@@ -171,3 +182,112 @@ DRF_STANDARDIZED_ERRORS = {"ENABLE_IN_DEBUG_FOR_UNHANDLED_EXCEPTIONS": True}
 STATIC_URL = "static/"
 STATICFILES_DIRS = [BASE_DIR / "static"]
 STATIC_ROOT = BASE_DIR / "staticfiles"
+
+# Reminder listing pagination (opt-in with ?page_size= or ?cursor=)
+REMINDER_PAGE_SIZE = 50
+REMINDER_MAX_PAGE_SIZE = 500
+
+# GET /api/reminder/occurrences/ expands recurring reminders in a window
+REMINDER_OCCURRENCE_MAX_WINDOW = 366  # days
+REMINDER_OCCURRENCE_LIMIT = 1000  # occurrences per response
+
+# GET /api/reminder/search/; None picks FTS5 on SQLite, icontains elsewhere
+REMINDER_SEARCH_BACKEND = None
+REMINDER_SEARCH_LIMIT = 50  # results per response unless ?limit= is given
+
+# Due-reminder dispatcher (manage.py run_dispatcher)
+REMINDER_DISPATCH_BACKENDS = [
+    {"BACKEND": "reminder.dispatch.backends.LogBackend"},
+]
+REMINDER_DISPATCH_WINDOW = 60  # seconds of look-ahead held in memory
+REMINDER_DISPATCH_BATCH_SIZE = 500
+REMINDER_DISPATCH_MAX_QUEUE = 100_000
+REMINDER_DISPATCH_RESCAN_INTERVAL = 10  # seconds
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "reminder.dispatch": {"handlers": ["console"], "level": "INFO"},
+    },
+}
+
+# Server-sent events feed GET /api/reminder/feed/ (ASGI only)
+REMINDER_FEED_MAX_PER_USER = 5  # open streams per user
+REMINDER_FEED_QUEUE_SIZE = 100  # undelivered events per stream before a resync
+REMINDER_FEED_POLL_INTERVAL = 1.0  # seconds between due and change checks
+REMINDER_FEED_KEEPALIVE = 15  # seconds of silence before a keep-alive comment
+REMINDER_FEED_MAX_AGE = 300  # seconds before a stream ends and the client reconnects
+REMINDER_FEED_RETRY = 3  # seconds clients wait before reconnecting
+
+# Bulk reminder creation (POST a JSON array to /api/reminder/)
+REMINDER_BULK_BATCH_SIZE = 500
+REMINDER_BULK_MAX_ITEMS = 5000
+
+# Rows fetched and encoded per chunk by GET /api/reminder/export/
+REMINDER_EXPORT_CHUNK_SIZE = 2000
+
+# Bulk import (manage.py import_reminders and POST /api/reminder/import/)
+REMINDER_IMPORT_BATCH_SIZE = 5000  # records per commit and checkpoint
+REMINDER_IMPORT_MAX_ERRORS = 100  # invalid rows reported in detail
+
+# Archival of expired reminders (manage.py archive_reminders)
+REMINDER_ARCHIVE_RETENTION = 7 * 24 * 3600  # seconds past end_date_time
+REMINDER_ARCHIVE_BATCH_SIZE = 500
+REMINDER_ARCHIVE_PURGE_AFTER = None  # seconds archived before deletion; None keeps them
+
+# Local memory by default; point "default" at Redis or Memcached to share
+# cached listings between workers.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+}
+
+# Prometheus metrics at /metrics (config.metrics). Set METRICS_DIR to a
+# directory shared by the gunicorn workers, emptied at each start, so the
+# endpoint reports every worker and not just the one that served it.
+METRICS_DIR = os.environ.get("METRICS_DIR")
+METRICS_FLUSH_INTERVAL = 5  # seconds between a worker's writes to METRICS_DIR
+
+# Per-view query budgets (config.querybudget): "warn" logs requests over
+# budget, "raise" fails them (the test runner's choice), None skips checks.
+QUERY_BUDGET_ACTION = "warn"
+TEST_RUNNER = "config.runner.TestRunner"
+
+# Request profiling (config.profiling). Requests with an X-Profile header
+# from `manage.py profile_token` are always profiled; PROFILING_ENABLED
+# samples the rest.
+PROFILING_ENABLED = os.environ.get("PROFILING_ENABLED", "").lower() in {"1", "true"}
+PROFILING_SAMPLE_RATE = 0.01  # share of requests profiled when enabled
+PROFILING_PATH_PREFIXES = ("/api/reminder/", "/auth/")
+PROFILING_DIR = os.environ.get("PROFILING_DIR", BASE_DIR / "profiles")
+PROFILING_MAX_PROFILES = 200  # newest profiles kept in PROFILING_DIR
+PROFILING_TOKEN_MAX_AGE = 3600  # seconds an X-Profile header stays valid
+
+# Per-user cache of serialized GET /api/reminder/ responses. Entries are
+# checked against the listing ETag, so any cache backend is safe.
+REMINDER_LISTING_CACHE_ENABLED = True
+REMINDER_LISTING_CACHE_ALIAS = "default"
+REMINDER_LISTING_CACHE_TIMEOUT = 300  # seconds
+
+# Token -> user lookup cache used by CachedTokenAuthentication. Evictions
+# only reach the workers sharing the cache, so it needs a shared backend:
+# add a Redis or memcached alias to CACHES and name it here. None, or a
+# locmem alias (config.W003), looks every token up in the database.
+AUTH_TOKEN_CACHE_ALIAS = None
+AUTH_TOKEN_CACHE_TIMEOUT = 60  # seconds
+
+# Password hashing runs on a bounded thread pool. Requests that find
+# AUTH_HASHING_POOL_WORKERS busy and AUTH_HASHING_POOL_MAX_QUEUE waiting
+# get a 503 instead of queueing.
+AUTH_HASHING_POOL_WORKERS = 2
+AUTH_HASHING_POOL_MAX_QUEUE = 16
+
+# PASSWORD_HASHER_PROFILE=fast trades hash strength for speed. Use it for
+# test runs only, never in production.
+if os.environ.get("PASSWORD_HASHER_PROFILE") == "fast":
+    PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
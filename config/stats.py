@@ -0,0 +1,37 @@
+"""Summary statistics shared by the benchmarks and runtime counters."""
+
+from __future__ import annotations
+
+import math
+import threading
+
+
+def percentile(ordered: list[float], point: float) -> float:
+    """Return the nearest-rank percentile of an ascending list, 0.0 if empty."""
+    if not ordered:
+        return 0.0
+    return ordered[max(0, math.ceil(point / 100 * len(ordered)) - 1)]
+
+
+class Counters:
+    """Process-local named counters, safe to increment from any thread."""
+
+    def __init__(self: Counters, *names: str) -> None:
+        """Start each of ``names`` at zero."""
+        self._lock = threading.Lock()
+        self._names = names
+        self.reset()
+
+    def incr(self: Counters, counter: str, amount: int = 1) -> None:
+        """Increment one counter."""
+        with self._lock:
+            self._counts[counter] += amount
+
+    def snapshot(self: Counters) -> dict[str, float]:
+        """Return the current counters."""
+        with self._lock:
+            return dict(self._counts)
+
+    def reset(self: Counters) -> None:
+        """Zero every counter."""
+        self._counts = dict.fromkeys(self._names, 0)
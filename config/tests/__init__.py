@@ -0,0 +1 @@
+"""Tests for project configuration."""
@@ -0,0 +1,81 @@
+"""Persistent connection benchmark.
+
+Not collected by the default test run. Execute with::
+
+    python manage.py test config.tests.bench_database
+
+Replays the connection handling Django does around each request
+(``close_if_unusable_or_obsolete`` on request start and finish) plus one
+query, on a scratch SQLite file, with ``CONN_MAX_AGE`` 0 and 60. The test
+database is in memory and never really closes, so it cannot show this.
+"""
+from __future__ import annotations
+
+import tempfile
+import time
+from pathlib import Path
+
+from django.db.backends.signals import connection_created
+from django.db.utils import ConnectionHandler
+from django.test import SimpleTestCase
+
+from config.database import database_from_env
+
+REQUESTS = 5000
+
+
+class BenchPersistentConnections(SimpleTestCase):
+    """Per-request connection overhead with and without CONN_MAX_AGE."""
+
+    def setUp(self: BenchPersistentConnections) -> None:
+        """Testcase setup."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.url = f"sqlite:///{Path(self.tmp.name) / 'bench.sqlite3'}"
+
+    def replay(self: BenchPersistentConnections, max_age: str) -> tuple[float, int]:
+        """Return ``(seconds, connections opened)`` for ``REQUESTS`` requests."""
+        handler = ConnectionHandler(
+            {
+                "default": database_from_env(
+                    {"DATABASE_URL": self.url, "DB_CONN_MAX_AGE": max_age},
+                    Path(self.tmp.name),
+                ),
+            },
+        )
+        connection = handler["default"]
+        opened = []
+
+        def count(
+            sender: object,  # noqa: ARG001
+            connection: object,
+            **_kwargs: object,
+        ) -> None:
+            opened.append(connection)
+
+        connection_created.connect(count)
+        try:
+            start = time.perf_counter()
+            for _ in range(REQUESTS):
+                connection.close_if_unusable_or_obsolete()
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+                connection.close_if_unusable_or_obsolete()
+            elapsed = time.perf_counter() - start
+        finally:
+            connection_created.disconnect(count)
+            connection.close()
+        return elapsed, len(opened)
+
+    def test_conn_max_age(self: BenchPersistentConnections) -> None:
+        """Time both settings."""
+        fresh, fresh_opened = self.replay("0")
+        kept, kept_opened = self.replay("60")
+        print(  # noqa: T201
+            f"\n{REQUESTS} requests on SQLite: CONN_MAX_AGE=0 {fresh * 1e6 / REQUESTS:.1f}us/request"
+            f" ({fresh_opened} connects), CONN_MAX_AGE=60 {kept * 1e6 / REQUESTS:.1f}us/request"
+            f" ({kept_opened} connect), {fresh / kept:.1f}x",
+        )
+        self.assertEqual(fresh_opened, REQUESTS)
+        self.assertEqual(kept_opened, 1)
+        self.assertLess(kept, fresh)
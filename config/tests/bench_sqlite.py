@@ -0,0 +1,111 @@
+"""Multi-process SQLite write benchmark.
+
+Not collected by the default test run. Execute with::
+
+    python manage.py test config.tests.bench_sqlite
+
+``PROCESSES`` worker processes, standing in for gunicorn workers, each
+create ``WRITES`` reminders on one scratch SQLite file. Every write reads
+then inserts inside ``transaction.atomic``, as a validated create does. The
+run is repeated with the stock backend and with ``DB_SQLITE_TUNED=1``, and
+compares throughput and "database is locked" errors.
+"""
+from __future__ import annotations
+
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.test import SimpleTestCase
+
+PROCESSES = 8
+WRITES = 200
+
+
+def write_reminders(env: dict[str, str], start: float) -> tuple[int, int]:
+    """Create ``WRITES`` reminders in a fresh process; return ``(ok, locked)``."""
+    os.environ.update(env)
+    import django
+
+    django.setup()
+    from django.contrib.auth.models import User
+    from django.db import OperationalError, transaction
+
+    from reminder.models import Reminder
+
+    user = User.objects.get(username="bench-user")
+    time.sleep(max(0, start - time.time()))
+    ok = locked = 0
+    for i in range(WRITES):
+        try:
+            with transaction.atomic():
+                Reminder.objects.filter(user=user).exists()
+                Reminder.objects.create(
+                    user=user,
+                    reminder_title=f"Bench {i}",
+                    end_date_time="2054-04-11T22:15:13Z",
+                )
+            ok += 1
+        except OperationalError:  # noqa: PERF203
+            locked += 1
+    return ok, locked
+
+
+class BenchTunedSQLite(SimpleTestCase):
+    """Stock against tuned SQLite under concurrent writers."""
+
+    def run_profile(
+        self: BenchTunedSQLite,
+        tuned: bool,  # noqa: FBT001
+    ) -> tuple[float, int, int]:
+        """Return ``(writes/s, ok, locked)`` for one backend."""
+        with tempfile.TemporaryDirectory() as tmp:
+            env = {
+                "DJANGO_SETTINGS_MODULE": "config.settings",
+                "DATABASE_URL": f"sqlite:///{Path(tmp) / 'bench.sqlite3'}",
+                "DB_SQLITE_TUNED": "1" if tuned else "0",
+            }
+            for command in [
+                ["migrate", "-v", "0"],
+                [
+                    "shell",
+                    "-c",
+                    "from django.contrib.auth.models import User; User.objects.create(username='bench-user')",
+                ],
+            ]:
+                subprocess.run(
+                    [sys.executable, "manage.py", *command],  # noqa: S603
+                    cwd=settings.BASE_DIR,
+                    env={**os.environ, **env},
+                    check=True,
+                    capture_output=True,
+                )
+            context = multiprocessing.get_context("spawn")
+            with context.Pool(PROCESSES) as pool:
+                begin = time.time() + 2  # lets every process finish django.setup()
+                results = pool.starmap(write_reminders, [(env, begin)] * PROCESSES)
+                elapsed = time.time() - begin
+        ok = sum(result[0] for result in results)
+        locked = sum(result[1] for result in results)
+        return ok / elapsed, ok, locked
+
+    def test_concurrent_writers(self: BenchTunedSQLite) -> None:
+        """Run both profiles and compare."""
+        lines = [f"\n{PROCESSES} processes x {WRITES} read-then-insert transactions:"]
+        rates = {}
+        for tuned in [False, True]:
+            rate, ok, locked = self.run_profile(tuned)
+            rates[tuned] = rate
+            name = "tuned" if tuned else "stock"
+            lines.append(
+                f"  {name}: {rate:,.0f} writes/s, {ok} committed, {locked} 'database is locked'",
+            )
+        print("\n".join(lines))  # noqa: T201
+        self.assertEqual(locked, 0)
+        self.assertEqual(ok, PROCESSES * WRITES)
+        self.assertGreater(rates[True], rates[False])
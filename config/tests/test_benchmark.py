@@ -0,0 +1,121 @@
+"""Benchmark suite test module."""
+from __future__ import annotations
+
+import copy
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.contrib.auth.models import User
+from django.core.management import CommandError, call_command
+from django.core.signals import request_finished, request_started
+from django.db import close_old_connections
+from django.test import TestCase
+
+from config.benchmark import SCENARIOS, compare, run_suite, seed
+from reminder.models import Reminder
+
+
+class TestBenchmark(TestCase):
+    """run_suite, compare and compare_benchmarks tests."""
+
+    def setUp(self: TestBenchmark) -> None:
+        """Testcase setup."""
+        # As in Django's test client: closing the connection at the end of a
+        # request would break the test transaction.
+        for signal in (request_started, request_finished):
+            signal.disconnect(close_old_connections)
+            self.addCleanup(signal.connect, close_old_connections)
+
+    def test_seed(self: TestBenchmark) -> None:
+        """Users get a token and the requested reminders."""
+        seeded = seed(3, 4)
+        self.assertEqual(len(seeded), 3)
+        self.assertEqual(User.objects.filter(auth_token__isnull=False).count(), 3)
+        self.assertEqual(Reminder.objects.count(), 12)
+
+    def test_run_suite(self: TestBenchmark) -> None:
+        """Every scenario succeeds and reports latency and throughput."""
+        results = run_suite(users=2, reminders=3, requests=4)
+        self.assertEqual(list(results["results"]), list(SCENARIOS))
+        for name, result in results["results"].items():
+            self.assertEqual(result["requests"], 4, name)
+            self.assertEqual(result["errors"], 0, name)
+            self.assertGreater(result["throughput_rps"], 0, name)
+            self.assertLessEqual(result["p50_ms"], result["p95_ms"], name)
+            self.assertLessEqual(result["p95_ms"], result["p99_ms"], name)
+        # Every reminder the create scenario made was deleted again.
+        self.assertEqual(Reminder.objects.count(), 6)
+        self.assertEqual(results["meta"]["users"], 2)
+
+    def test_compare(self: TestBenchmark) -> None:
+        """Slower latency, lower throughput and new errors are regressions."""
+        base = {
+            "results": {
+                "list": {
+                    "errors": 0,
+                    "throughput_rps": 100.0,
+                    "p50_ms": 10.0,
+                    "p95_ms": 20.0,
+                    "p99_ms": 30.0,
+                },
+            },
+        }
+        current = copy.deepcopy(base)
+        current["results"]["list"]["p95_ms"] = 21.0
+        self.assertEqual(compare(base, current, 0.1), [])
+        current["results"]["list"].update(
+            p99_ms=40.0,
+            throughput_rps=80.0,
+            errors=1,
+        )
+        self.assertEqual(
+            compare(base, current, 0.1),
+            [
+                "list: errors 0 -> 1",
+                "list: p99_ms 30.0 -> 40.0 (+33%)",
+                "list: throughput_rps 100.0 -> 80.0 (-20%)",
+            ],
+        )
+        self.assertEqual(
+            compare(base, {"results": {}}, 0.1),
+            ["list: missing from the current run"],
+        )
+
+    def test_compare_command(self: TestBenchmark) -> None:
+        """compare_benchmarks fails on a regression beyond the threshold."""
+        result = {
+            "errors": 0,
+            "throughput_rps": 100.0,
+            "p50_ms": 10.0,
+            "p95_ms": 20.0,
+            "p99_ms": 30.0,
+        }
+        base = {"meta": {"users": 100}, "results": {"list": result}}
+        slower = {
+            "meta": {"users": 100},
+            "results": {"list": {**result, "p50_ms": 12.0}},
+        }
+        with tempfile.TemporaryDirectory() as directory:
+            base_path = Path(directory) / "base.json"
+            slower_path = Path(directory) / "slower.json"
+            base_path.write_text(json.dumps(base))
+            slower_path.write_text(json.dumps(slower))
+
+            out = StringIO()
+            call_command(
+                "compare_benchmarks",
+                base_path,
+                slower_path,
+                threshold=25,
+                stdout=out,
+            )
+            self.assertIn("No regressions", out.getvalue())
+            with self.assertRaises(CommandError):
+                call_command(
+                    "compare_benchmarks",
+                    base_path,
+                    slower_path,
+                    stdout=StringIO(),
+                )
@@ -0,0 +1,130 @@
+"""Load generator test module."""
+from __future__ import annotations
+
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management import CommandError, call_command
+from django.test import LiveServerTestCase, SimpleTestCase
+
+from config.loadtest import (
+    check_local,
+    create_accounts,
+    fill,
+    load_mix,
+    run_step,
+    saturation,
+)
+
+MIX = settings.BASE_DIR / "benchmarks" / "mobile_polling.jsonl"
+
+
+class TestTrafficMix(SimpleTestCase):
+    """Mix parsing, templating and the localhost guard."""
+
+    def write_mix(self: TestTrafficMix, text: str) -> Path:
+        """Write a mix to a temporary file."""
+        tmp = tempfile.NamedTemporaryFile("w", suffix=".jsonl", delete=False)
+        self.addCleanup(Path(tmp.name).unlink)
+        with tmp:
+            tmp.write(text)
+        return Path(tmp.name)
+
+    def test_shipped_mix(self: TestTrafficMix) -> None:
+        """The default mix is mostly listing polls."""
+        actions = load_mix(MIX)
+        poll = next(action for action in actions if action.name == "poll")
+        self.assertEqual((poll.method, poll.path), ("GET", "/api/reminder/"))
+        self.assertGreater(poll.weight, sum(a.weight for a in actions) / 2)
+
+    def test_invalid_mix(self: TestTrafficMix) -> None:
+        """Bad lines are reported with their line number."""
+        for text, error in [
+            ('{"name": "a", "path": "/", "sleep": 1}', ":1: unknown field(s) sleep"),
+            ('\n{"name": "a"}', ":2: every action needs a name and a path"),
+            ('{"name": "a", "path": "/", "repeat": 0}', ":1: a: weight must be"),
+            ("{oops", ":1: "),
+            ("\n\n", "no actions"),
+        ]:
+            with self.assertRaisesMessage(ValueError, error):
+                load_mix(self.write_mix(text))
+
+    def test_fill(self: TestTrafficMix) -> None:
+        """Placeholders are filled in nested strings only."""
+        self.assertEqual(
+            fill(
+                {"title": "Load {n}", "tags": ["{username}"], "count": 3},
+                {"n": 7, "username": "u"},
+            ),
+            {"title": "Load 7", "tags": ["u"], "count": 3},
+        )
+
+    def test_localhost_only(self: TestTrafficMix) -> None:
+        """Only plain HTTP servers on a loopback address are accepted."""
+        self.assertEqual(check_local("http://127.0.0.1:8000"), ("127.0.0.1", 8000))
+        self.assertEqual(check_local("http://localhost"), ("localhost", 80))
+        for url in ["http://10.0.0.1:8000", "https://127.0.0.1", "127.0.0.1:8000"]:
+            with self.assertRaises(ValueError, msg=url):
+                check_local(url)
+        with self.assertRaisesMessage(CommandError, "not a loopback address"):
+            call_command("load_test", "http://10.0.0.1:8000", stdout=StringIO())
+
+    def test_saturation(self: TestTrafficMix) -> None:
+        """The step after which throughput grows under 10% is the saturation point."""
+        steps = [
+            {"clients": 1, "throughput_rps": 100},
+            {"clients": 2, "throughput_rps": 190},
+            {"clients": 4, "throughput_rps": 200},
+            {"clients": 8, "throughput_rps": 150},
+        ]
+        self.assertEqual(saturation(steps)["clients"], 2)
+        self.assertIsNone(saturation(steps[:2]))
+
+
+class TestLoadTest(LiveServerTestCase):
+    """Runs against Django's live test server."""
+
+    def setUp(self: TestLoadTest) -> None:
+        """Testcase setup."""
+        self.host, self.port = check_local(self.live_server_url)
+
+    def test_run_step(self: TestLoadTest) -> None:
+        """Every action of the mix is sent without errors."""
+        accounts = create_accounts(self.host, self.port, 2, prefix="load")
+        step = run_step(
+            self.host,
+            self.port,
+            load_mix(MIX),
+            accounts,
+            clients=2,
+            duration=0.5,
+            think=False,
+        )
+        self.assertEqual(step["clients"], 2)
+        self.assertGreater(step["requests"], 0)
+        self.assertEqual(step["errors"], 0)
+        self.assertEqual(
+            step["requests"],
+            sum(result["requests"] for result in step["actions"].values()),
+        )
+
+    def test_command(self: TestLoadTest) -> None:
+        """load_test reports each step and writes JSON."""
+        with tempfile.TemporaryDirectory() as directory:
+            output = Path(directory) / "load.json"
+            out = StringIO()
+            call_command(
+                "load_test",
+                self.live_server_url,
+                clients=[1, 2],
+                duration=0.3,
+                no_think=True,
+                output=output,
+                stdout=out,
+            )
+            results = json.loads(output.read_text())
+        self.assertEqual([step["clients"] for step in results["steps"]], [1, 2])
+        self.assertIn("2 client(s):", out.getvalue())
@@ -0,0 +1,207 @@
+"""Prometheus metrics test module."""
+from __future__ import annotations
+
+import json
+import re
+import tempfile
+from pathlib import Path
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+
+from auth import hashing
+from config.metrics import escape, labels, render, store
+from reminder import cache as listing_cache
+from reminder.models import Reminder
+
+LISTING = 'route="/api/reminder/"'
+
+
+def sample(text: str, series: str) -> float:
+    """Return the value of one series in the exposition text."""
+    match = re.search(rf"^{re.escape(series)} (\S+)$", text, re.MULTILINE)
+    if match is None:
+        msg = f"{series} not in metrics"
+        raise AssertionError(msg)
+    return float(match.group(1))
+
+
+class TestMetrics(TestCase):
+    """MetricsMiddleware and the /metrics endpoint."""
+
+    def setUp(self: TestMetrics) -> None:
+        """Testcase setup."""
+        cache.clear()
+        store.reset()
+        listing_cache.stats.reset()
+        self.user = User.objects.create_user(
+            username="test-user",
+            password="test-pass",
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.headers = {"Authorization": f"Token {self.token.key}"}
+        Reminder.objects.create(
+            reminder_title="Metrics",
+            user=self.user,
+            end_date_time="2030-01-01T00:00:00Z",
+        )
+
+    def metrics(self: TestMetrics) -> str:
+        """GET /metrics and return its body."""
+        res = self.client.get(reverse("metrics"))
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertTrue(res["Content-Type"].startswith("text/plain; version=0.0.4"))
+        return res.content.decode()
+
+    def test_route_histograms(self: TestMetrics) -> None:
+        """Requests are labelled by route pattern, not by path."""
+        for _ in range(2):
+            self.client.get(reverse("reminder"), headers=self.headers)
+        reminder = Reminder.objects.get()
+        self.client.delete(
+            reverse("delete-reminder", args=[reminder.id]),
+            headers=self.headers,
+        )
+        self.client.get("/no/such/page", headers=self.headers)
+        text = self.metrics()
+
+        self.assertEqual(
+            sample(
+                text,
+                f'http_requests_total{{{LISTING},method="GET",status="200"}}',
+            ),
+            2,
+        )
+        self.assertEqual(
+            sample(text, f"http_request_duration_seconds_count{{{LISTING}}}"),
+            2,
+        )
+        self.assertEqual(
+            sample(
+                text,
+                f'http_request_duration_seconds_bucket{{{LISTING},le="+Inf"}}',
+            ),
+            2,
+        )
+        self.assertIn('route="/api/reminder/<uuid:reminder_id>/"', text)
+        self.assertNotIn(str(reminder.id), text)
+        self.assertIn(
+            'http_requests_total{route="unmatched",method="GET",status="404"} 1',
+            text,
+        )
+        self.assertGreater(
+            sample(text, f"http_response_size_bytes_sum{{{LISTING}}}"),
+            0,
+        )
+
+    def test_buckets_are_cumulative(self: TestMetrics) -> None:
+        """Bucket counts never decrease and end at the count."""
+        for value in (0, 2, 2, 7, 1000):
+            store.observe("http_request_db_queries", LISTING, value)
+        text = render(store.collect())
+        counts = [
+            sample(text, f'http_request_db_queries_bucket{{{LISTING},le="{le}"}}')
+            for le in ("0", "1", "2", "5", "10", "100", "+Inf")
+        ]
+        self.assertEqual(counts, [1, 1, 3, 3, 4, 4, 5])
+        self.assertEqual(
+            sample(text, f"http_request_db_queries_sum{{{LISTING}}}"),
+            1011,
+        )
+
+    def test_query_count_matches_queries_run(self: TestMetrics) -> None:
+        """The query histogram sees every query the view ran."""
+        with override_settings(
+            REMINDER_LISTING_CACHE_ENABLED=False,
+        ), CaptureQueriesContext(connection) as ctx:
+            self.client.get(reverse("reminder"), headers=self.headers)
+        text = render(store.collect())
+        self.assertEqual(
+            sample(text, f"http_request_db_queries_sum{{{LISTING}}}"),
+            len(ctx.captured_queries),
+        )
+        self.assertGreater(
+            sample(text, f"http_request_db_seconds_sum{{{LISTING}}}"),
+            0,
+        )
+
+    def test_cache_counters(self: TestMetrics) -> None:
+        """Listing cache hits and misses are exported with their ratio."""
+        for _ in range(4):
+            self.client.get(reverse("reminder"), headers=self.headers)
+        text = self.metrics()
+        self.assertEqual(sample(text, "reminder_listing_cache_misses_total"), 1)
+        self.assertEqual(sample(text, "reminder_listing_cache_hits_total"), 3)
+        self.assertEqual(sample(text, "reminder_listing_cache_hit_ratio"), 0.75)
+        self.assertIn("auth_token_cache_hits_total", text)
+
+    def test_hashing_pool_wait(self: TestMetrics) -> None:
+        """Hashing pool queue waits are exported as a histogram."""
+        hashing.stats.reset()
+        res = self.client.post(
+            reverse("login"),
+            {"username": "test-user", "password": "test-pass"},
+            content_type="application/json",
+        )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        text = self.metrics()
+        self.assertEqual(
+            sample(text, 'auth_hashing_pool_wait_seconds_bucket{le="+Inf"}'),
+            1,
+        )
+        self.assertEqual(sample(text, "auth_hashing_pool_wait_seconds_count"), 1)
+        self.assertEqual(sample(text, "auth_hashing_pool_completed_total"), 1)
+
+    def test_workers_are_summed(self: TestMetrics) -> None:
+        """With METRICS_DIR, /metrics adds up the files of every worker."""
+        with tempfile.TemporaryDirectory() as directory, override_settings(
+            METRICS_DIR=directory,
+        ):
+            self.client.get(reverse("reminder"), headers=self.headers)
+            # Another worker that served three listings.
+            other = [
+                [
+                    "http_requests_total",
+                    f'{LISTING},method="GET",status="200"',
+                    [3],
+                ],
+                ["reminder_listing_cache_hits_total", "", [3]],
+            ]
+            (Path(directory) / "1.json").write_text(json.dumps(other))
+            text = self.metrics()
+            self.assertEqual(
+                sample(
+                    text,
+                    f'http_requests_total{{{LISTING},method="GET",status="200"}}',
+                ),
+                4,
+            )
+            self.assertEqual(sample(text, "reminder_listing_cache_hits_total"), 3)
+            files = sorted(path.name for path in Path(directory).iterdir())
+        self.assertEqual(len(files), 2)
+
+    def test_label_escaping(self: TestMetrics) -> None:
+        """Quotes, backslashes and newlines in label values are escaped."""
+        self.assertEqual(escape('a\\b"c\nd'), 'a\\\\b\\"c\\nd')
+        self.assertEqual(labels(route="/x", status=200), 'route="/x",status="200"')
+
+    @override_settings(ROOT_URLCONF="config.asgi_urls")
+    async def test_async_views(self: TestMetrics) -> None:
+        """Requests served by the async views are recorded as well."""
+        res = await self.async_client.get(reverse("reminder"), headers=self.headers)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        text = render(store.collect())
+        self.assertEqual(
+            sample(text, f"http_request_duration_seconds_count{{{LISTING}}}"),
+            1,
+        )
+        self.assertGreater(
+            sample(text, f"http_request_db_queries_sum{{{LISTING}}}"),
+            0,
+        )
@@ -0,0 +1,143 @@
+"""Request profiling test module."""
+from __future__ import annotations
+
+import json
+import pstats
+import tempfile
+import timeit
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+
+from config.profiling import ProfilingMiddleware, make_token, token_is_valid
+from reminder.models import Reminder
+
+# Per-request cost allowed when nothing is profiled; the actual cost is a
+# fraction of a microsecond.
+OFF_BUDGET = 10e-6  # seconds
+
+
+class TestProfiling(TestCase):
+    """ProfilingMiddleware tests."""
+
+    def setUp(self: TestProfiling) -> None:
+        """Testcase setup."""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        settings = override_settings(PROFILING_DIR=self.dir, PROFILING_ENABLED=False)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.user = User.objects.create_user(
+            username="test-user",
+            password="test-pass",
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.headers = {"Authorization": f"Token {self.token.key}"}
+        Reminder.objects.create(
+            reminder_title="Profiled",
+            user=self.user,
+            end_date_time="2030-01-01T00:00:00Z",
+        )
+
+    def profiles(self: TestProfiling) -> list[str]:
+        """Return the ids of the profiles written."""
+        return sorted(path.stem for path in self.dir.glob("*.prof"))
+
+    def test_signed_header(self: TestProfiling) -> None:
+        """A request with a valid token writes a profile and its SQL log."""
+        with CaptureQueriesContext(connection) as ctx:
+            res = self.client.get(
+                reverse("reminder"),
+                headers={**self.headers, "X-Profile": make_token()},
+            )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        profile_id = res["X-Profile-Id"]
+        self.assertEqual(self.profiles(), [profile_id])
+
+        summary = json.loads((self.dir / f"{profile_id}.json").read_text())
+        self.assertEqual(summary["path"], "/api/reminder/")
+        self.assertEqual(summary["user_id"], self.user.id)
+        self.assertEqual(summary["status"], status.HTTP_200_OK)
+        self.assertEqual(summary["sql_count"], len(ctx.captured_queries))
+        self.assertNotIn(self.token.key, json.dumps(summary))
+        stats = pstats.Stats(str(self.dir / f"{profile_id}.prof"))
+        self.assertGreater(stats.total_calls, 0)
+
+    def test_bad_or_expired_token(self: TestProfiling) -> None:
+        """Forged and expired tokens are ignored."""
+        token = make_token()
+        self.assertTrue(token_is_valid(token))
+        self.assertFalse(token_is_valid(token + "x"))
+        with override_settings(PROFILING_TOKEN_MAX_AGE=-1):
+            self.assertFalse(token_is_valid(token))
+        res = self.client.get(
+            reverse("reminder"),
+            headers={**self.headers, "X-Profile": "profile:forged"},
+        )
+        self.assertNotIn("X-Profile-Id", res)
+        self.assertEqual(self.profiles(), [])
+
+    @override_settings(PROFILING_ENABLED=True, PROFILING_SAMPLE_RATE=1.0)
+    def test_sampling_only_covers_prefixes(self: TestProfiling) -> None:
+        """Sampling profiles reminder and auth requests, nothing else."""
+        self.client.get(reverse("reminder"), headers=self.headers)
+        self.client.get(reverse("schema"))
+        self.assertEqual(len(self.profiles()), 1)
+
+    @override_settings(
+        PROFILING_ENABLED=True,
+        PROFILING_SAMPLE_RATE=1.0,
+        PROFILING_MAX_PROFILES=2,
+    )
+    def test_rotation(self: TestProfiling) -> None:
+        """Only the newest profiles are kept."""
+        ids = [
+            self.client.get(reverse("reminder"), headers=self.headers)["X-Profile-Id"]
+            for _ in range(3)
+        ]
+        self.assertEqual(self.profiles(), ids[1:])
+        self.assertEqual(len(list(self.dir.glob("*.json"))), 2)
+
+    @override_settings(ROOT_URLCONF="config.asgi_urls")
+    async def test_async_views(self: TestProfiling) -> None:
+        """Async views are profiled with the queries of their worker threads."""
+        res = await self.async_client.get(
+            reverse("reminder"),
+            headers={**self.headers, "X-Profile": make_token()},
+        )
+        summary = json.loads((self.dir / f"{res['X-Profile-Id']}.json").read_text())
+        self.assertGreater(summary["sql_count"], 0)
+
+    def test_off_overhead(self: TestProfiling) -> None:
+        """With profiling off a request does not touch the profiler and costs next to nothing."""
+        response = HttpResponse()
+        middleware = ProfilingMiddleware(lambda _request: response)
+        request = RequestFactory().get("/api/reminder/")
+
+        with mock.patch("cProfile.Profile") as profiler:
+            self.assertIs(middleware(request), response)
+        profiler.assert_not_called()
+
+        number = 10_000
+        bare = min(timeit.repeat(lambda: response, number=number, repeat=5))
+        wrapped = min(
+            timeit.repeat(lambda: middleware(request), number=number, repeat=5),
+        )
+        self.assertLess((wrapped - bare) / number, OFF_BUDGET)
+
+    def test_profile_token_command(self: TestProfiling) -> None:
+        """profile_token prints a valid token."""
+        out = StringIO()
+        call_command("profile_token", stdout=out, stderr=StringIO())
+        self.assertTrue(token_is_valid(out.getvalue().strip()))
@@ -0,0 +1,191 @@
+"""Query budget test module."""
+from __future__ import annotations
+
+import json
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLResolver, get_resolver, reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+
+from config.querybudget import QueryBudgetExceeded, batches
+from reminder.models import Reminder
+from reminder.views.async_reminder import AsyncReminderView
+from reminder.views.reminder import ReminderView
+
+# Handlers the budgets must cover: every API view of these apps.
+APPS = ("auth.", "reminder.")
+METHODS = ("get", "post", "put", "patch", "delete")
+
+
+def insert_batch_limit() -> int:
+    """Return the most reminders the database takes in one INSERT."""
+    fields = Reminder._meta.concrete_fields  # noqa: SLF001
+    return connection.ops.bulk_batch_size(fields, [])
+
+
+def handlers(urlconf: str) -> list:
+    """Return every view method routed by ``urlconf`` in one of ``APPS``."""
+    found = []
+    resolvers = [get_resolver(urlconf)]
+    while resolvers:
+        for pattern in resolvers.pop().url_patterns:
+            if isinstance(pattern, URLResolver):
+                resolvers.append(pattern)
+                continue
+            view_class = getattr(pattern.callback, "view_class", None)
+            if view_class is None or not view_class.__module__.startswith(APPS):
+                continue
+            found.extend(
+                getattr(view_class, method)
+                for method in METHODS
+                if hasattr(view_class, method)
+            )
+    return found
+
+
+class TestQueryBudget(TestCase):
+    """QueryBudgetMiddleware and the view budgets."""
+
+    def setUp(self: TestQueryBudget) -> None:
+        """Testcase setup."""
+        self.user = User.objects.create_user(
+            username="test-user",
+            password="test-pass",
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.headers = {"Authorization": f"Token {self.token.key}"}
+        Reminder.objects.create(
+            reminder_title="Budgeted",
+            user=self.user,
+            end_date_time="2030-01-01T00:00:00Z",
+        )
+
+    def test_every_view_has_a_budget(self: TestQueryBudget) -> None:
+        """Every auth and reminder handler, sync and async, declares a budget."""
+        for urlconf in ("config.urls", "config.asgi_urls"):
+            found = handlers(urlconf)
+            self.assertTrue(found)
+            for handler in found:
+                with self.subTest(urlconf=urlconf, handler=handler.__qualname__):
+                    self.assertTrue(hasattr(handler, "query_budget"))
+
+    def test_raise(self: TestQueryBudget) -> None:
+        """Under "raise" a request over budget fails."""
+        with mock.patch.object(ReminderView.get, "query_budget", 0), self.assertRaises(
+            QueryBudgetExceeded,
+        ) as ctx:
+            self.client.get(reverse("reminder"), headers=self.headers)
+        self.assertIn("ReminderView.get", str(ctx.exception))
+
+    @override_settings(QUERY_BUDGET_ACTION="warn")
+    def test_warn(self: TestQueryBudget) -> None:
+        """Under "warn" a request over budget is logged and still served."""
+        with mock.patch.object(ReminderView.get, "query_budget", 0), self.assertLogs(
+            "config.querybudget",
+            "WARNING",
+        ) as logs:
+            res = self.client.get(reverse("reminder"), headers=self.headers)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertIn("over the budget of 0", logs.output[0])
+
+    @override_settings(QUERY_BUDGET_ACTION=None)
+    def test_off(self: TestQueryBudget) -> None:
+        """With no action budgets are not checked."""
+        with mock.patch.object(ReminderView.get, "query_budget", 0):
+            res = self.client.get(reverse("reminder"), headers=self.headers)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    @override_settings(REMINDER_BULK_BATCH_SIZE=2)
+    def test_callable_budget(self: TestQueryBudget) -> None:
+        """A bulk create is allowed an insert per batch, and no more."""
+        items = [
+            {"reminder_title": f"Bulk {n}", "end_date_time": "2030-01-01T00:00:00Z"}
+            for n in range(5)
+        ]
+        with CaptureQueriesContext(connection) as ctx:
+            res = self.client.post(
+                reverse("reminder"),
+                items,
+                headers=self.headers,
+                content_type="application/json",
+            )
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(ctx.captured_queries), 3 + batches(5, 2))
+
+        with mock.patch.object(
+            ReminderView.post,
+            "query_budget",
+            mock.Mock(return_value=1),
+        ), self.assertRaises(QueryBudgetExceeded):
+            self.client.post(
+                reverse("reminder"),
+                items,
+                headers=self.headers,
+                content_type="application/json",
+            )
+
+    def test_large_bulk_create_within_budget(self: TestQueryBudget) -> None:
+        """Batches the database splits further are counted in the budget."""
+        size = insert_batch_limit()
+        items = [
+            {"reminder_title": f"Bulk {n}", "end_date_time": "2030-01-01T00:00:00Z"}
+            for n in range(size + 1)
+        ]
+        res = self.client.post(
+            reverse("reminder"),
+            items,
+            headers=self.headers,
+            content_type="application/json",
+        )
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(res.json()), size + 1)
+
+    def test_large_import_within_budget(self: TestQueryBudget) -> None:
+        """An import larger than one database batch stays within its budget."""
+        size = insert_batch_limit()
+        body = "".join(
+            json.dumps(
+                {
+                    "reminder_title": f"Import {n}",
+                    "end_date_time": "2030-01-01T00:00:00Z",
+                },
+            )
+            + "\n"
+            for n in range(size + 1)
+        )
+        res = self.client.generic(
+            "POST",
+            reverse("import-reminder"),
+            body.encode(),
+            "application/x-ndjson",
+            headers=self.headers,
+        )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.json()["created"], size + 1)
+
+    def test_login_reads_user_and_token_at_once(self: TestQueryBudget) -> None:
+        """Logging in with an existing token is a single query."""
+        with CaptureQueriesContext(connection) as ctx:
+            res = self.client.post(
+                reverse("login"),
+                {"username": "test-user", "password": "test-pass"},
+                content_type="application/json",
+            )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.json()["data"]["token"], self.token.key)
+        self.assertEqual(len(ctx.captured_queries), 1)
+
+    @override_settings(ROOT_URLCONF="config.asgi_urls")
+    async def test_async_raise(self: TestQueryBudget) -> None:
+        """Async views count the queries of their worker threads."""
+        with mock.patch.object(
+            AsyncReminderView.get,
+            "query_budget",
+            0,
+        ), self.assertRaises(QueryBudgetExceeded):
+            await self.async_client.get(reverse("reminder"), headers=self.headers)
@@ -0,0 +1,75 @@
+"""Tuned SQLite backend test module."""
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+
+from django.db import OperationalError
+from django.db.utils import ConnectionHandler
+from django.test import SimpleTestCase
+
+from config.database import TUNED_SQLITE, database_from_env
+
+
+class TestTunedSQLite(SimpleTestCase):
+    """Pragmas and write locking of ``config.backends.sqlite3``."""
+
+    def setUp(self: TestTunedSQLite) -> None:
+        """Testcase setup."""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.url = f"sqlite:///{Path(tmp.name) / 'tuned.sqlite3'}"
+        self.connection = self.connect()
+        with self.connection.cursor() as cursor:
+            cursor.execute("CREATE TABLE item (id INTEGER PRIMARY KEY)")
+
+    def connect(self: TestTunedSQLite, pragmas: dict | None = None) -> object:
+        """Open a tuned connection to the scratch database."""
+        config = database_from_env(
+            {"DATABASE_URL": self.url, "DB_SQLITE_TUNED": "1"},
+            Path(),
+        )
+        self.assertEqual(config["ENGINE"], TUNED_SQLITE)
+        if pragmas:
+            config["OPTIONS"]["pragmas"] = pragmas
+        connection = ConnectionHandler({"default": config})["default"]
+        self.addCleanup(connection.close)
+        return connection
+
+    def pragma(self: TestTunedSQLite, connection: object, name: str) -> object:
+        """Read one pragma."""
+        with connection.cursor() as cursor:
+            cursor.execute(f"PRAGMA {name}")
+            return cursor.fetchone()[0]
+
+    def test_pragmas(self: TestTunedSQLite) -> None:
+        """Every new connection gets the tuned pragmas."""
+        self.assertEqual(self.pragma(self.connection, "journal_mode"), "wal")
+        self.assertEqual(self.pragma(self.connection, "synchronous"), 1)  # NORMAL
+        self.assertEqual(self.pragma(self.connection, "busy_timeout"), 5000)
+        self.assertEqual(self.pragma(self.connection, "cache_size"), -20000)
+        self.assertEqual(self.pragma(self.connection, "foreign_keys"), 1)
+
+    def test_pragmas_can_be_overridden(self: TestTunedSQLite) -> None:
+        """``OPTIONS["pragmas"]`` overrides single pragmas."""
+        connection = self.connect({"busy_timeout": 250})
+        self.assertEqual(self.pragma(connection, "busy_timeout"), 250)
+        self.assertEqual(self.pragma(connection, "synchronous"), 1)
+
+    def test_transactions_take_the_write_lock_up_front(
+        self: TestTunedSQLite,
+    ) -> None:
+        """Transactions begin IMMEDIATE, so other writers wait for them."""
+        other = self.connect({"busy_timeout": 0})
+        # What transaction.atomic does on entry, on this private connection.
+        self.connection.set_autocommit(
+            False,
+            force_begin_transaction_with_broken_autocommit=True,
+        )
+        # Not a statement has run yet, but the lock is already held.
+        with self.assertRaises(OperationalError), other.cursor() as cursor:
+            cursor.execute("INSERT INTO item DEFAULT VALUES")
+        self.connection.rollback()
+        self.connection.set_autocommit(True)
+        with other.cursor() as cursor:
+            cursor.execute("INSERT INTO item DEFAULT VALUES")
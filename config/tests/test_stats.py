@@ -0,0 +1,36 @@
+"""Summary statistics test module."""
+from __future__ import annotations
+
+from django.test import SimpleTestCase
+
+from config.stats import Counters, percentile
+
+
+class TestPercentile(SimpleTestCase):
+    """Nearest-rank percentile."""
+
+    def test_empty(self: TestPercentile) -> None:
+        """No samples give zero."""
+        self.assertEqual(percentile([], 50), 0.0)
+
+    def test_nearest_rank(self: TestPercentile) -> None:
+        """The smallest sample with at least ``point`` percent at or below it."""
+        ordered = [float(n) for n in range(1, 101)]
+        self.assertEqual(percentile(ordered, 50), 50)
+        self.assertEqual(percentile(ordered, 99), 99)
+        self.assertEqual(percentile(ordered, 100), 100)
+        self.assertEqual(percentile([7.0], 0), 7)
+
+
+class TestCounters(SimpleTestCase):
+    """Named process-local counters."""
+
+    def test_incr_and_reset(self: TestCounters) -> None:
+        """Counters start at zero, add up and reset to zero."""
+        counters = Counters("hits", "misses")
+        self.assertEqual(counters.snapshot(), {"hits": 0, "misses": 0})
+        counters.incr("hits")
+        counters.incr("hits", 2)
+        self.assertEqual(counters.snapshot(), {"hits": 3, "misses": 0})
+        counters.reset()
+        self.assertEqual(counters.snapshot(), {"hits": 0, "misses": 0})
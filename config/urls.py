@@ -22,6 +22,8 @@ from django.urls import include, path
 from django.views.generic.base import RedirectView
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 
+from config.metrics import metrics_view
+
 urlpatterns = [
     path("", RedirectView.as_view(url="/api/schema/docs")),
     path("admin/", admin.site.urls),
@@ -29,4 +31,5 @@ urlpatterns = [
     path("api/reminder/", include("reminder.urls")),
     path("api/schema", SpectacularAPIView.as_view(), name="schema"),
     path("api/schema/docs", SpectacularSwaggerView.as_view(url_name="schema")),
+    path("metrics", metrics_view, name="metrics"),
 ]
@@ -3,6 +3,7 @@
 
 from django.contrib import admin
 
-from .models import Reminder
+from .models import ArchivedReminder, Reminder
 
 admin.site.register(Reminder)
+admin.site.register(ArchivedReminder)
@@ -1,5 +1,8 @@
 """Reminder App config class."""
+from __future__ import annotations
+
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class ReminderConfig(AppConfig):
@@ -7,3 +10,9 @@ class ReminderConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "reminder"
+
+    def ready(self: ReminderConfig) -> None:
+        """Keep the search index triggers in place across migrations."""
+        from reminder.search import restore_search_triggers
+
+        post_migrate.connect(restore_search_triggers, sender=self)
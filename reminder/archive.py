@@ -0,0 +1,96 @@
+"""Archival of expired reminders and TTL purge of the archive.
+
+Both jobs work in small batches. Each batch is selected through an index
+in ``(end_date_time, id)`` or ``archived_at`` order and moved or deleted in
+its own short transaction, so no lock is held for longer than one batch.
+"""
+
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework import serializers
+
+from reminder.cache import invalidate_listing
+from reminder.models import ArchivedReminder, Reminder
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+    from rest_framework.request import Request
+
+ARCHIVED_QUERY_PARAM = "archived"
+ARCHIVED_COLUMNS = ("id", "user_id", "reminder_title", "end_date_time", "delivered_at")
+
+
+def archived_requested(request: Request) -> bool:
+    """Check ``?archived=true``, which lists archived instead of live reminders."""
+    raw = request.query_params.get(ARCHIVED_QUERY_PARAM)
+    if raw is None:
+        return False
+    try:
+        return serializers.BooleanField().to_internal_value(raw)
+    except serializers.ValidationError as exc:
+        raise serializers.ValidationError({ARCHIVED_QUERY_PARAM: exc.detail}) from None
+
+
+def archive_cutoff(
+    retention: float,
+    now: datetime.datetime | None = None,
+) -> datetime.datetime:
+    """Return the end time before which reminders are archived."""
+    return (now or timezone.now()) - datetime.timedelta(seconds=retention)
+
+
+def expired_reminders(cutoff: datetime.datetime) -> QuerySet[Reminder]:
+    """Reminders that ended before ``cutoff``, oldest first, served by ``reminder_end_idx``.
+
+    A recurring reminder only ends once the dispatcher has delivered its
+    last occurrence; until then a stale ``end_date_time`` means the
+    dispatcher is behind, and archiving it would drop the rule.
+    """
+    return (
+        Reminder.objects.filter(end_date_time__lt=cutoff)
+        .filter(Q(recurrence="") | Q(delivered_at__isnull=False))
+        .order_by("end_date_time", "id")
+    )
+
+
+def archive_batch(cutoff: datetime.datetime, batch_size: int) -> int:
+    """Move up to ``batch_size`` reminders that ended before ``cutoff``.
+
+    The oldest rows are copied and deleted in one transaction. Returns the number of reminders moved.
+    """
+    with transaction.atomic():
+        rows = list(
+            expired_reminders(cutoff)
+            .select_for_update()
+            .values_list(*ARCHIVED_COLUMNS)[:batch_size],
+        )
+        if not rows:
+            return 0
+        ArchivedReminder.objects.bulk_create(
+            (ArchivedReminder(**dict(zip(ARCHIVED_COLUMNS, row))) for row in rows),
+            ignore_conflicts=True,
+        )
+        Reminder.objects.filter(id__in=[row[0] for row in rows]).delete()
+    invalidate_listing(row[1] for row in rows)
+    return len(rows)
+
+
+def purge_batch(cutoff: datetime.datetime, batch_size: int) -> int:
+    """Delete up to ``batch_size`` archived reminders archived before ``cutoff``."""
+    with transaction.atomic():
+        rows = list(
+            ArchivedReminder.objects.filter(archived_at__lt=cutoff)
+            .order_by("archived_at")
+            .values_list("id", "user_id")[:batch_size],
+        )
+        if not rows:
+            return 0
+        ArchivedReminder.objects.filter(id__in=[row[0] for row in rows]).delete()
+    invalidate_listing(row[1] for row in rows)
+    return len(rows)
@@ -0,0 +1,31 @@
+"""Urls module for reminder under ASGI."""
+
+from django.urls import path
+
+from .views.async_reminder import (
+    AsyncDeleteReminderView,
+    AsyncExportReminderView,
+    AsyncReminderView,
+    FeedView,
+)
+from .views.reminder import (
+    BulkDeleteReminderView,
+    ImportReminderView,
+    OccurrenceView,
+    SearchReminderView,
+)
+
+urlpatterns = [
+    path("", AsyncReminderView.as_view(), name="reminder"),
+    path("occurrences/", OccurrenceView.as_view(), name="reminder-occurrences"),
+    path("search/", SearchReminderView.as_view(), name="search-reminder"),
+    path("feed/", FeedView.as_view(), name="reminder-feed"),
+    path("export/", AsyncExportReminderView.as_view(), name="export-reminder"),
+    path("import/", ImportReminderView.as_view(), name="import-reminder"),
+    path("bulk-delete/", BulkDeleteReminderView.as_view(), name="bulk-delete-reminder"),
+    path(
+        "<uuid:reminder_id>/",
+        AsyncDeleteReminderView.as_view(),
+        name="delete-reminder",
+    ),
+]
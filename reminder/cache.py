@@ -0,0 +1,180 @@
+"""Per-user cache of serialized reminder listings.
+
+Every cached listing is keyed by the owner's listing version. Writers call
+:func:`invalidate_listing`, which bumps the version, so stale entries are
+never read again and simply expire.
+
+The version only moves in the cache the writer sees; with a per-process
+cache, writes by other workers, the dispatcher or management commands leave
+it alone. Each entry is therefore stored with the listing ETag it was built
+for and only served while that still is the current ETag, which costs one
+aggregate query instead of reading and serializing the rows.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.cache import caches
+
+from config.stats import Counters
+from reminder.window import upcoming_requested
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from django.core.cache.backends.base import BaseCache
+    from rest_framework.request import Request
+
+VERSION_KEY = "reminder:listing:version:{user_id}"
+LISTING_KEY = "reminder:listing:{user_id}:{version}:{digest}"
+
+
+stats = Counters("hits", "misses", "invalidations")
+
+
+def _cache() -> BaseCache:
+    return caches[settings.REMINDER_LISTING_CACHE_ALIAS]
+
+
+def _fresh_version() -> int:
+    # Seeded from the clock, not 1, so a version evicted from the cache can
+    # never come back with the value of entries still stored under it.
+    return time.time_ns()
+
+
+def listing_version(user_id: int) -> int:
+    """Return the current listing version of a user."""
+    cache = _cache()
+    key = VERSION_KEY.format(user_id=user_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _fresh_version(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+async def alisting_version(user_id: int) -> int:
+    """Async version of :func:`listing_version`."""
+    cache = _cache()
+    key = VERSION_KEY.format(user_id=user_id)
+    version = await cache.aget(key)
+    if version is None:
+        await cache.aadd(key, _fresh_version(), timeout=None)
+        version = await cache.aget(key)
+    return version
+
+
+def listing_versions(user_ids: Iterable[int]) -> dict[int, int | None]:
+    """Return the listing versions of many users in one round trip.
+
+    Users without a version map to ``None``; nothing is returned if caching
+    is off.
+    """
+    if not settings.REMINDER_LISTING_CACHE_ENABLED:
+        return {}
+    keys = {VERSION_KEY.format(user_id=user_id): user_id for user_id in user_ids}
+    found = _cache().get_many(keys)
+    return {user_id: found.get(key) for key, user_id in keys.items()}
+
+
+def _request_digest(request: Request) -> str:
+    # Pagination links embed the host, so it is part of the key too.
+    raw = f"{request.get_host()}?{request.query_params.urlencode()}"
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def listing_key(request: Request) -> str | None:
+    """Return the cache key of a listing request, or ``None`` if it is not cached.
+
+    ``upcoming`` listings change as time passes without any write, so they
+    are never cached.
+    """
+    if not settings.REMINDER_LISTING_CACHE_ENABLED or upcoming_requested(request):
+        return None
+    user_id = request.user.id
+    return LISTING_KEY.format(
+        user_id=user_id,
+        version=listing_version(user_id),
+        digest=_request_digest(request),
+    )
+
+
+async def alisting_key(request: Request) -> str | None:
+    """Async version of :func:`listing_key`."""
+    if not settings.REMINDER_LISTING_CACHE_ENABLED or upcoming_requested(request):
+        return None
+    user_id = request.user.id
+    return LISTING_KEY.format(
+        user_id=user_id,
+        version=await alisting_version(user_id),
+        digest=_request_digest(request),
+    )
+
+
+def _fresh(cached: tuple[str, object] | None, etag: str) -> object | None:
+    # An entry built for another ETag predates a write this process missed.
+    listing = cached[1] if cached is not None and cached[0] == etag else None
+    stats.incr("misses" if listing is None else "hits")
+    return listing
+
+
+def get_listing(key: str | None, etag: str) -> object | None:
+    """Return the cached listing if it was built for ``etag``, else ``None``."""
+    if key is None:
+        return None
+    return _fresh(_cache().get(key), etag)
+
+
+async def aget_listing(key: str | None, etag: str) -> object | None:
+    """Async version of :func:`get_listing`."""
+    if key is None:
+        return None
+    return _fresh(await _cache().aget(key), etag)
+
+
+def set_listing(key: str | None, data: tuple[str, object]) -> None:
+    """Store an ``(etag, listing)`` pair."""
+    if key is not None:
+        _cache().set(key, data, timeout=settings.REMINDER_LISTING_CACHE_TIMEOUT)
+
+
+async def aset_listing(key: str | None, data: tuple[str, object]) -> None:
+    """Async version of :func:`set_listing`."""
+    if key is not None:
+        await _cache().aset(key, data, timeout=settings.REMINDER_LISTING_CACHE_TIMEOUT)
+
+
+def _user_ids(user_ids: int | Iterable[int]) -> set[int]:
+    return {user_ids} if isinstance(user_ids, int) else set(user_ids)
+
+
+def invalidate_listing(user_ids: int | Iterable[int]) -> None:
+    """Bump the listing version of one or more users."""
+    if not settings.REMINDER_LISTING_CACHE_ENABLED:
+        return
+    cache = _cache()
+    for user_id in _user_ids(user_ids):
+        key = VERSION_KEY.format(user_id=user_id)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, _fresh_version(), timeout=None)
+        stats.incr("invalidations")
+
+
+async def ainvalidate_listing(user_ids: int | Iterable[int]) -> None:
+    """Async version of :func:`invalidate_listing`."""
+    if not settings.REMINDER_LISTING_CACHE_ENABLED:
+        return
+    cache = _cache()
+    for user_id in _user_ids(user_ids):
+        key = VERSION_KEY.format(user_id=user_id)
+        try:
+            await cache.aincr(key)
+        except ValueError:
+            await cache.aset(key, _fresh_version(), timeout=None)
+        stats.incr("invalidations")
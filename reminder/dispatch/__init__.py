@@ -0,0 +1 @@
+"""Due-reminder dispatch: scheduler, dispatcher and delivery backends."""
@@ -0,0 +1,96 @@
+"""Delivery backends called by the dispatcher when reminders come due."""
+
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+if TYPE_CHECKING:
+    from reminder.models import Reminder
+
+logger = logging.getLogger("reminder.dispatch")
+
+
+def reminder_payload(reminder: Reminder) -> dict[str, str | int]:
+    """Return the JSON-able payload delivered for a reminder."""
+    return {
+        "id": str(reminder.id),
+        "user": reminder.user_id,
+        "reminder_title": reminder.reminder_title,
+        "end_date_time": reminder.end_date_time.isoformat(),
+    }
+
+
+class BaseDeliveryBackend:
+    """Base class for delivery backends.
+
+    ``deliver`` receives a batch of due reminders. Raising marks the whole
+    batch as undelivered so it is retried on the next rescan.
+    """
+
+    def __init__(self: BaseDeliveryBackend, **options: object) -> None:
+        """Store backend options."""
+        self.options = options
+
+    def deliver(self: BaseDeliveryBackend, reminders: list[Reminder]) -> None:
+        """Deliver a batch of due reminders."""
+        raise NotImplementedError
+
+    def close(self: BaseDeliveryBackend) -> None:
+        """Release resources held by the backend."""
+
+
+class LogBackend(BaseDeliveryBackend):
+    """Log every due reminder on the ``reminder.dispatch`` logger."""
+
+    def deliver(self: LogBackend, reminders: list[Reminder]) -> None:
+        """Log each reminder."""
+        for reminder in reminders:
+            logger.info("Reminder due: %s", json.dumps(reminder_payload(reminder)))
+
+
+class FileBackend(BaseDeliveryBackend):
+    """Append due reminders as JSON lines to ``OPTIONS["path"]``."""
+
+    def __init__(self: FileBackend, path: str | Path, **options: object) -> None:
+        """Open the output file in append mode."""
+        super().__init__(path=path, **options)
+        self.path = Path(path)
+        self._file = self.path.open("a", encoding="utf-8")
+
+    def deliver(self: FileBackend, reminders: list[Reminder]) -> None:
+        """Write one JSON line per reminder and flush the batch."""
+        self._file.writelines(
+            json.dumps(reminder_payload(reminder)) + "\n" for reminder in reminders
+        )
+        self._file.flush()
+
+    def close(self: FileBackend) -> None:
+        """Close the output file."""
+        self._file.close()
+
+
+class LocmemBackend(BaseDeliveryBackend):
+    """Keep delivered reminders in memory, for tests and benchmarks."""
+
+    outbox: ClassVar[list[Reminder]] = []
+
+    def deliver(self: LocmemBackend, reminders: list[Reminder]) -> None:
+        """Append the batch to the class-level outbox."""
+        self.outbox.extend(reminders)
+
+
+def get_backends(
+    config: list[dict] | None = None,
+) -> list[BaseDeliveryBackend]:
+    """Instantiate the configured backends (``REMINDER_DISPATCH_BACKENDS``)."""
+    if config is None:
+        config = settings.REMINDER_DISPATCH_BACKENDS
+    return [
+        import_string(entry["BACKEND"])(**entry.get("OPTIONS", {})) for entry in config
+    ]
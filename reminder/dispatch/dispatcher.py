@@ -0,0 +1,246 @@
+"""Long-running dispatcher that fires reminders at their due time."""
+
+from __future__ import annotations
+
+import datetime
+import logging
+from collections import deque
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.utils import timezone
+
+from config.stats import percentile
+from reminder.cache import invalidate_listing
+from reminder.dispatch.backends import get_backends
+from reminder.dispatch.scheduler import DueQueue
+from reminder.models import Reminder
+from reminder.pagination import after_position
+
+if TYPE_CHECKING:
+    import threading
+    import uuid
+    from collections.abc import Callable
+
+    from django.db.models import QuerySet
+
+    from reminder.dispatch.backends import BaseDeliveryBackend
+
+logger = logging.getLogger("reminder.dispatch")
+
+
+def pending_reminders() -> QuerySet[Reminder]:
+    """Undelivered reminders in due order, served by ``reminder_pending_idx``."""
+    return Reminder.objects.filter(delivered_at__isnull=True).order_by(
+        "end_date_time",
+        "id",
+    )
+
+
+class LagStats:
+    """Scheduling lag (delivery time minus due time) over a bounded reservoir."""
+
+    def __init__(self: LagStats, size: int = 10_000) -> None:
+        """Keep the most recent ``size`` samples."""
+        self._samples: deque[float] = deque(maxlen=size)
+        self.count = 0
+
+    def record(self: LagStats, lag: float) -> None:
+        """Record one lag sample in seconds."""
+        self._samples.append(lag)
+        self.count += 1
+
+    def percentiles(
+        self: LagStats,
+        points: tuple[int, ...] = (50, 95, 99),
+    ) -> dict[int, float]:
+        """Return nearest-rank percentiles of the recent samples in seconds."""
+        ordered = sorted(self._samples)
+        return {point: percentile(ordered, point) for point in points}
+
+
+class Dispatcher:
+    """Fire due reminders through the delivery backends.
+
+    Upcoming reminders are loaded into a :class:`DueQueue` for a sliding
+    window of ``window`` seconds. Each refill resumes from a keyset
+    watermark, so it only reads rows it has not seen yet. Rows created
+    behind the watermark, or left pending by a failed delivery, are picked
+    up by a periodic rescan.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self: Dispatcher,
+        backends: list[BaseDeliveryBackend] | None = None,
+        *,
+        window: float | None = None,
+        batch_size: int | None = None,
+        max_queue: int | None = None,
+        rescan_interval: float | None = None,
+        clock: Callable[[], datetime.datetime] = timezone.now,
+    ) -> None:
+        """Configure the dispatcher, defaulting to the ``REMINDER_DISPATCH_*`` settings."""
+        self.backends = get_backends() if backends is None else backends
+        self.window = datetime.timedelta(
+            seconds=window or settings.REMINDER_DISPATCH_WINDOW,
+        )
+        self.batch_size = batch_size or settings.REMINDER_DISPATCH_BATCH_SIZE
+        self.max_queue = max_queue or settings.REMINDER_DISPATCH_MAX_QUEUE
+        self.rescan_interval = datetime.timedelta(
+            seconds=rescan_interval or settings.REMINDER_DISPATCH_RESCAN_INTERVAL,
+        )
+        self.clock = clock
+        self.queue = DueQueue()
+        self.lag = LagStats()
+        self.delivered = 0
+        self.failed = 0
+        self._watermark: tuple[datetime.datetime, uuid.UUID] | None = None
+        self._next_refill: datetime.datetime | None = None
+        self._next_rescan: datetime.datetime | None = None
+        self._saturated = False
+        self._behind = False  # the last rescan stopped at max_queue
+
+    def refill(self: Dispatcher, now: datetime.datetime) -> int:
+        """Load pending reminders due before ``now + window`` past the watermark."""
+        horizon = now + self.window
+        loaded = 0
+        while len(self.queue) < self.max_queue:
+            limit = min(self.batch_size, self.max_queue - len(self.queue))
+            queryset = pending_reminders().filter(end_date_time__lt=horizon)
+            if self._watermark is not None:
+                queryset = queryset.filter(after_position(*self._watermark))
+            rows = list(queryset[:limit])
+            for reminder in rows:
+                self.queue.push(reminder)
+            loaded += len(rows)
+            if rows:
+                self._watermark = (rows[-1].end_date_time, rows[-1].id)
+            if len(rows) < limit:
+                break
+        self._saturated = len(self.queue) >= self.max_queue
+        return loaded
+
+    def rescan(self: Dispatcher) -> int:
+        """Queue pending reminders behind the watermark that are not queued yet.
+
+        Stops at ``max_queue`` like :meth:`refill`; the rest are rescanned
+        once the queue has drained.
+        """
+        if self._watermark is None:
+            return 0
+        loaded = 0
+        self._behind = False
+        behind = pending_reminders().filter(end_date_time__lte=self._watermark[0])
+        for reminder in behind.iterator(chunk_size=self.batch_size):
+            if len(self.queue) >= self.max_queue:
+                self._behind = self._saturated = True
+                break
+            loaded += self.queue.push(reminder)
+        return loaded
+
+    def _deliver(self: Dispatcher, batch: list[Reminder]) -> int:
+        """Deliver one batch and mark it delivered."""
+        # Drop reminders deleted or rescheduled since they were loaded.
+        live = dict(
+            Reminder.objects.filter(
+                id__in=[reminder.id for reminder in batch],
+                delivered_at__isnull=True,
+            ).values_list("id", "end_date_time"),
+        )
+        batch = [
+            reminder
+            for reminder in batch
+            if live.get(reminder.id) == reminder.end_date_time
+        ]
+        if not batch:
+            return 0
+        fired_at = self.clock()
+        try:
+            for backend in self.backends:
+                backend.deliver(batch)
+        except Exception:
+            # Left pending; the next rescan queues the batch again.
+            logger.exception("Delivery of %d reminders failed", len(batch))
+            self.failed += len(batch)
+            return 0
+        for reminder in batch:
+            self.lag.record((fired_at - reminder.end_date_time).total_seconds())
+        # A recurring reminder rolls forward to its next occurrence; only
+        # one-offs and finished series are marked delivered.
+        finished, rolled = [], []
+        for reminder in batch:
+            following = reminder.next_occurrence(fired_at)
+            if following is None:
+                finished.append(reminder.id)
+            else:
+                reminder.end_date_time = following
+                reminder.updated_at = fired_at
+                rolled.append(reminder)
+        Reminder.objects.filter(id__in=finished).update(
+            delivered_at=fired_at,
+            updated_at=fired_at,
+        )
+        if rolled:
+            Reminder.objects.bulk_update(rolled, ["end_date_time", "updated_at"])
+        invalidate_listing(reminder.user_id for reminder in batch)
+        self.delivered += len(batch)
+        return len(batch)
+
+    def dispatch_due(self: Dispatcher, now: datetime.datetime) -> int:
+        """Deliver every queued reminder that is due at ``now``."""
+        delivered = 0
+        while batch := self.queue.pop_due(now, self.batch_size):
+            delivered += self._deliver(batch)
+        return delivered
+
+    def tick(self: Dispatcher) -> int:
+        """Refill and rescan when scheduled, then deliver what is due."""
+        now = self.clock()
+        drained = self._saturated and len(self.queue) < self.max_queue // 2
+        if self._next_refill is None or now >= self._next_refill or drained:
+            self.refill(now)
+            self._next_refill = now + self.window / 2
+        if self._next_rescan is None:
+            self._next_rescan = now + self.rescan_interval
+        elif now >= self._next_rescan or (drained and self._behind):
+            self.rescan()
+            self._next_rescan = now + self.rescan_interval
+        return self.dispatch_due(now)
+
+    def run(
+        self: Dispatcher,
+        stop: threading.Event,
+        poll_interval: float = 1.0,
+        report: Callable[[Dispatcher], None] | None = None,
+        report_interval: float = 60.0,
+    ) -> None:
+        """Tick until ``stop`` is set, sleeping until the next reminder is due."""
+        next_report = self.clock() + datetime.timedelta(seconds=report_interval)
+        while not stop.is_set():
+            self.tick()
+            now = self.clock()
+            if report is not None and now >= next_report:
+                report(self)
+                next_report = now + datetime.timedelta(seconds=report_interval)
+            timeout = poll_interval
+            next_due = self.queue.next_due()
+            if next_due is not None:
+                timeout = min(timeout, max(0.0, (next_due - now).total_seconds()))
+            stop.wait(timeout)
+
+    def stats(self: Dispatcher) -> dict[str, int | float]:
+        """Return counters and lag percentiles in milliseconds."""
+        lag = self.lag.percentiles()
+        return {
+            "queued": len(self.queue),
+            "delivered": self.delivered,
+            "failed": self.failed,
+            "lag_p50_ms": lag[50] * 1000,
+            "lag_p95_ms": lag[95] * 1000,
+            "lag_p99_ms": lag[99] * 1000,
+        }
+
+    def close(self: Dispatcher) -> None:
+        """Close every backend."""
+        for backend in self.backends:
+            backend.close()
@@ -0,0 +1,54 @@
+"""In-memory schedule of upcoming reminders."""
+
+from __future__ import annotations
+
+import heapq
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import datetime
+    import uuid
+
+    from reminder.models import Reminder
+
+
+class DueQueue:
+    """Min-heap of reminders keyed by ``(end_date_time, id)``.
+
+    Push and pop are ``O(log n)``; membership is tracked in a set so a
+    reminder loaded twice (e.g. by a rescan) is only queued once.
+    """
+
+    def __init__(self: DueQueue) -> None:
+        """Create an empty queue."""
+        self._heap: list[tuple[datetime.datetime, uuid.UUID, Reminder]] = []
+        self._ids: set[uuid.UUID] = set()
+
+    def __len__(self: DueQueue) -> int:
+        """Return the number of queued reminders."""
+        return len(self._heap)
+
+    def __contains__(self: DueQueue, reminder_id: uuid.UUID) -> bool:
+        """Check whether a reminder id is queued."""
+        return reminder_id in self._ids
+
+    def push(self: DueQueue, reminder: Reminder) -> bool:
+        """Queue a reminder, returning ``False`` if it was already queued."""
+        if reminder.id in self._ids:
+            return False
+        self._ids.add(reminder.id)
+        heapq.heappush(self._heap, (reminder.end_date_time, reminder.id, reminder))
+        return True
+
+    def next_due(self: DueQueue) -> datetime.datetime | None:
+        """Return the earliest due time, or ``None`` when empty."""
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self: DueQueue, now: datetime.datetime, limit: int) -> list[Reminder]:
+        """Pop at most ``limit`` reminders that are due at ``now``."""
+        due = []
+        while self._heap and len(due) < limit and self._heap[0][0] <= now:
+            _, reminder_id, reminder = heapq.heappop(self._heap)
+            self._ids.discard(reminder_id)
+            due.append(reminder)
+        return due
@@ -0,0 +1,75 @@
+"""Conditional GET support for reminder listings."""
+
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING
+
+from django.db.models import Count, Max, Min, Q
+from django.utils import timezone
+from django.utils.http import parse_etags
+
+from reminder.archive import archived_requested
+from reminder.models import ArchivedReminder, Reminder
+from reminder.window import upcoming_requested
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+    from rest_framework.request import Request
+
+
+def _marker_query(request: Request) -> tuple[QuerySet, dict]:
+    if archived_requested(request):
+        # Archived rows never change; archiving and purging move the marker.
+        queryset, changed = ArchivedReminder.objects.all(), "archived_at"
+    else:
+        queryset, changed = Reminder.objects.all(), "updated_at"
+    aggregates = {"count": Count("*"), "latest": Max(changed)}
+    if upcoming_requested(request):
+        # The listing loses its first row when that row ends, with no write.
+        aggregates["next"] = Min(
+            "end_date_time",
+            filter=Q(end_date_time__gte=timezone.now()),
+        )
+    return queryset.filter(user=request.user), aggregates
+
+
+def _marker_etag(request: Request, marker: dict) -> str:
+    latest, upcoming = (
+        marker[name].isoformat() if marker.get(name) else ""
+        for name in ("latest", "next")
+    )
+    raw = f"{marker['count']}:{latest}:{upcoming}:{request.get_host()}?{request.query_params.urlencode()}"
+    return f'"{hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()}"'
+
+
+def listing_etag(request: Request) -> str:
+    """Return a strong ETag for the user's listing without reading any row.
+
+    The marker is ``COUNT(*)`` and ``MAX(updated_at)`` over the user's
+    reminders, answered from ``reminder_user_updated_idx`` (``archived_at``
+    and ``archived_user_archived_idx`` for the archived listing). Inserts and
+    updates move the maximum and deletes change the count. The query string
+    is mixed in because it changes the representation. An ``upcoming``
+    listing also mixes in the end of its first row, which moves when that
+    reminder ends.
+    """
+    queryset, aggregates = _marker_query(request)
+    marker = queryset.aggregate(**aggregates)
+    return _marker_etag(request, marker)
+
+
+async def alisting_etag(request: Request) -> str:
+    """Async version of :func:`listing_etag`."""
+    queryset, aggregates = _marker_query(request)
+    marker = await queryset.aaggregate(**aggregates)
+    return _marker_etag(request, marker)
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check ``If-None-Match`` against the current ETag."""
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return False
+    etags = parse_etags(header)
+    return "*" in etags or etag in etags
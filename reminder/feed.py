@@ -0,0 +1,282 @@
+"""Server-sent events feed of due and changed reminders.
+
+Each ASGI worker runs one :class:`FeedBroker`. While anyone is subscribed it
+wakes every ``REMINDER_FEED_POLL_INTERVAL`` seconds and checks all the
+subscribed users with a few queries, however many streams are open:
+
+* ``due``: an occurrence of one of the user's reminders fell in the
+  interval since the last check.
+* ``changed``: the user's listing version moved (see :mod:`reminder.cache`),
+  so a listing fetched earlier is stale. Needs a listing cache shared by
+  every worker to see writes made elsewhere.
+
+An idle stream is a :class:`Subscription` and a suspended generator, with
+no task or thread of its own. Events wait in a backlog of at most
+``REMINDER_FEED_QUEUE_SIZE``; a client too slow to drain it gets a single
+``resync`` event instead, telling it to refetch the listing.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import logging
+from itertools import islice
+from typing import TYPE_CHECKING
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from reminder.cache import listing_versions
+from reminder.models import Reminder, occurring_between
+from reminder.recurrence import merge_occurrences
+from reminder.serializers import OccurrenceSerializer
+
+if TYPE_CHECKING:
+    import datetime
+    from collections.abc import AsyncIterator, Iterable
+
+logger = logging.getLogger(__name__)
+
+KEEPALIVE = b": keep-alive\n\n"
+USERS_PER_QUERY = 500
+
+
+def encode_event(name: str, data: object) -> bytes:
+    """Encode one server-sent event with a JSON payload."""
+    return b"event: %s\ndata: %s\n\n" % (name.encode(), JSONRenderer().render(data))
+
+
+CHANGED = encode_event("changed", {})
+RESYNC = encode_event("resync", {})
+
+
+class Subscription:
+    """One open stream: the user and a bounded backlog of encoded events."""
+
+    __slots__ = ("user_id", "events", "waiter")
+
+    def __init__(self: Subscription, user_id: int) -> None:
+        """Start with an empty backlog."""
+        self.user_id = user_id
+        self.events: list[bytes] = []
+        self.waiter: asyncio.Future | None = None
+
+    def push(self: Subscription, event: bytes) -> None:
+        """Queue an event; a full backlog is replaced by one ``resync``."""
+        if len(self.events) >= settings.REMINDER_FEED_QUEUE_SIZE:
+            self.events = [RESYNC]
+        else:
+            self.events.append(event)
+        self.wake()
+
+    def wake(self: Subscription) -> None:
+        """Resume a pending :meth:`get`."""
+        if self.waiter is not None and not self.waiter.done():
+            self.waiter.set_result(None)
+
+    async def get(self: Subscription, timeout: float) -> bytes | None:
+        """Return the next event, or ``None`` after ``timeout`` seconds without one."""
+        if not self.events:
+            # A bare future and timer; wait_for would allocate several more
+            # objects per idle stream.
+            loop = asyncio.get_running_loop()
+            self.waiter = loop.create_future()
+            timer = loop.call_later(timeout, self.wake)
+            try:
+                await self.waiter
+            finally:
+                timer.cancel()
+                self.waiter = None
+        return self.events.pop(0) if self.events else None
+
+
+def poll_due(
+    user_ids: Iterable[int],
+    since: datetime.datetime,
+    before: datetime.datetime,
+) -> list[tuple[int, bytes]]:
+    """Return a ``due`` event per occurrence in ``[since, before)``, in time order."""
+    user_ids = iter(user_ids)
+    events = []
+    while chunk := list(islice(user_ids, USERS_PER_QUERY)):
+        reminders = Reminder.objects.filter(
+            occurring_between(since, before),
+            user_id__in=chunk,
+        ).only(
+            "id",
+            "user_id",
+            "reminder_title",
+            "end_date_time",
+            "recurrence",
+            "recurrence_start",
+        )
+        occurrences = merge_occurrences(
+            (reminder, reminder.occurrences(since, before)) for reminder in reminders
+        )
+        events.extend(
+            (
+                reminder.user_id,
+                encode_event(
+                    "due",
+                    OccurrenceSerializer(
+                        {
+                            "reminder": reminder.id,
+                            "reminder_title": reminder.reminder_title,
+                            "occurs_at": occurs_at,
+                        },
+                    ).data,
+                ),
+            )
+            for occurs_at, reminder in occurrences
+        )
+    return events
+
+
+class FeedBroker:
+    """Fan due and change events out to the open streams of this worker."""
+
+    def __init__(self: FeedBroker) -> None:
+        """Start without subscribers or a polling task."""
+        self.subscribers: dict[int, set[Subscription]] = {}
+        self.versions: dict[int, int | None] = {}
+        self._task: asyncio.Task | None = None
+
+    def is_full(self: FeedBroker, user_id: int) -> bool:
+        """Check whether the user has ``REMINDER_FEED_MAX_PER_USER`` streams open."""
+        return (
+            len(self.subscribers.get(user_id, ()))
+            >= settings.REMINDER_FEED_MAX_PER_USER
+        )
+
+    def subscribe(
+        self: FeedBroker,
+        user_id: int,
+        version: int | None = None,
+    ) -> Subscription | None:
+        """Open a stream for ``user_id``, or return ``None`` if the user is at the cap.
+
+        ``version`` is the listing version the client has seen; a later
+        change emits ``changed``.
+        """
+        if self.is_full(user_id):
+            return None
+        subscription = Subscription(user_id)
+        self.subscribers.setdefault(user_id, set()).add(subscription)
+        self.versions.setdefault(user_id, version)
+        self._ensure_polling()
+        return subscription
+
+    def unsubscribe(self: FeedBroker, subscription: Subscription) -> None:
+        """Close a stream."""
+        streams = self.subscribers.get(subscription.user_id)
+        if streams is None:
+            return
+        streams.discard(subscription)
+        if not streams:
+            del self.subscribers[subscription.user_id]
+            self.versions.pop(subscription.user_id, None)
+
+    def publish(self: FeedBroker, user_id: int, event: bytes) -> None:
+        """Queue an event on every stream of a user."""
+        for subscription in self.subscribers.get(user_id, ()):
+            subscription.push(event)
+
+    def _ensure_polling(self: FeedBroker) -> None:
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            # A fresh context, so polls are not charged to, or logged in the
+            # profile of, the request that happened to start the task.
+            self._task = loop.create_task(
+                self._poll_forever(),
+                context=contextvars.Context(),
+            )
+
+    async def _poll_forever(self: FeedBroker) -> None:
+        since = timezone.now()
+        while self.subscribers:
+            await asyncio.sleep(settings.REMINDER_FEED_POLL_INTERVAL)
+            before = timezone.now()
+            try:
+                await self.poll(since, before)
+            except Exception:
+                # Retried over the same interval on the next tick.
+                logger.exception("Feed poll failed")
+                continue
+            since = before
+
+    async def poll(
+        self: FeedBroker,
+        since: datetime.datetime,
+        before: datetime.datetime,
+    ) -> None:
+        """Publish the occurrences in ``[since, before)`` and any listing changes."""
+        user_ids = list(self.subscribers)
+        due = await sync_to_async(poll_due)(user_ids, since, before)
+        for user_id, event in due:
+            self.publish(user_id, event)
+        for user_id, version in (
+            await sync_to_async(listing_versions)(user_ids)
+        ).items():
+            if user_id not in self.subscribers:
+                continue
+            if version != self.versions.get(user_id):
+                self.publish(user_id, CHANGED)
+            self.versions[user_id] = version
+
+    async def stop(self: FeedBroker) -> None:
+        """Cancel the polling task, if one is running."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+
+broker = FeedBroker()
+
+
+class EventStream:
+    """The events of one subscription, as ``StreamingHttpResponse`` content.
+
+    Iterating yields events until ``REMINDER_FEED_MAX_AGE``, with a
+    keep-alive comment after ``REMINDER_FEED_KEEPALIVE`` quiet seconds.
+    Django does not notice a client that went away mid-stream, so streams
+    end after a fixed age and clients reconnect. Django calls :meth:`close`
+    when the response is done, which releases the subscription even if
+    iteration was abandoned or never started.
+    """
+
+    __slots__ = ("subscription",)
+
+    def __init__(self: EventStream, subscription: Subscription) -> None:
+        """Stream the events of a subscription taken from :data:`broker`."""
+        self.subscription: Subscription | None = subscription
+
+    def __aiter__(self: EventStream) -> AsyncIterator[bytes]:
+        """Return the event generator."""
+        return self._events()
+
+    async def _events(self: EventStream) -> AsyncIterator[bytes]:
+        if self.subscription is None:
+            return
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.REMINDER_FEED_MAX_AGE
+        try:
+            yield b"retry: %d\n\n" % (settings.REMINDER_FEED_RETRY * 1000)
+            while (remaining := deadline - loop.time()) > 0:
+                event = await self.subscription.get(
+                    min(settings.REMINDER_FEED_KEEPALIVE, remaining),
+                )
+                yield KEEPALIVE if event is None else event
+        finally:
+            self.close()
+
+    def close(self: EventStream) -> None:
+        """Release the subscription."""
+        if self.subscription is not None:
+            broker.unsubscribe(self.subscription)
+            self.subscription = None
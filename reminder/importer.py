@@ -0,0 +1,190 @@
+"""Streaming bulk import of reminders from NDJSON or CSV.
+
+Records are parsed one at a time, validated with the same rules as
+``ReminderSerializer`` and inserted with batched ``bulk_create``, so memory
+stays flat however large the input is.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import time
+import uuid
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from rest_framework import serializers
+
+from reminder.cache import invalidate_listing
+from reminder.models import Reminder
+from reminder.serializers import ReminderSerializer
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    from django.contrib.auth.models import User
+
+
+def parse_ndjson(lines: Iterable[str]) -> Iterator[dict | serializers.ValidationError]:
+    """Yield one record per non-blank line.
+
+    Malformed lines yield a ``ValidationError`` in their place, so the
+    record numbers of the lines after them stay put.
+    """
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError as exc:
+            yield serializers.ValidationError(f"Invalid JSON: {exc}")
+
+
+def parse_csv(lines: Iterable[str]) -> Iterator[dict | serializers.ValidationError]:
+    """Yield one record per CSV row, keyed by the header row.
+
+    Rows the reader rejects, such as ones with an oversized field, yield a
+    ``ValidationError`` in their place. A header that cannot be read raises
+    ``csv.Error``.
+    """
+    reader = csv.DictReader(lines)
+    if reader.fieldnames is None:
+        return
+    while True:
+        try:
+            yield next(reader)
+        except StopIteration:  # noqa: PERF203
+            return
+        except csv.Error as exc:
+            yield serializers.ValidationError(f"Invalid CSV: {exc}")
+
+
+PARSERS: dict[str, Callable[[Iterable[str]], Iterator]] = {
+    "ndjson": parse_ndjson,
+    "csv": parse_csv,
+}
+# Request body media types accepted by the upload endpoint.
+IMPORT_FORMATS = {
+    "application/x-ndjson": "ndjson",
+    "text/csv": "csv",
+}
+
+
+class ReminderImporter:
+    """Validate records and insert them for one user in batches.
+
+    ``rows`` is the number of records consumed so far and ``committed_rows``
+    the number consumed up to the last committed batch, a safe resume point:
+    every valid record up to it has been committed.
+    With ``id_namespace`` set, primary keys are derived from the record
+    number and conflicting inserts are ignored, so replaying a batch after
+    a crash does not duplicate it.
+    """
+
+    def __init__(
+        self: ReminderImporter,
+        user: User,
+        *,
+        batch_size: int | None = None,
+        id_namespace: uuid.UUID | None = None,
+        max_errors: int | None = None,
+    ) -> None:
+        """Prepare an import for ``user``."""
+        self.user = user
+        self.batch_size = batch_size or settings.REMINDER_IMPORT_BATCH_SIZE
+        self.id_namespace = id_namespace
+        self.max_errors = (
+            settings.REMINDER_IMPORT_MAX_ERRORS if max_errors is None else max_errors
+        )
+        self.rows = 0
+        self.committed_rows = 0
+        self.created = 0
+        self.invalid = 0
+        self.errors: list[dict] = []
+        self._skipped = 0
+        self._started = time.perf_counter()
+
+    def rate(self: ReminderImporter) -> float:
+        """Return records imported or rejected per second so far."""
+        elapsed = time.perf_counter() - self._started
+        return (self.rows - self._skipped) / max(elapsed, 1e-9)
+
+    def summary(self: ReminderImporter) -> dict:
+        """Return the counters and the first ``max_errors`` errors."""
+        return {
+            "rows": self.rows,
+            "created": self.created,
+            "invalid": self.invalid,
+            "errors": self.errors,
+        }
+
+    def run(
+        self: ReminderImporter,
+        records: Iterable[dict | serializers.ValidationError],
+        *,
+        skip: int = 0,
+        on_batch: Callable[[ReminderImporter], None] | None = None,
+    ) -> None:
+        """Import ``records``, skipping the first ``skip`` already imported."""
+        serializer = ReminderSerializer()
+        self.rows = self.committed_rows = self._skipped = skip
+        self._started = time.perf_counter()
+        batch: list[Reminder] = []
+        for number, record in enumerate(records, 1):
+            if number <= skip:
+                continue
+            self.rows = number
+            try:
+                if isinstance(record, serializers.ValidationError):
+                    raise record
+                attrs = serializer.run_validation(record)
+            except serializers.ValidationError as exc:
+                self.reject(number, exc.detail)
+                continue
+            reminder = Reminder(user=self.user, **attrs)
+            if self.id_namespace is not None:
+                reminder.id = uuid.uuid5(self.id_namespace, str(number))
+            batch.append(reminder)
+            if len(batch) >= self.batch_size:
+                self.flush(batch, on_batch)
+                batch = []
+        self.flush(batch, on_batch)
+
+    def reject(self: ReminderImporter, number: int, detail: object) -> None:
+        """Count an invalid record and keep its errors if there is room."""
+        self.invalid += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({"row": number, "errors": detail})
+
+    def flush(
+        self: ReminderImporter,
+        batch: list[Reminder],
+        on_batch: Callable[[ReminderImporter], None] | None,
+    ) -> None:
+        """Insert one batch and report it."""
+        if batch:
+            created = len(batch)
+            if self.id_namespace is not None:
+                # Rows replayed after a resume exist already; the insert
+                # skips them.
+                created -= self.existing(batch)
+            Reminder.objects.bulk_create(
+                batch,
+                batch_size=settings.REMINDER_BULK_BATCH_SIZE,
+                ignore_conflicts=self.id_namespace is not None,
+            )
+            self.created += created
+            invalidate_listing(self.user.id)
+        self.committed_rows = self.rows
+        if on_batch is not None:
+            on_batch(self)
+
+    def existing(self: ReminderImporter, batch: list[Reminder]) -> int:
+        """Count the reminders of ``batch`` whose id is already taken."""
+        ids = [reminder.id for reminder in batch]
+        size = settings.REMINDER_BULK_BATCH_SIZE
+        return sum(
+            Reminder.objects.filter(id__in=ids[start : start + size]).count()
+            for start in range(0, len(ids), size)
+        )
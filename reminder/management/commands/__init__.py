@@ -0,0 +1 @@
+"""Reminder management commands."""
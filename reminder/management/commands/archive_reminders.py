@@ -0,0 +1,91 @@
+"""Archive expired reminders and purge old archived ones."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from reminder.archive import archive_batch, archive_cutoff, purge_batch
+
+if TYPE_CHECKING:
+    import datetime
+    from argparse import ArgumentParser
+    from collections.abc import Callable
+
+
+class Command(BaseCommand):
+    """Move reminders past the retention window into the archive table."""
+
+    help = "Archive expired reminders in small batches, then purge archived ones past their TTL."
+
+    def add_arguments(self: Command, parser: ArgumentParser) -> None:
+        """Add command arguments."""
+        parser.add_argument(
+            "--retention",
+            type=float,
+            help="Seconds past end_date_time before a reminder is archived.",
+        )
+        parser.add_argument(
+            "--purge-after",
+            type=float,
+            help="Seconds archived before a reminder is deleted for good.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            help="Rows moved or deleted per transaction.",
+        )
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0.0,
+            help="Seconds to sleep between batches, to leave room for other writers.",
+        )
+
+    def drain(
+        self: Command,
+        step: Callable[[datetime.datetime, int], int],
+        cutoff: datetime.datetime,
+        batch_size: int,
+        pause: float,
+    ) -> int:
+        """Run ``step`` batch after batch until a short batch."""
+        total = 0
+        while True:
+            done = step(cutoff, batch_size)
+            total += done
+            if done < batch_size:
+                return total
+            if pause:
+                time.sleep(pause)
+
+    def handle(self: Command, *_args: str, **options: float | None) -> None:
+        """Archive, then purge."""
+        now = timezone.now()
+        batch_size = options["batch_size"] or settings.REMINDER_ARCHIVE_BATCH_SIZE
+        retention = options["retention"]
+        if retention is None:
+            retention = settings.REMINDER_ARCHIVE_RETENTION
+        archived = self.drain(
+            archive_batch,
+            archive_cutoff(retention, now),
+            batch_size,
+            options["pause"],
+        )
+        self.stdout.write(f"archived={archived}")
+
+        purge_after = options["purge_after"]
+        if purge_after is None:
+            purge_after = settings.REMINDER_ARCHIVE_PURGE_AFTER
+        if purge_after is not None:
+            purged = self.drain(
+                purge_batch,
+                archive_cutoff(purge_after, now),
+                batch_size,
+                options["pause"],
+            )
+            self.stdout.write(f"purged={purged}")
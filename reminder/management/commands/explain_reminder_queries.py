@@ -0,0 +1,95 @@
+"""Print the query plans of the hot reminder queries."""
+
+from __future__ import annotations
+
+import datetime
+import uuid
+from typing import TYPE_CHECKING
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from reminder.archive import expired_reminders
+from reminder.dispatch.dispatcher import pending_reminders
+from reminder.models import Reminder
+from reminder.pagination import after_position
+from reminder.window import window_queryset
+
+if TYPE_CHECKING:
+    from argparse import ArgumentParser
+
+    from django.db.models import QuerySet
+
+
+def explained_queries(
+    user_id: int,
+    now: datetime.datetime,
+) -> dict[str, QuerySet[Reminder]]:
+    """Return the hot-path querysets keyed by a readable name."""
+    listing = Reminder.objects.filter(user_id=user_id).order_by("end_date_time", "id")
+    return {
+        "listing": listing,
+        "listing page (keyset)": listing.filter(after_position(now, uuid.UUID(int=0)))[
+            :51
+        ],
+        "upcoming for user": listing.filter(end_date_time__gte=now),
+        "window, newest first": window_queryset(
+            Reminder.objects.filter(user_id=user_id),
+            {
+                "from": now - datetime.timedelta(days=30),
+                "to": now,
+                "upcoming": False,
+                "ordering": "-end_date_time",
+                "limit": 50,
+            },
+        ),
+        "dispatcher refill": pending_reminders().filter(end_date_time__lt=now)[:500],
+        "dispatcher refill (keyset)": pending_reminders().filter(
+            after_position(now, uuid.UUID(int=0)),
+            end_date_time__lt=now,
+        )[:500],
+        "archive batch": expired_reminders(now)[:500],
+    }
+
+
+class Command(BaseCommand):
+    """Show how the database executes the reminder listing and due queries."""
+
+    help = "Print the query plan of the reminder listing and due-reminder queries."
+
+    def add_arguments(self: Command, parser: ArgumentParser) -> None:
+        """Add command arguments."""
+        parser.add_argument(
+            "--user-id",
+            type=int,
+            default=1,
+            help="User whose listing is explained.",
+        )
+        parser.add_argument(
+            "--database",
+            default="default",
+            help="Database alias to explain against.",
+        )
+        parser.add_argument(
+            "--analyze",
+            action="store_true",
+            help="Execute the queries and report actual timings (PostgreSQL and MySQL only).",
+        )
+
+    def handle(self: Command, *_args: str, **options: str | int | bool) -> None:
+        """Explain every query and print its plan."""
+        alias = options["database"]
+        if alias not in connections:
+            msg = f"Unknown database alias {alias!r}."
+            raise CommandError(msg)
+        vendor = connections[alias].vendor
+        explain_options = (
+            {"analyze": True} if options["analyze"] and vendor != "sqlite" else {}
+        )
+
+        now = datetime.datetime.now(tz=datetime.timezone.utc)
+        self.stdout.write(f"Query plans on {vendor} ({alias}):")
+        for name, queryset in explained_queries(options["user_id"], now).items():
+            self.stdout.write(self.style.MIGRATE_HEADING(f"\n== {name}"))
+            self.stdout.write(str(queryset.using(alias).query))
+            self.stdout.write(queryset.using(alias).explain(**explain_options))
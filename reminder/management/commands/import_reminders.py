@@ -0,0 +1,175 @@
+"""Import reminders from an NDJSON or CSV file."""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import json
+import time
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from reminder.importer import PARSERS, ReminderImporter
+
+if TYPE_CHECKING:
+    from argparse import ArgumentParser
+
+FINGERPRINT_BYTES = 1 << 20  # leading bytes hashed to tell files apart
+
+
+class Command(BaseCommand):
+    """Stream a file of reminders into one user's account."""
+
+    help = (
+        "Import reminders from NDJSON or CSV. Progress is checkpointed after every"
+        " batch; rerun the same command to resume an interrupted import."
+    )
+
+    def add_arguments(self: Command, parser: ArgumentParser) -> None:
+        """Add command arguments."""
+        parser.add_argument("path", type=Path, help="NDJSON or CSV file.")
+        parser.add_argument(
+            "--user",
+            required=True,
+            help="Username that will own the reminders.",
+        )
+        parser.add_argument(
+            "--import-format",
+            choices=sorted(PARSERS),
+            help="Input format, by default taken from the file extension.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            help="Records validated and inserted per batch.",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            type=Path,
+            help="Checkpoint file, by default PATH.checkpoint.",
+        )
+        parser.add_argument(
+            "--progress-interval",
+            type=float,
+            default=5.0,
+            help="Seconds between progress reports.",
+        )
+
+    def handle(self: Command, *_args: str, **options: object) -> None:
+        """Run the import."""
+        path: Path = options["path"]
+        import_format = options["import_format"] or path.suffix.lstrip(".").lower()
+        if import_format not in PARSERS:
+            msg = f"Cannot tell the format of {path}; pass --import-format."
+            raise CommandError(msg)
+        try:
+            user = User.objects.get(username=options["user"])
+        except User.DoesNotExist:
+            msg = f"User {options['user']!r} does not exist."
+            raise CommandError(msg) from None
+
+        checkpoint: Path = options["checkpoint"] or path.with_name(
+            f"{path.name}.checkpoint",
+        )
+        # Stable per user and file, so replayed rows keep their ids.
+        id_namespace = uuid.uuid5(
+            uuid.NAMESPACE_URL,
+            f"{user.pk}:{path.resolve()}:{fingerprint(path)}",
+        )
+        skip = 0
+        if checkpoint.exists():
+            skip = self.read_checkpoint(checkpoint, user, id_namespace)
+            self.stdout.write(f"Resuming after row {skip} from {checkpoint}")
+
+        importer = ReminderImporter(
+            user,
+            batch_size=options["batch_size"],
+            id_namespace=id_namespace,
+        )
+        last_report = time.monotonic()
+
+        def on_batch(importer: ReminderImporter) -> None:
+            nonlocal last_report
+            self.write_checkpoint(checkpoint, importer)
+            if time.monotonic() - last_report >= options["progress_interval"]:
+                self.report(importer)
+                last_report = time.monotonic()
+
+        with path.open(encoding="utf-8", newline="") as lines:
+            try:
+                importer.run(
+                    PARSERS[import_format](lines),
+                    skip=skip,
+                    on_batch=on_batch,
+                )
+            except csv.Error as exc:
+                msg = f"{path} is not valid CSV: {exc}"
+                raise CommandError(msg) from None
+        checkpoint.unlink(missing_ok=True)
+
+        self.report(importer)
+        for error in importer.errors:
+            self.stderr.write(f"row {error['row']}: {json.dumps(error['errors'])}")
+        if importer.invalid > len(importer.errors):
+            self.stderr.write(
+                f"... {importer.invalid - len(importer.errors)} more invalid rows",
+            )
+
+    def report(self: Command, importer: ReminderImporter) -> None:
+        """Write the progress counters and throughput."""
+        self.stdout.write(
+            f"rows={importer.rows} created={importer.created} invalid={importer.invalid}"
+            f" rate={importer.rate():.0f} rows/s",
+        )
+
+    def write_checkpoint(
+        self: Command,
+        checkpoint: Path,
+        importer: ReminderImporter,
+    ) -> None:
+        """Atomically record how far the import got."""
+        partial = checkpoint.with_name(f"{checkpoint.name}.tmp")
+        partial.write_text(
+            json.dumps(
+                {
+                    "rows": importer.rows,
+                    "user": importer.user.username,
+                    "id_namespace": str(importer.id_namespace),
+                },
+            ),
+        )
+        partial.replace(checkpoint)
+
+    def read_checkpoint(
+        self: Command,
+        checkpoint: Path,
+        user: User,
+        id_namespace: uuid.UUID,
+    ) -> int:
+        """Return the rows to skip, refusing a checkpoint of another import."""
+        state = json.loads(checkpoint.read_text())
+        if state.get("user") != user.username:
+            msg = (
+                f"{checkpoint} belongs to an import for user {state.get('user')!r};"
+                " delete it to start over."
+            )
+            raise CommandError(msg)
+        if state.get("id_namespace") != str(id_namespace):
+            msg = (
+                f"{checkpoint} belongs to an import of a different file;"
+                " delete it to start over."
+            )
+            raise CommandError(msg)
+        return state["rows"]
+
+
+def fingerprint(path: Path) -> str:
+    """Identify the contents of ``path`` by its size and a digest of its start."""
+    digest = hashlib.blake2b(digest_size=16)
+    with path.open("rb") as file:
+        digest.update(file.read(FINGERPRINT_BYTES))
+    return f"{path.stat().st_size}:{digest.hexdigest()}"
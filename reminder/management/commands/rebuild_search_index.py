@@ -0,0 +1,27 @@
+"""Rebuild the reminder title search index."""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from reminder.search import search_backend
+
+
+class Command(BaseCommand):
+    """Re-index every reminder title."""
+
+    help = (
+        "Rebuild the reminder title search index from the reminder table, e.g."
+        " after restoring a backup taken without it."
+    )
+
+    def handle(self: Command, *_args: str, **_options: object) -> None:
+        """Rebuild the index of the configured backend."""
+        backend = search_backend()
+        indexed = backend.rebuild()
+        if indexed is None:
+            self.stdout.write(
+                f"{type(backend).__name__} keeps no index; nothing to do.",
+            )
+        else:
+            self.stdout.write(f"indexed={indexed}")
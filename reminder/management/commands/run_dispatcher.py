@@ -0,0 +1,84 @@
+"""Run the due-reminder dispatcher."""
+
+from __future__ import annotations
+
+import signal
+import threading
+from typing import TYPE_CHECKING
+
+from django.core.management.base import BaseCommand
+
+from reminder.dispatch.dispatcher import Dispatcher
+
+if TYPE_CHECKING:
+    from argparse import ArgumentParser
+    from types import FrameType
+
+
+class Command(BaseCommand):
+    """Fire reminders through the configured delivery backends as they come due."""
+
+    help = "Run the due-reminder dispatcher until interrupted."
+
+    def add_arguments(self: Command, parser: ArgumentParser) -> None:
+        """Add command arguments."""
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Deliver what is due now and exit.",
+        )
+        parser.add_argument(
+            "--window",
+            type=float,
+            help="Look-ahead window in seconds.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            help="Rows loaded and delivered per batch.",
+        )
+        parser.add_argument(
+            "--report-interval",
+            type=float,
+            default=60.0,
+            help="Seconds between lag percentile reports.",
+        )
+
+    def report(self: Command, dispatcher: Dispatcher) -> None:
+        """Write the dispatcher counters and lag percentiles."""
+        stats = dispatcher.stats()
+        self.stdout.write(
+            "queued={queued} delivered={delivered} failed={failed}"
+            " lag p50={lag_p50_ms:.1f}ms p95={lag_p95_ms:.1f}ms p99={lag_p99_ms:.1f}ms".format(
+                **stats,
+            ),
+        )
+
+    def handle(self: Command, *_args: str, **options: float | bool | None) -> None:
+        """Run the dispatcher."""
+        dispatcher = Dispatcher(
+            window=options["window"],
+            batch_size=options["batch_size"],
+        )
+        try:
+            if options["once"]:
+                dispatcher.tick()
+                self.report(dispatcher)
+                return
+
+            stop = threading.Event()
+
+            def _stop(_signum: int, _frame: FrameType | None) -> None:
+                stop.set()
+
+            signal.signal(signal.SIGINT, _stop)
+            signal.signal(signal.SIGTERM, _stop)
+
+            dispatcher.run(
+                stop,
+                report=self.report,
+                report_interval=options["report_interval"],
+            )
+            self.report(dispatcher)
+        finally:
+            dispatcher.close()
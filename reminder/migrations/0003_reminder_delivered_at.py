@@ -0,0 +1,45 @@
+# Generated by Django 4.2 on 2026-10-17 06:04
+
+from django.db import migrations, models
+from django.db.models import F
+from django.utils import timezone
+
+
+def mark_past_reminders_delivered(apps, schema_editor):
+    # Reminders already due were never pending; without this the first
+    # dispatcher run would fire every one of them.
+    Reminder = apps.get_model("reminder", "Reminder")
+    Reminder.objects.filter(end_date_time__lt=timezone.now()).update(
+        delivered_at=F("end_date_time"),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reminder", "0002_reminder_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="reminder",
+            name="delivered_at",
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(
+            mark_past_reminders_delivered,
+            migrations.RunPython.noop,
+        ),
+        migrations.AddIndex(
+            model_name="reminder",
+            index=models.Index(
+                condition=models.Q(("delivered_at__isnull", True)),
+                fields=["end_date_time", "id"],
+                name="reminder_pending_idx",
+            ),
+        ),
+        migrations.RemoveIndex(
+            model_name="reminder",
+            name="reminder_end_idx",
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 4.2 on 2026-10-17 06:40
+
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("reminder", "0003_reminder_delivered_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="reminder",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True, default=django.utils.timezone.now
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddIndex(
+            model_name="reminder",
+            index=models.Index(
+                fields=["user", "updated_at"], name="reminder_user_updated_idx"
+            ),
+        ),
+    ]
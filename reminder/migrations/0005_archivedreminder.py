@@ -0,0 +1,58 @@
+# Generated by Django 4.2 on 2026-10-17 07:08
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("reminder", "0004_reminder_updated_at"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedReminder",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(editable=False, primary_key=True, serialize=False),
+                ),
+                ("reminder_title", models.CharField(max_length=20)),
+                ("end_date_time", models.DateTimeField()),
+                ("delivered_at", models.DateTimeField(blank=True, null=True)),
+                ("archived_at", models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="reminder",
+            index=models.Index(fields=["end_date_time", "id"], name="reminder_end_idx"),
+        ),
+        migrations.AddField(
+            model_name="archivedreminder",
+            name="user",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="archivedreminder",
+            index=models.Index(
+                fields=["user", "end_date_time", "id"], name="archived_user_end_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="archivedreminder",
+            index=models.Index(
+                fields=["user", "archived_at"], name="archived_user_archived_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="archivedreminder",
+            index=models.Index(fields=["archived_at"], name="archived_archived_at_idx"),
+        ),
+    ]
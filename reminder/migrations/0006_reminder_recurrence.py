@@ -0,0 +1,29 @@
+# Generated by Django 4.2 on 2026-10-17 07:11
+
+from django.db import migrations, models
+import reminder.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reminder", "0005_archivedreminder"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="reminder",
+            name="recurrence",
+            field=models.CharField(
+                blank=True,
+                default="",
+                max_length=100,
+                validators=[reminder.models.validate_recurrence],
+            ),
+        ),
+        migrations.AddField(
+            model_name="reminder",
+            name="recurrence_start",
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+    ]
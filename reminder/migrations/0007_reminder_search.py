@@ -0,0 +1,80 @@
+from django.db import migrations
+
+# SQLite drops these triggers whenever a later migration remakes
+# reminder_reminder; such migrations must recreate them (test_search checks).
+
+CREATE_SQL = [
+    """
+    CREATE VIRTUAL TABLE reminder_search USING fts5(
+        reminder_title,
+        owner,
+        reminder_id,
+        tokenize = "unicode61 remove_diacritics 2",
+        prefix = "2 3"
+    )
+    """,
+    """
+    CREATE TRIGGER reminder_search_insert AFTER INSERT ON reminder_reminder BEGIN
+        INSERT INTO reminder_search (reminder_title, owner, reminder_id)
+        VALUES (new.reminder_title, 'u' || new.user_id, new.id);
+    END
+    """,
+    """
+    CREATE TRIGGER reminder_search_delete AFTER DELETE ON reminder_reminder BEGIN
+        DELETE FROM reminder_search
+        WHERE reminder_search MATCH 'reminder_id:"' || old.id || '"';
+    END
+    """,
+    """
+    CREATE TRIGGER reminder_search_update
+    AFTER UPDATE OF reminder_title, user_id ON reminder_reminder BEGIN
+        DELETE FROM reminder_search
+        WHERE reminder_search MATCH 'reminder_id:"' || old.id || '"';
+        INSERT INTO reminder_search (reminder_title, owner, reminder_id)
+        VALUES (new.reminder_title, 'u' || new.user_id, new.id);
+    END
+    """,
+    """
+    INSERT INTO reminder_search (reminder_title, owner, reminder_id)
+    SELECT reminder_title, 'u' || user_id, id FROM reminder_reminder
+    """,
+]
+
+DROP_SQL = [
+    "DROP TRIGGER IF EXISTS reminder_search_update",
+    "DROP TRIGGER IF EXISTS reminder_search_delete",
+    "DROP TRIGGER IF EXISTS reminder_search_insert",
+    "DROP TABLE IF EXISTS reminder_search",
+]
+
+
+def fts5_available(schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return False
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("PRAGMA compile_options")
+        return ("ENABLE_FTS5",) in cursor.fetchall()
+
+
+def create_search_index(apps, schema_editor):
+    # Other databases search with the icontains fallback and need no table.
+    if fts5_available(schema_editor):
+        for sql in CREATE_SQL:
+            schema_editor.execute(sql)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "sqlite":
+        for sql in DROP_SQL:
+            schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reminder", "0006_reminder_recurrence"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -4,12 +4,19 @@ from __future__ import annotations
 
 import datetime
 import uuid
+from typing import TYPE_CHECKING, ClassVar
 
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
 from django.db import models
 
+from reminder.recurrence import Recurrence
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 REMINDER_TITLE_MAXLEN = 20
+REMINDER_RECURRENCE_MAXLEN = 100
 
 
 def validate_future_datetime(value: datetime.datetime) -> None:
@@ -21,14 +28,143 @@ def validate_future_datetime(value: datetime.datetime) -> None:
         raise ValidationError("Date cannot be in the past")
 
 
+def validate_recurrence(value: str) -> None:
+    """Recurrence rule validator function."""
+    try:
+        Recurrence.parse(value)
+    except ValueError as exc:
+        raise ValidationError(str(exc)) from None
+
+
+def occurring_between(since: datetime.datetime, before: datetime.datetime) -> models.Q:
+    """Match reminders with an occurrence that may fall in ``[since, before)``."""
+    one_off = models.Q(
+        recurrence="",
+        end_date_time__gte=since,
+        end_date_time__lt=before,
+    )
+    # A finished series has delivered_at set and ends at its last occurrence.
+    series = (
+        ~models.Q(recurrence="")
+        & models.Q(recurrence_start__lt=before)
+        & (models.Q(delivered_at__isnull=True) | models.Q(end_date_time__gte=since))
+    )
+    return one_off | series
+
+
 class Reminder(models.Model):
     """Reminder model to store the title and end-datetime of event."""
 
     id = models.UUIDField(editable=False, primary_key=True, default=uuid.uuid4)
-    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    # Lookups by user are served by the composite index below.
+    user = models.ForeignKey(User, on_delete=models.CASCADE, db_index=False)
     reminder_title = models.CharField(max_length=REMINDER_TITLE_MAXLEN)
     end_date_time = models.DateTimeField(validators=[validate_future_datetime])
+    # Set by the dispatcher once the reminder has been handed to the backends.
+    delivered_at = models.DateTimeField(null=True, blank=True, editable=False)
+    # Feeds the listing ETag; queryset.update() callers must set it themselves.
+    updated_at = models.DateTimeField(auto_now=True)
+    # RRULE-style rule, blank for a one-off reminder. A recurring reminder is
+    # one row: end_date_time is its next pending occurrence and
+    # recurrence_start its first.
+    recurrence = models.CharField(
+        max_length=REMINDER_RECURRENCE_MAXLEN,
+        blank=True,
+        default="",
+        validators=[validate_recurrence],
+    )
+    recurrence_start = models.DateTimeField(null=True, blank=True, editable=False)
+
+    class Meta:
+        """METAdata."""
+
+        indexes: ClassVar = [
+            # Per-user listing, ordered and keyset-paginated by (end_date_time, id).
+            models.Index(
+                fields=["user", "end_date_time", "id"],
+                name="reminder_user_end_idx",
+            ),
+            # Per-user change marker (COUNT, MAX(updated_at)) for the listing ETag.
+            models.Index(
+                fields=["user", "updated_at"],
+                name="reminder_user_updated_idx",
+            ),
+            # Expired reminders across all users, moved out by archive_reminders.
+            models.Index(fields=["end_date_time", "id"], name="reminder_end_idx"),
+            # Pending reminders across all users, scanned by the dispatcher.
+            # Backends without partial index support skip it.
+            models.Index(
+                fields=["end_date_time", "id"],
+                name="reminder_pending_idx",
+                condition=models.Q(delivered_at__isnull=True),
+            ),
+        ]
 
     def __str__(self: Reminder) -> str:
         """Reminder object string representation."""
         return f"{self.reminder_title} - {self.id}"
+
+    def occurrences(
+        self: Reminder,
+        since: datetime.datetime,
+        before: datetime.datetime,
+    ) -> Iterator[datetime.datetime]:
+        """Yield the occurrences in ``[since, before)``, computed from the rule."""
+        if not self.recurrence:
+            if since <= self.end_date_time < before:
+                yield self.end_date_time
+            return
+        yield from Recurrence.parse(self.recurrence).occurrences(
+            self.recurrence_start or self.end_date_time,
+            since,
+            before,
+        )
+
+    def next_occurrence(
+        self: Reminder,
+        now: datetime.datetime,
+    ) -> datetime.datetime | None:
+        """Return the first occurrence after ``end_date_time`` and ``now``.
+
+        ``None`` for a one-off reminder or a finished series. Occurrences
+        missed while nothing was dispatching are skipped, not replayed.
+        """
+        if not self.recurrence:
+            return None
+        return Recurrence.parse(self.recurrence).after(
+            self.recurrence_start or self.end_date_time,
+            max(self.end_date_time, now),
+        )
+
+
+class ArchivedReminder(models.Model):
+    """Expired reminder moved out of ``Reminder`` by ``archive_reminders``."""
+
+    id = models.UUIDField(editable=False, primary_key=True)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, db_index=False)
+    reminder_title = models.CharField(max_length=REMINDER_TITLE_MAXLEN)
+    end_date_time = models.DateTimeField()
+    delivered_at = models.DateTimeField(null=True, blank=True)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        """METAdata."""
+
+        indexes: ClassVar = [
+            # Per-user archived listing, ordered like the live one.
+            models.Index(
+                fields=["user", "end_date_time", "id"],
+                name="archived_user_end_idx",
+            ),
+            # Per-user change marker (COUNT, MAX(archived_at)) for the ETag.
+            models.Index(
+                fields=["user", "archived_at"],
+                name="archived_user_archived_idx",
+            ),
+            # Purge of rows archived before the TTL.
+            models.Index(fields=["archived_at"], name="archived_archived_at_idx"),
+        ]
+
+    def __str__(self: ArchivedReminder) -> str:
+        """Return the archived reminder string representation."""
+        return f"{self.reminder_title} - {self.id} (archived)"
@@ -0,0 +1,176 @@
+"""Keyset (cursor) pagination for reminder listings."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import datetime
+import json
+import uuid
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.db.models import Q
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+    from rest_framework.request import Request
+    from rest_framework.views import APIView
+
+    from reminder.models import Reminder
+
+
+def after_position(end_date_time: datetime.datetime, reminder_id: uuid.UUID) -> Q:
+    """Match rows strictly after ``(end_date_time, id)`` in keyset order."""
+    # The redundant ``>=`` bound lets the planner range-scan the index.
+    return Q(end_date_time__gte=end_date_time) & (
+        Q(end_date_time__gt=end_date_time) | Q(id__gt=reminder_id)
+    )
+
+
+def parse_position(position: object) -> tuple[datetime.datetime, uuid.UUID]:
+    """Parse a decoded cursor, raising ``ValueError`` if it is malformed."""
+    match position:
+        case [str() as end_date_time, str() as reminder_id]:
+            parsed = datetime.datetime.fromisoformat(end_date_time)
+        case _:
+            raise ValueError(position)
+    # Naive datetimes cannot be compared with the stored aware ones.
+    if parsed.utcoffset() is None:
+        raise ValueError(end_date_time)
+    return parsed, uuid.UUID(hex=reminder_id)
+
+
+class ReminderCursorPagination(BasePagination):
+    """Keyset pagination ordered by ``(end_date_time, id)``.
+
+    Each page is fetched with a ``WHERE (end_date_time, id) > cursor`` range
+    condition instead of an ``OFFSET``, so page 1000 costs the same as page 1.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    ordering = ("end_date_time", "id")
+
+    def is_requested(self: ReminderCursorPagination, request: Request) -> bool:
+        """Check for the opt-in ``cursor`` or ``page_size`` query params."""
+        params = request.query_params
+        return self.cursor_query_param in params or self.page_size_query_param in params
+
+    def get_page_size(self: ReminderCursorPagination, request: Request) -> int:
+        """Return the requested page size, clamped to ``REMINDER_MAX_PAGE_SIZE``."""
+        raw = request.query_params.get(self.page_size_query_param)
+        if not raw:
+            return settings.REMINDER_PAGE_SIZE
+        try:
+            page_size = int(raw)
+        except ValueError:
+            raise ValidationError(  # noqa: B904
+                {self.page_size_query_param: "A valid integer is required."},
+                code=status.HTTP_400_BAD_REQUEST,
+            )
+        if page_size < 1:
+            raise ValidationError(
+                {
+                    self.page_size_query_param: "Ensure this value is greater than or equal to 1.",
+                },
+                code=status.HTTP_400_BAD_REQUEST,
+            )
+        return min(page_size, settings.REMINDER_MAX_PAGE_SIZE)
+
+    @staticmethod
+    def encode_cursor(end_date_time: datetime.datetime, reminder_id: uuid.UUID) -> str:
+        """Encode the position of a row as an opaque cursor."""
+        raw = json.dumps([end_date_time.isoformat(), reminder_id.hex])
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    def decode_cursor(
+        self: ReminderCursorPagination,
+        cursor: str,
+    ) -> tuple[datetime.datetime, uuid.UUID]:
+        """Decode an opaque cursor back to its ``(end_date_time, id)`` position."""
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            return parse_position(json.loads(base64.urlsafe_b64decode(padded)))
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise ValidationError(  # noqa: B904
+                {self.cursor_query_param: "Invalid cursor."},
+                code=status.HTTP_400_BAD_REQUEST,
+            )
+
+    def page_queryset(
+        self: ReminderCursorPagination,
+        queryset: QuerySet[Reminder],
+        request: Request,
+    ) -> QuerySet[Reminder]:
+        """Return the unevaluated query for the page following the requested cursor."""
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            end_date_time, reminder_id = self.decode_cursor(cursor)
+            queryset = queryset.filter(after_position(end_date_time, reminder_id))
+        # One extra row tells us whether a next page exists without a COUNT.
+        return queryset.order_by(*self.ordering)[: self.page_size + 1]
+
+    def set_page(
+        self: ReminderCursorPagination,
+        rows: list[Reminder],
+    ) -> list[Reminder]:
+        """Trim the look-ahead row and record the continuation cursor.
+
+        Rows may be model instances or named ``values_list`` rows; only
+        ``end_date_time`` and ``id`` are read.
+        """
+        self.has_next = len(rows) > self.page_size
+        page = rows[: self.page_size]
+        self.next_cursor = (
+            self.encode_cursor(page[-1].end_date_time, page[-1].id)
+            if self.has_next
+            else None
+        )
+        return page
+
+    def paginate_queryset(
+        self: ReminderCursorPagination,
+        queryset: QuerySet[Reminder],
+        request: Request,
+        view: APIView | None = None,  # noqa: ARG002
+    ) -> list[Reminder]:
+        """Return the page of reminders following the requested cursor."""
+        return self.set_page(list(self.page_queryset(queryset, request)))
+
+    async def apaginate_queryset(
+        self: ReminderCursorPagination,
+        queryset: QuerySet[Reminder],
+        request: Request,
+        view: APIView | None = None,  # noqa: ARG002
+    ) -> list[Reminder]:
+        """Async version of :meth:`paginate_queryset`."""
+        return self.set_page(
+            [row async for row in self.page_queryset(queryset, request)],
+        )
+
+    def get_next_link(self: ReminderCursorPagination) -> str | None:
+        """Absolute URL of the next page, or ``None`` on the last page."""
+        if self.next_cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_data(self: ReminderCursorPagination, data: list) -> dict:
+        """Wrap a serialized page with its continuation cursor."""
+        return {
+            "next": self.get_next_link(),
+            "next_cursor": self.next_cursor,
+            "results": data,
+        }
+
+    def get_paginated_response(self: ReminderCursorPagination, data: list) -> Response:
+        """Return a response for a serialized page."""
+        return Response(data=self.get_paginated_data(data), status=status.HTTP_200_OK)
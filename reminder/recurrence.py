@@ -0,0 +1,200 @@
+"""RRULE-style recurrence rules, expanded lazily.
+
+A recurring reminder stores its rule once, as text such as
+``FREQ=WEEKLY;INTERVAL=2;COUNT=10``. Occurrences are never stored as rows.
+They are computed on demand for a time window. Daily and weekly rules jump
+straight to the first occurrence in the window, so the cost depends only on
+how many occurrences the window holds. The supported subset of RFC 5545 is
+``FREQ`` (``DAILY``, ``WEEKLY`` or ``MONTHLY``), ``INTERVAL``, ``COUNT`` and
+``UNTIL``. Occurrences are computed in UTC.
+"""
+
+from __future__ import annotations
+
+import calendar
+import datetime
+import heapq
+from itertools import count as counter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+FREQUENCIES = {"DAILY": 1, "WEEKLY": 7, "MONTHLY": None}
+UNTIL_FORMAT = "%Y%m%dT%H%M%SZ"
+
+
+class Recurrence:
+    """A parsed recurrence rule."""
+
+    __slots__ = ("freq", "interval", "count", "until")
+
+    def __init__(
+        self: Recurrence,
+        freq: str,
+        interval: int = 1,
+        count: int | None = None,
+        until: datetime.datetime | None = None,
+    ) -> None:
+        """Check and store the rule parts."""
+        if freq not in FREQUENCIES:
+            msg = f"FREQ must be one of {', '.join(FREQUENCIES)}."
+            raise ValueError(msg)
+        if interval < 1:
+            msg = "INTERVAL must be at least 1."
+            raise ValueError(msg)
+        if count is not None and count < 1:
+            msg = "COUNT must be at least 1."
+            raise ValueError(msg)
+        if count is not None and until is not None:
+            msg = "COUNT and UNTIL cannot be combined."
+            raise ValueError(msg)
+        self.freq = freq
+        self.interval = interval
+        self.count = count
+        self.until = until
+
+    @classmethod
+    def parse(cls: type[Recurrence], text: str) -> Recurrence:
+        """Parse ``FREQ=...;INTERVAL=...;COUNT=...|UNTIL=...``."""
+        text = text.strip()
+        if text[:6].upper() == "RRULE:":
+            text = text[6:]
+        parts: dict[str, str] = {}
+        for part in text.split(";"):
+            name, sep, value = part.partition("=")
+            name = name.strip().upper()
+            if not sep or name in parts:
+                msg = f"Invalid rule part {part!r}."
+                raise ValueError(msg)
+            parts[name] = value.strip().upper()
+        unknown = set(parts) - {"FREQ", "INTERVAL", "COUNT", "UNTIL"}
+        if unknown:
+            msg = f"Unsupported rule parts: {', '.join(sorted(unknown))}."
+            raise ValueError(msg)
+        if "FREQ" not in parts:
+            msg = "FREQ is required."
+            raise ValueError(msg)
+        try:
+            interval = int(parts.get("INTERVAL", "1"))
+            count = int(parts["COUNT"]) if "COUNT" in parts else None
+        except ValueError:
+            msg = "INTERVAL and COUNT must be integers."
+            raise ValueError(msg) from None
+        until = None
+        if "UNTIL" in parts:
+            try:
+                until = datetime.datetime.strptime(
+                    parts["UNTIL"],
+                    UNTIL_FORMAT,
+                ).replace(
+                    tzinfo=datetime.timezone.utc,
+                )
+            except ValueError:
+                msg = "UNTIL must look like 20301231T235959Z."
+                raise ValueError(msg) from None
+        return cls(parts["FREQ"], interval, count, until)
+
+    def __str__(self: Recurrence) -> str:
+        """Return the canonical rule text."""
+        text = f"FREQ={self.freq};INTERVAL={self.interval}"
+        if self.count is not None:
+            text += f";COUNT={self.count}"
+        if self.until is not None:
+            text += (
+                f";UNTIL={self.until.astimezone(datetime.timezone.utc):{UNTIL_FORMAT}}"
+            )
+        return text
+
+    def _nth(
+        self: Recurrence,
+        start: datetime.datetime,
+        n: int,
+    ) -> datetime.datetime | None:
+        # The n-th period from start, or None for a month without that day.
+        days = FREQUENCIES[self.freq]
+        if days is not None:
+            return start + datetime.timedelta(days=days * self.interval * n)
+        month = start.month - 1 + self.interval * n
+        year, month = start.year + month // 12, month % 12 + 1
+        if start.day > calendar.monthrange(year, month)[1]:
+            return None
+        return start.replace(year=year, month=month)
+
+    def _first_period(
+        self: Recurrence,
+        start: datetime.datetime,
+        since: datetime.datetime,
+    ) -> int:
+        # Index of the first period that can fall at or after since.
+        if since <= start:
+            return 0
+        days = FREQUENCIES[self.freq]
+        if days is not None:
+            step = datetime.timedelta(days=days * self.interval)
+            return -((start - since) // step)
+        months = (since.year - start.year) * 12 + since.month - start.month
+        return max(0, months // self.interval)
+
+    def occurrences(
+        self: Recurrence,
+        start: datetime.datetime,
+        since: datetime.datetime | None = None,
+        before: datetime.datetime | None = None,
+    ) -> Iterator[datetime.datetime]:
+        """Yield the occurrences of a series from ``start`` in ``[since, before)``.
+
+        Without ``before`` an endless rule yields forever; take what is needed.
+        """
+        first = self._first_period(start, since) if since is not None else 0
+        # Periods skipped by the jump still count towards COUNT.
+        if self.count is not None:
+            skipped = (
+                first
+                if FREQUENCIES[self.freq] is not None
+                or start.day <= 28  # noqa: PLR2004
+                else sum(self._nth(start, n) is not None for n in range(first))
+            )
+            remaining = self.count - skipped
+        for n in counter(first):
+            if self.count is not None and remaining <= 0:
+                return
+            occurrence = self._nth(start, n)
+            if occurrence is None:
+                continue
+            if self.count is not None:
+                remaining -= 1
+            if (self.until is not None and occurrence > self.until) or (
+                before is not None and occurrence >= before
+            ):
+                return
+            if since is None or occurrence >= since:
+                yield occurrence
+
+    def after(
+        self: Recurrence,
+        start: datetime.datetime,
+        moment: datetime.datetime,
+    ) -> datetime.datetime | None:
+        """Return the first occurrence strictly after ``moment``, if any."""
+        upcoming = self.occurrences(
+            start,
+            since=moment + datetime.timedelta(microseconds=1),
+        )
+        return next(upcoming, None)
+
+
+def _tagged(
+    key: object,
+    occurrences: Iterator[datetime.datetime],
+) -> Iterator[tuple[datetime.datetime, object]]:
+    for when in occurrences:
+        yield when, key
+
+
+def merge_occurrences(
+    series: Iterable[tuple[object, Iterator[datetime.datetime]]],
+) -> Iterator[tuple[datetime.datetime, object]]:
+    """Merge per-series occurrence streams into one ``(when, key)`` stream in time order."""
+    streams = [_tagged(key, occurrences) for key, occurrences in series]
+    return heapq.merge(*streams, key=lambda item: item[0])
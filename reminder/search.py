@@ -0,0 +1,184 @@
+"""Prefix search over reminder titles.
+
+On SQLite the titles are indexed in the FTS5 table ``reminder_search``,
+kept in sync by triggers on ``reminder_reminder`` (see migration 0007), so
+every insert, delete and title change is reflected whichever code path made
+it. SQLite drops the triggers whenever a migration remakes the table, so
+:func:`restore_search_triggers` recreates any that are missing, and
+re-indexes, after every ``migrate``. Each row also carries an owner token, so a search only ever matches the
+searching user's reminders. Other databases fall back to an ``icontains``
+scan; point ``REMINDER_SEARCH_BACKEND`` at another backend to replace it.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import re
+from typing import TYPE_CHECKING, ClassVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connection, connections, transaction
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+
+from reminder.models import Reminder
+
+if TYPE_CHECKING:
+    from django.contrib.auth.models import User
+    from django.db.models import QuerySet
+
+logger = logging.getLogger(__name__)
+
+# Word characters as the unicode61 tokenizer sees them; "_" separates words.
+WORD_RE = re.compile(r"[^\W_]+")
+
+
+def search_terms(query: str) -> list[str]:
+    """Split a search query into lower-cased words."""
+    return [word.lower() for word in WORD_RE.findall(query)]
+
+
+class BaseSearchBackend:
+    """Base class for title search backends."""
+
+    def search(
+        self: BaseSearchBackend,
+        user: User,
+        terms: list[str],
+    ) -> QuerySet[Reminder]:
+        """Return the reminders of ``user`` with a title word starting with every term."""
+        raise NotImplementedError
+
+    def rebuild(self: BaseSearchBackend) -> int | None:
+        """Rebuild the index from the reminder table; return the rows indexed, or ``None`` if there is no index."""
+        return None
+
+
+class IcontainsSearchBackend(BaseSearchBackend):
+    """Unindexed fallback: every term must appear somewhere in the title."""
+
+    def search(
+        self: IcontainsSearchBackend,
+        user: User,
+        terms: list[str],
+    ) -> QuerySet[Reminder]:
+        """Scan the user's titles with ``icontains``."""
+        reminders = Reminder.objects.filter(user=user)
+        for term in terms:
+            reminders = reminders.filter(reminder_title__icontains=term)
+        return reminders
+
+
+class FTS5SearchBackend(BaseSearchBackend):
+    """SQLite FTS5 index with prefix indexes for two and three letter prefixes."""
+
+    table = "reminder_search"
+    # The sync triggers, as created by migration 0007.
+    triggers: ClassVar[dict[str, str]] = {
+        "reminder_search_insert": """
+            CREATE TRIGGER reminder_search_insert AFTER INSERT ON reminder_reminder BEGIN
+                INSERT INTO reminder_search (reminder_title, owner, reminder_id)
+                VALUES (new.reminder_title, 'u' || new.user_id, new.id);
+            END
+        """,
+        "reminder_search_delete": """
+            CREATE TRIGGER reminder_search_delete AFTER DELETE ON reminder_reminder BEGIN
+                DELETE FROM reminder_search
+                WHERE reminder_search MATCH 'reminder_id:"' || old.id || '"';
+            END
+        """,
+        "reminder_search_update": """
+            CREATE TRIGGER reminder_search_update
+            AFTER UPDATE OF reminder_title, user_id ON reminder_reminder BEGIN
+                DELETE FROM reminder_search
+                WHERE reminder_search MATCH 'reminder_id:"' || old.id || '"';
+                INSERT INTO reminder_search (reminder_title, owner, reminder_id)
+                VALUES (new.reminder_title, 'u' || new.user_id, new.id);
+            END
+        """,
+    }
+
+    @staticmethod
+    def match_expression(user_id: int, terms: list[str]) -> str:
+        """Build an FTS5 query for the owner token and a prefix match per term."""
+        # Terms are quoted as strings, so FTS5 operators in them are inert.
+        prefixes = " AND ".join(
+            '"{}"*'.format(term.replace('"', '""')) for term in terms
+        )
+        return f'owner:"u{user_id}" AND reminder_title:({prefixes})'
+
+    def search(
+        self: FTS5SearchBackend,
+        user: User,
+        terms: list[str],
+    ) -> QuerySet[Reminder]:
+        """Look the ids up in the index, then fetch them by primary key."""
+        # The owner token already restricts matches to the user. Filtering on
+        # user_id as well would let SQLite walk the user's whole listing
+        # index instead of starting from the few matching ids.
+        return Reminder.objects.filter(
+            id__in=RawSQL(  # noqa: S611
+                f"SELECT reminder_id FROM {self.table} WHERE {self.table} MATCH %s",  # noqa: S608
+                [self.match_expression(user.id, terms)],
+            ),
+        )
+
+    def rebuild(self: FTS5SearchBackend, using: str = DEFAULT_DB_ALIAS) -> int:
+        """Re-index every reminder in one transaction."""
+        with transaction.atomic(using), connections[using].cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table}")  # noqa: S608
+            cursor.execute(
+                f"INSERT INTO {self.table} (reminder_title, owner, reminder_id)"  # noqa: S608
+                " SELECT reminder_title, 'u' || user_id, id FROM reminder_reminder",
+            )
+            return cursor.rowcount
+
+
+@functools.cache
+def sqlite_has_fts5() -> bool:
+    """Check whether the linked SQLite library was built with FTS5."""
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA compile_options")
+        return ("ENABLE_FTS5",) in cursor.fetchall()
+
+
+def search_backend() -> BaseSearchBackend:
+    """Return the configured backend, by default FTS5 on SQLite and ``icontains`` elsewhere."""
+    if settings.REMINDER_SEARCH_BACKEND is not None:
+        return import_string(settings.REMINDER_SEARCH_BACKEND)()
+    if connection.vendor == "sqlite" and sqlite_has_fts5():
+        return FTS5SearchBackend()
+    return IcontainsSearchBackend()
+
+
+def restore_search_triggers(using: str = DEFAULT_DB_ALIAS, **_kwargs: object) -> None:
+    """``post_migrate`` receiver that recreates lost sync triggers and re-indexes."""
+    db = connections[using]
+    if db.vendor != "sqlite":
+        return
+    backend = FTS5SearchBackend
+    with db.cursor() as cursor:
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name = %s",
+            [backend.table],
+        )
+        if cursor.fetchone() is None:
+            # Migration 0007 not applied, or SQLite without FTS5.
+            return
+        cursor.execute(
+            "SELECT name FROM sqlite_master"
+            " WHERE type = 'trigger' AND tbl_name = 'reminder_reminder'",
+        )
+        missing = sorted(backend.triggers.keys() - {row[0] for row in cursor})
+        if not missing:
+            return
+        for name in missing:
+            cursor.execute(backend.triggers[name])
+    # Writes made while the triggers were gone never reached the index.
+    indexed = backend().rebuild(using)
+    logger.warning(
+        "Recreated search triggers %s and re-indexed %d reminders.",
+        ", ".join(missing),
+        indexed,
+    )
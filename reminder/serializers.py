@@ -1,8 +1,41 @@
 """Reminder Model serializer."""
 
-from rest_framework import serializers
+from __future__ import annotations
 
-from .models import Reminder
+import datetime
+from typing import TYPE_CHECKING, ClassVar
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+from .models import REMINDER_TITLE_MAXLEN, ArchivedReminder, Reminder
+from .recurrence import Recurrence
+from .search import search_terms
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+    from django.db.models import QuerySet
+
+
+class ReminderListSerializer(serializers.ListSerializer):
+    """Create many reminders with batched ``bulk_create`` in one transaction."""
+
+    def create(
+        self: ReminderListSerializer,
+        validated_data: list[dict],
+    ) -> list[Reminder]:
+        """Insert every validated reminder."""
+        reminders = [Reminder(**attrs) for attrs in validated_data]
+        with transaction.atomic():
+            Reminder.objects.bulk_create(
+                reminders,
+                batch_size=settings.REMINDER_BULK_BATCH_SIZE,
+            )
+        return reminders
 
 
 class ReminderSerializer(serializers.ModelSerializer):
@@ -13,3 +46,214 @@ class ReminderSerializer(serializers.ModelSerializer):
 
         model = Reminder
         fields = "__all__"
+        # The owner is taken from the request, never from the payload.
+        read_only_fields: ClassVar = ["user"]
+        list_serializer_class = ReminderListSerializer
+
+    def validate(self: ReminderSerializer, attrs: dict) -> dict:
+        """Store a recurrence in canonical form, starting at ``end_date_time``."""
+        if attrs.get("recurrence"):
+            recurrence = Recurrence.parse(attrs["recurrence"])
+            if (
+                recurrence.until is not None
+                and recurrence.until < attrs["end_date_time"]
+            ):
+                raise serializers.ValidationError(
+                    {"recurrence": "UNTIL must not be before end_date_time."},
+                )
+            attrs["recurrence"] = str(recurrence)
+            attrs["recurrence_start"] = attrs["end_date_time"]
+        return attrs
+
+
+class ArchivedReminderSerializer(serializers.ModelSerializer):
+    """Read-only archived reminder serializer."""
+
+    class Meta:
+        """METAdata."""
+
+        model = ArchivedReminder
+        fields = "__all__"
+
+
+def _iso_datetime(tz: datetime.tzinfo | None) -> Callable[[datetime.datetime], str]:
+    # DateTimeField.to_representation with the default ISO 8601 format.
+    def convert(value: datetime.datetime) -> str:
+        if tz is not None:
+            value = value.astimezone(tz)
+        value = value.isoformat()
+        return value[:-6] + "Z" if value.endswith("+00:00") else value
+
+    return convert
+
+
+class FastReminderSerializer:
+    """Read-only fast path for ``ReminderSerializer(many=True).data``.
+
+    Rows are fetched with ``values_list`` and converted column by column,
+    skipping model instances and per-row field objects. Columns and key
+    order are taken from ``serializer_class``, so the output stays
+    identical when fields change. UUIDs and datetimes get specialised
+    converters; any other field type falls back to its ``to_representation``.
+    """
+
+    def __init__(
+        self: FastReminderSerializer,
+        serializer_class: type[serializers.ModelSerializer] = ReminderSerializer,
+    ) -> None:
+        """Derive the columns and converters from ``serializer_class``."""
+        model = serializer_class.Meta.model
+        self.names: list[str] = []
+        self.columns: list[str] = []
+        self._fields: list[serializers.Field] = []
+        for name, field in serializer_class().fields.items():
+            self.names.append(name)
+            self._fields.append(field)
+            model_field = model._meta.get_field(field.source)  # noqa: SLF001
+            self.columns.append(model_field.attname)
+
+    def rows(
+        self: FastReminderSerializer,
+        queryset: QuerySet,
+        *,
+        named: bool = False,
+    ) -> QuerySet:
+        """Return ``queryset`` as ``values_list`` rows in column order."""
+        return queryset.values_list(*self.columns, named=named)
+
+    def _converters(self: FastReminderSerializer) -> list[Callable | None]:
+        tz = timezone.get_current_timezone() if settings.USE_TZ else None
+        converters: list[Callable | None] = []
+        for field in self._fields:
+            if (
+                isinstance(field, serializers.DateTimeField)
+                and getattr(field, "format", api_settings.DATETIME_FORMAT) == ISO_8601
+                and not hasattr(field, "timezone")
+            ):
+                converters.append(_iso_datetime(tz))
+            elif (
+                isinstance(field, serializers.UUIDField)
+                and field.uuid_format == "hex_verbose"
+            ):
+                converters.append(str)
+            elif isinstance(field, serializers.CharField) or (
+                isinstance(field, serializers.PrimaryKeyRelatedField)
+                and field.pk_field is None
+            ):
+                # The raw column already is the representation.
+                converters.append(None)
+            else:
+                converters.append(field.to_representation)
+        return converters
+
+    def to_representation(
+        self: FastReminderSerializer,
+        rows: Iterable[Sequence],
+    ) -> list[dict]:
+        """Convert ``values_list`` rows into serialized dictionaries."""
+        names = self.names
+        converters = self._converters()
+        return [
+            {
+                name: value if convert is None or value is None else convert(value)
+                for name, convert, value in zip(names, converters, row)
+            }
+            for row in rows
+        ]
+
+
+class OccurrenceWindowSerializer(serializers.Serializer):
+    """``from`` and ``to`` bounds of a time window, at most ``REMINDER_OCCURRENCE_MAX_WINDOW`` days long."""
+
+    to = serializers.DateTimeField()
+
+    def get_fields(self: OccurrenceWindowSerializer) -> dict[str, serializers.Field]:
+        """Add ``from``, which is a keyword and cannot be declared as an attribute."""
+        return {"from": serializers.DateTimeField(), **super().get_fields()}
+
+    def validate(self: OccurrenceWindowSerializer, attrs: dict) -> dict:
+        """Require a non-empty, bounded window."""
+        if attrs["to"] <= attrs["from"]:
+            raise serializers.ValidationError({"to": "Must be after from."})
+        if attrs["to"] - attrs["from"] > datetime.timedelta(
+            days=settings.REMINDER_OCCURRENCE_MAX_WINDOW,
+        ):
+            raise serializers.ValidationError(
+                {
+                    "to": f"The window cannot exceed {settings.REMINDER_OCCURRENCE_MAX_WINDOW} days.",
+                },
+            )
+        return attrs
+
+
+class ListingWindowSerializer(serializers.Serializer):
+    """Optional ``from``/``to`` bounds, ``upcoming``, ``limit`` and ``ordering`` of a listing."""
+
+    to = serializers.DateTimeField(required=False)
+    upcoming = serializers.BooleanField(required=False, default=False)
+    limit = serializers.IntegerField(required=False, min_value=1)
+    ordering = serializers.ChoiceField(
+        choices=["end_date_time", "-end_date_time"],
+        required=False,
+    )
+
+    def get_fields(self: ListingWindowSerializer) -> dict[str, serializers.Field]:
+        """Add ``from``, which is a keyword and cannot be declared as an attribute."""
+        return {
+            "from": serializers.DateTimeField(required=False),
+            **super().get_fields(),
+        }
+
+    def validate_limit(self: ListingWindowSerializer, value: int) -> int:
+        """Clamp the limit to ``REMINDER_MAX_PAGE_SIZE``, like a page size."""
+        return min(value, settings.REMINDER_MAX_PAGE_SIZE)
+
+    def validate(self: ListingWindowSerializer, attrs: dict) -> dict:
+        """Reject an empty window."""
+        if "from" in attrs and "to" in attrs and attrs["to"] <= attrs["from"]:
+            raise serializers.ValidationError({"to": "Must be after from."})
+        return attrs
+
+
+class SearchQuerySerializer(serializers.Serializer):
+    """``q`` words to search reminder titles for, and an optional ``limit``."""
+
+    q = serializers.CharField(max_length=REMINDER_TITLE_MAXLEN)
+    limit = serializers.IntegerField(required=False, min_value=1)
+
+    def validate_q(self: SearchQuerySerializer, value: str) -> str:
+        """Require at least one word."""
+        if not search_terms(value):
+            msg = "Enter at least one word."
+            raise serializers.ValidationError(msg)
+        return value
+
+    def validate_limit(self: SearchQuerySerializer, value: int) -> int:
+        """Clamp the limit to ``REMINDER_MAX_PAGE_SIZE``."""
+        return min(value, settings.REMINDER_MAX_PAGE_SIZE)
+
+
+class OccurrenceSerializer(serializers.Serializer):
+    """One occurrence of a possibly recurring reminder."""
+
+    reminder = serializers.UUIDField()
+    reminder_title = serializers.CharField()
+    occurs_at = serializers.DateTimeField()
+
+
+class BulkDeleteSerializer(serializers.Serializer):
+    """Selection of reminders to delete: explicit ids, an expiry cut-off, or both."""
+
+    ids = serializers.ListField(
+        child=serializers.UUIDField(),
+        allow_empty=False,
+        max_length=settings.REMINDER_BULK_MAX_ITEMS,
+        required=False,
+    )
+    expired_before = serializers.DateTimeField(required=False)
+
+    def validate(self: BulkDeleteSerializer, attrs: dict) -> dict:
+        """Require at least one selector so nothing is deleted by accident."""
+        if not attrs:
+            raise serializers.ValidationError("Provide ids, expired_before or both.")
+        return attrs
@@ -0,0 +1,162 @@
+"""WSGI against ASGI load test on I/O-bound requests.
+
+Not collected by the default test run. Execute with::
+
+    python manage.py test reminder.tests.bench_async
+
+Starts ``gunicorn config.wsgi`` (one sync worker, as deployed) and
+``gunicorn config.asgi:application -k uvicorn.workers.UvicornWorker`` (one
+worker) on a scratch SQLite database where every query takes
+``LATENCY_MS``, then fires authenticated listing GETs at rising concurrency.
+"""
+from __future__ import annotations
+
+import http.client
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from django.conf import settings
+from django.test import SimpleTestCase
+
+LATENCY_MS = 20
+CONCURRENCY = [1, 8, 32, 64]
+DURATION = 3.0
+SEED = """
+from django.contrib.auth.models import User
+from rest_framework.authtoken.models import Token
+from reminder.models import Reminder
+user = User.objects.create_user(username="bench-user", password="bench-pass")
+Reminder.objects.bulk_create(
+    Reminder(user=user, reminder_title=f"Bench {i}", end_date_time="2054-04-11T22:15:13Z")
+    for i in range(20)
+)
+print(Token.objects.create(user=user).key)
+"""
+SERVERS = {
+    "wsgi": ["config.wsgi"],
+    "asgi": ["config.asgi:application", "-k", "uvicorn.workers.UvicornWorker"],
+}
+
+
+def free_port() -> int:
+    """Return a free localhost TCP port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def get(port: int, token: str) -> int:
+    """Send one authenticated listing GET and return its status."""
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    try:
+        conn.request(
+            "GET",
+            "/api/reminder/",
+            headers={"Authorization": f"Token {token}"},
+        )
+        res = conn.getresponse()
+        res.read()
+        return res.status
+    finally:
+        conn.close()
+
+
+def load(port: int, token: str, concurrency: int) -> float:
+    """Keep ``concurrency`` requests in flight for ``DURATION``; return req/s."""
+    done = []
+    lock = threading.Lock()
+    deadline = time.perf_counter() + DURATION
+
+    def client() -> None:
+        while time.perf_counter() < deadline:
+            status = get(port, token)
+            with lock:
+                done.append(status)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        for future in [pool.submit(client) for _ in range(concurrency)]:
+            future.result()
+    elapsed = time.perf_counter() - start
+    assert set(done) == {200}, set(done)
+    return len(done) / elapsed
+
+
+class BenchAsyncViews(SimpleTestCase):
+    """Requests per second of a WSGI and an ASGI worker as concurrency grows."""
+
+    def setUp(self: BenchAsyncViews) -> None:
+        """Testcase setup."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.env = {
+            **os.environ,
+            "DJANGO_SETTINGS_MODULE": "reminder.tests.bench_async_settings",
+            "BENCH_DATABASE": str(Path(self.tmp.name) / "bench.sqlite3"),
+        }
+        self.manage(["migrate", "-v", "0"])
+        self.token = self.manage(["shell", "-c", SEED]).strip()
+        self.env["BENCH_DB_LATENCY_MS"] = str(LATENCY_MS)
+
+    def tearDown(self: BenchAsyncViews) -> None:
+        """Remove the scratch database."""
+        self.tmp.cleanup()
+
+    def manage(self: BenchAsyncViews, args: list[str]) -> str:
+        """Run a management command against the scratch database."""
+        return subprocess.run(
+            [sys.executable, "manage.py", *args],  # noqa: S603
+            cwd=settings.BASE_DIR,
+            env=self.env,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+
+    def serve(self: BenchAsyncViews, name: str) -> dict[int, float]:
+        """Start one server and load it at each concurrency level."""
+        port = free_port()
+        server = subprocess.Popen(
+            [  # noqa: S603
+                sys.executable,
+                "-m",
+                "gunicorn",
+                *SERVERS[name],
+                "--workers",
+                "1",
+                "--bind",
+                f"127.0.0.1:{port}",
+                "--log-level",
+                "warning",
+            ],
+            cwd=settings.BASE_DIR,
+            env=self.env,
+        )
+        try:
+            for _ in range(100):
+                try:
+                    get(port, self.token)
+                    break
+                except OSError:
+                    time.sleep(0.1)
+            return {n: load(port, self.token, n) for n in CONCURRENCY}
+        finally:
+            server.terminate()
+            server.wait()
+
+    def test_concurrency_scaling(self: BenchAsyncViews) -> None:
+        """Compare throughput of both servers."""
+        wsgi = self.serve("wsgi")
+        asgi = self.serve("asgi")
+        lines = [f"\nListing GETs, {LATENCY_MS}ms per query, one worker each (req/s):"]
+        lines.append(f"{'concurrency':>12} {'wsgi':>8} {'asgi':>8}")
+        lines.extend(f"{n:>12} {wsgi[n]:>8.1f} {asgi[n]:>8.1f}" for n in CONCURRENCY)
+        print("\n".join(lines))  # noqa: T201
+        top = CONCURRENCY[-1]
+        self.assertGreater(asgi[top], 4 * wsgi[top])
@@ -0,0 +1,39 @@
+"""Settings for the servers started by ``bench_async``.
+
+Every query sleeps ``BENCH_DB_LATENCY_MS`` first, standing in for the round
+trip to a remote database, so requests are I/O bound.
+"""
+
+import os
+import time
+
+from django.db.backends.signals import connection_created
+
+from config.settings import *  # noqa: F403
+
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": os.environ["BENCH_DATABASE"],
+    },
+}
+
+# Cache hits would skip the database entirely.
+REMINDER_LISTING_CACHE_ENABLED = False
+AUTH_TOKEN_CACHE_TIMEOUT = 0
+
+LATENCY = int(os.environ.get("BENCH_DB_LATENCY_MS", "0")) / 1000
+
+
+def _slow_query(execute, sql, params, many, context):  # noqa: ANN001, ANN202
+    time.sleep(LATENCY)
+    return execute(sql, params, many, context)
+
+
+def _add_latency(sender, connection, **kwargs):  # noqa: ANN001, ANN003, ANN202, ARG001
+    # Fired on every reconnect of the same wrapper object.
+    if _slow_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_slow_query)
+
+
+connection_created.connect(_add_latency)
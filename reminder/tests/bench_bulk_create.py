@@ -0,0 +1,55 @@
+"""Bulk create benchmark.
+
+Not collected by the default test run. Execute with::
+
+    python manage.py test reminder.tests.bench_bulk_create
+"""
+from __future__ import annotations
+
+import time
+
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+
+from reminder.models import Reminder
+
+ITEMS = 2000
+
+
+class BenchBulkCreate(APITestCase):
+    """N single POSTs against one bulk POST of N reminders."""
+
+    def setUp(self: BenchBulkCreate) -> None:
+        """Testcase setup."""
+        self.url = reverse("reminder")
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username="bench-user",
+            password="bench-pass",
+        )
+        self.client.force_authenticate(user=self.user)
+        self.items = [
+            {"reminder_title": f"Bench {i}", "end_date_time": "2054-04-11T22:15:13Z"}
+            for i in range(ITEMS)
+        ]
+
+    def test_single_vs_bulk(self: BenchBulkCreate) -> None:
+        """Time both ways of creating ``ITEMS`` reminders."""
+        start = time.perf_counter()
+        for item in self.items:
+            self.client.post(self.url, data=item, format="json")
+        single = time.perf_counter() - start
+        self.assertEqual(Reminder.objects.count(), ITEMS)
+
+        Reminder.objects.all().delete()
+        start = time.perf_counter()
+        self.client.post(self.url, data=self.items, format="json")
+        bulk = time.perf_counter() - start
+        self.assertEqual(Reminder.objects.count(), ITEMS)
+
+        print(  # noqa: T201
+            f"\n{ITEMS} reminders: {ITEMS} single POSTs {single:.2f}s ({ITEMS / single:,.0f}/s),"
+            f" one bulk POST {bulk:.2f}s ({ITEMS / bulk:,.0f}/s), {single / bulk:.1f}x faster",
+        )
+        self.assertLess(bulk, single)
@@ -0,0 +1,68 @@
+"""Dispatcher throughput benchmark.
+
+Not collected by the default test run. Execute with::
+
+    python manage.py test reminder.tests.bench_dispatch
+"""
+from __future__ import annotations
+
+import datetime
+import time
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from reminder.dispatch.backends import LocmemBackend
+from reminder.dispatch.dispatcher import Dispatcher
+from reminder.models import Reminder
+
+USERS = 100
+RATE = 10_000
+DUE = 5 * RATE
+MAX_P99_LAG_MS = 250
+BASE = datetime.datetime(2030, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+class BenchDispatcher(TestCase):
+    """The dispatcher should keep up with 10k due reminders per second."""
+
+    @classmethod
+    def setUpTestData(cls: type[BenchDispatcher]) -> None:
+        """Seed ``DUE`` reminders falling due at ``RATE`` per second from ``BASE``."""
+        users = User.objects.bulk_create(
+            User(username=f"bench-{i}") for i in range(USERS)
+        )
+        Reminder.objects.bulk_create(
+            (
+                Reminder(
+                    reminder_title=f"Bench {i}",
+                    user=users[i % USERS],
+                    end_date_time=BASE + datetime.timedelta(seconds=i / RATE),
+                )
+                for i in range(DUE)
+            ),
+            batch_size=1000,
+        )
+
+    def test_keeps_up(self: BenchDispatcher) -> None:
+        """Run against a clock starting at ``BASE`` and report lag percentiles."""
+        LocmemBackend.outbox.clear()
+        started = time.perf_counter()
+
+        def clock() -> datetime.datetime:
+            return BASE + datetime.timedelta(seconds=time.perf_counter() - started)
+
+        dispatcher = Dispatcher([LocmemBackend()], window=2, clock=clock)
+        while dispatcher.delivered < DUE:
+            if not dispatcher.tick():
+                time.sleep(0.001)
+        elapsed = time.perf_counter() - started
+        stats = dispatcher.stats()
+
+        print(  # noqa: T201
+            f"\ndispatched {DUE} reminders due at {RATE:,}/s in {elapsed:.2f}s;"
+            f" lag p50 {stats['lag_p50_ms']:.1f}ms p95 {stats['lag_p95_ms']:.1f}ms"
+            f" p99 {stats['lag_p99_ms']:.1f}ms",
+        )
+        self.assertEqual(len(LocmemBackend.outbox), DUE)
+        self.assertLess(stats["lag_p99_ms"], MAX_P99_LAG_MS)
@@ -0,0 +1,56 @@
+"""Streaming export benchmark.
+
+Not collected by the default test run. Execute with::
+
+    python manage.py test reminder.tests.bench_export
+"""
+from __future__ import annotations
+
+import time
+import tracemalloc
+
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+
+from reminder.tests.test_export import MEMORY_BOUND, seed
+
+ROWS = 1_000_000
+
+
+class BenchExportReminderView(APITestCase):
+    """Export a million reminders within ``MEMORY_BOUND``."""
+
+    @classmethod
+    def setUpTestData(cls: type[BenchExportReminderView]) -> None:
+        """Seed one user with ``ROWS`` reminders."""
+        cls.user = User.objects.create_user(
+            username="bench-user",
+            password="bench-pass",
+        )
+        seed(cls.user, ROWS)
+
+    def stream(self: BenchExportReminderView, export_format: str) -> int:
+        """Stream one export and return its size in bytes."""
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        res = client.get(reverse("export-reminder"), {"export_format": export_format})
+        return sum(len(chunk) for chunk in res.streaming_content)
+
+    def test_export(self: BenchExportReminderView) -> None:
+        """Time each format, then stream it again under tracemalloc for the peak."""
+        for export_format in ("json", "ndjson"):
+            start = time.perf_counter()
+            size = self.stream(export_format)
+            elapsed = time.perf_counter() - start
+            tracemalloc.start()
+            try:
+                self.stream(export_format)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            print(  # noqa: T201
+                f"\n{export_format}: {ROWS} rows, {size / 2**20:.0f} MiB in {elapsed:.1f}s"
+                f" ({ROWS / elapsed:,.0f} rows/s), peak traced memory {peak / 2**20:.1f} MiB",
+            )
+            self.assertLess(peak, MEMORY_BOUND)
@@ -0,0 +1,62 @@
+"""Fast read path serializer microbenchmark.
+
+Not collected by the default test run. Execute with::
+
+    python manage.py test reminder.tests.bench_fast_serializer
+"""
+from __future__ import annotations
+
+import datetime
+import time
+
+from django.contrib.auth.models import User
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from reminder.models import Reminder
+from reminder.serializers import FastReminderSerializer, ReminderSerializer
+
+ROWS = 10_000
+ROUNDS = 5
+
+
+class BenchFastReminderSerializer(APITestCase):
+    """ModelSerializer against the values_list fast path over ``ROWS`` rows."""
+
+    def setUp(self: BenchFastReminderSerializer) -> None:
+        """Testcase setup."""
+        user = User.objects.create_user(username="bench-user", password="bench-pass")
+        base = datetime.datetime(2054, 4, 11, 22, 15, 13, tzinfo=datetime.timezone.utc)
+        Reminder.objects.bulk_create(
+            Reminder(
+                user=user,
+                reminder_title=f"Bench {i}",
+                end_date_time=base + datetime.timedelta(seconds=i),
+            )
+            for i in range(ROWS)
+        )
+        self.reminders = Reminder.objects.filter(user=user)
+
+    def best(self: BenchFastReminderSerializer, serialize: object) -> float:
+        """Return the best of ``ROUNDS`` timings of query, serialize and render."""
+        timings = []
+        for _ in range(ROUNDS):
+            start = time.perf_counter()
+            JSONRenderer().render(serialize())
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    def test_model_serializer_vs_fast_path(self: BenchFastReminderSerializer) -> None:
+        """Time both paths end to end."""
+        fast = FastReminderSerializer()
+        slow_time = self.best(
+            lambda: ReminderSerializer(self.reminders.all(), many=True).data,
+        )
+        fast_time = self.best(
+            lambda: fast.to_representation(fast.rows(self.reminders.all())),
+        )
+        print(  # noqa: T201
+            f"\n{ROWS} rows (query + serialize + render): ReminderSerializer {slow_time * 1000:.0f}ms,"
+            f" FastReminderSerializer {fast_time * 1000:.0f}ms, {slow_time / fast_time:.1f}x faster",
+        )
+        self.assertLess(fast_time, slow_time)
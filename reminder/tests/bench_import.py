@@ -0,0 +1,73 @@
+"""Bulk import benchmark.
+
+Not collected by the default test run. Execute with::
+
+    python manage.py test reminder.tests.bench_import
+"""
+from __future__ import annotations
+
+import datetime
+import json
+import tempfile
+import time
+from io import StringIO
+from pathlib import Path
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+
+from reminder.models import Reminder
+
+ROWS = 100_000
+# One POST per reminder is far slower, so time fewer of them.
+SINGLE_ROWS = 1000
+
+
+class BenchImportReminders(APITestCase):
+    """import_reminders against posting reminders one at a time."""
+
+    def setUp(self: BenchImportReminders) -> None:
+        """Write ``ROWS`` records to an NDJSON file."""
+        self.user = User.objects.create_user(
+            username="bench-user",
+            password="bench-pass",
+        )
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / "reminders.ndjson"
+        end = datetime.datetime.now(tz=datetime.timezone.utc) + datetime.timedelta(
+            days=1,
+        )
+        self.records = [
+            {
+                "reminder_title": f"Bench {i}",
+                "end_date_time": (end + datetime.timedelta(seconds=i)).isoformat(),
+            }
+            for i in range(ROWS)
+        ]
+        with self.path.open("w") as file:
+            file.writelines(f"{json.dumps(record)}\n" for record in self.records)
+
+    def test_import_vs_single_posts(self: BenchImportReminders) -> None:
+        """Report rows/s for both paths."""
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        start = time.perf_counter()
+        for record in self.records[:SINGLE_ROWS]:
+            client.post(reverse("reminder"), record)
+        single_rate = SINGLE_ROWS / (time.perf_counter() - start)
+        Reminder.objects.all().delete()
+
+        out = StringIO()
+        start = time.perf_counter()
+        call_command("import_reminders", str(self.path), user="bench-user", stdout=out)
+        import_rate = ROWS / (time.perf_counter() - start)
+        self.assertEqual(Reminder.objects.count(), ROWS)
+        print(  # noqa: T201
+            f"\nPOST one at a time: {single_rate:,.0f} rows/s;"
+            f" import_reminders: {import_rate:,.0f} rows/s over {ROWS} rows"
+            f" ({import_rate / single_rate:.0f}x)",
+        )
+        self.assertGreater(import_rate, single_rate)
@@ -0,0 +1,78 @@
+"""Keyset pagination benchmark.
+
+Not collected by the default test run. Execute with::
+
+    python manage.py test reminder.tests.bench_pagination
+"""
+from __future__ import annotations
+
+import datetime
+import statistics
+import time
+
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+
+from reminder.models import Reminder
+from reminder.pagination import ReminderCursorPagination
+
+PAGE_SIZE = 20
+PAGES = 1000
+ROUNDS = 50
+
+
+class BenchReminderCursorPagination(APITestCase):
+    """Page 1 and page 1000 should cost the same."""
+
+    @classmethod
+    def setUpTestData(cls: type[BenchReminderCursorPagination]) -> None:
+        """Seed one user with ``PAGE_SIZE * PAGES`` reminders."""
+        cls.user = User.objects.create_user(
+            username="bench-user",
+            password="bench-pass",
+        )
+        base = datetime.datetime.now(tz=datetime.timezone.utc) + datetime.timedelta(
+            days=1,
+        )
+        Reminder.objects.bulk_create(
+            (
+                Reminder(
+                    reminder_title=f"Bench {i}",
+                    user=cls.user,
+                    end_date_time=base + datetime.timedelta(seconds=i),
+                )
+                for i in range(PAGE_SIZE * PAGES)
+            ),
+            batch_size=1000,
+        )
+
+    def _median_ms(self: BenchReminderCursorPagination, params: dict) -> float:
+        """Median latency of ``ROUNDS`` GET requests in milliseconds."""
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        url = reverse("reminder")
+        samples = []
+        for _ in range(ROUNDS):
+            start = time.perf_counter()
+            client.get(url, params)
+            samples.append((time.perf_counter() - start) * 1000)
+        return statistics.median(samples)
+
+    def test_flat_latency(self: BenchReminderCursorPagination) -> None:
+        """Compare the first and the last page."""
+        last_of_999 = (
+            Reminder.objects.filter(user=self.user)
+            .order_by("end_date_time", "id")
+            .values_list("end_date_time", "id")[PAGE_SIZE * (PAGES - 1) - 1]
+        )
+        cursor = ReminderCursorPagination.encode_cursor(*last_of_999)
+
+        page_1 = self._median_ms({"page_size": PAGE_SIZE})
+        page_1000 = self._median_ms({"page_size": PAGE_SIZE, "cursor": cursor})
+
+        print(  # noqa: T201
+            f"\nkeyset pagination over {PAGE_SIZE * PAGES} rows:"
+            f" page 1 {page_1:.2f} ms, page {PAGES} {page_1000:.2f} ms (median of {ROUNDS})",
+        )
+        self.assertLess(page_1000, page_1 * 2)
@@ -0,0 +1,83 @@
+"""Recurring reminder benchmark.
+
+Not collected by the default test run. Execute with::
+
+    python manage.py test reminder.tests.bench_recurrence
+"""
+from __future__ import annotations
+
+import datetime
+import statistics
+import time
+
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+
+from reminder.models import Reminder
+
+ROUNDS = 1000
+
+
+class BenchRecurrence(APITestCase):
+    """A year of daily occurrences is one row, expanded per window."""
+
+    def setUp(self: BenchRecurrence) -> None:
+        """Create one daily reminder for a year through the API."""
+        self.user = User.objects.create_user(
+            username="bench-user",
+            password="bench-pass",
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.start = datetime.datetime.now(
+            tz=datetime.timezone.utc,
+        ) + datetime.timedelta(days=1)
+        self.client.post(
+            reverse("reminder"),
+            {
+                "reminder_title": "Daily",
+                "end_date_time": self.start.isoformat(),
+                "recurrence": "FREQ=DAILY;COUNT=365",
+            },
+        )
+
+    def median_us(
+        self: BenchRecurrence,
+        days_from: int,
+        days: int,
+    ) -> tuple[float, int]:
+        """Median time to expand a window, and its occurrence count."""
+        reminder = Reminder.objects.get()
+        since = self.start + datetime.timedelta(days=days_from)
+        before = since + datetime.timedelta(days=days)
+        samples = []
+        for _ in range(ROUNDS):
+            start = time.perf_counter()
+            occurrences = list(reminder.occurrences(since, before))
+            samples.append((time.perf_counter() - start) * 1_000_000)
+        return statistics.median(samples), len(occurrences)
+
+    def test_year_of_daily_occurrences(self: BenchRecurrence) -> None:
+        """Report storage and expansion cost."""
+        self.assertEqual(Reminder.objects.count(), 1)
+        week_us, week = self.median_us(300, 7)
+        year_us, year = self.median_us(0, 366)
+        self.assertEqual((week, year), (7, 365))
+
+        url = reverse("reminder-occurrences")
+        params = {
+            "from": (self.start + datetime.timedelta(days=300)).isoformat(),
+            "to": (self.start + datetime.timedelta(days=307)).isoformat(),
+        }
+        samples = []
+        for _ in range(ROUNDS // 10):
+            start = time.perf_counter()
+            self.client.get(url, params)
+            samples.append((time.perf_counter() - start) * 1000)
+        print(  # noqa: T201
+            f"\n1 row for 365 daily occurrences. Expansion: week 300 {week_us:.1f}us,"
+            f" whole year {year_us:.1f}us; GET occurrences/ for a week"
+            f" {statistics.median(samples):.2f}ms",
+        )
+        self.assertLess(week_us, 1000)
@@ -0,0 +1,96 @@
+"""Title search benchmark: FTS5 index against an icontains scan.
+
+Not collected by the default test run. Execute with::
+
+    python manage.py test reminder.tests.bench_search
+"""
+from __future__ import annotations
+
+import datetime
+import random
+import statistics
+import string
+import time
+
+from django.contrib.auth.models import User
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+
+from reminder.models import Reminder
+from reminder.search import FTS5SearchBackend, search_backend
+
+ROWS = 1_000_000
+VOCABULARY = 20_000
+ROUNDS = 20
+
+
+class BenchSearch(APITestCase):
+    """Indexed prefix search should not scan the user's reminders."""
+
+    @classmethod
+    def setUpTestData(cls: type[BenchSearch]) -> None:
+        """Seed one user with ``ROWS`` reminders titled with two random words."""
+        cls.user = User.objects.create_user(
+            username="bench-user",
+            password="bench-pass",
+        )
+        rng = random.Random(0)  # noqa: S311
+        cls.words = [
+            "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 9)))
+            for _ in range(VOCABULARY)
+        ]
+        base = datetime.datetime.now(tz=datetime.timezone.utc) + datetime.timedelta(
+            days=1,
+        )
+        Reminder.objects.bulk_create(
+            (
+                Reminder(
+                    reminder_title=" ".join(rng.choices(cls.words, k=2))[:20],
+                    user=cls.user,
+                    end_date_time=base + datetime.timedelta(seconds=i),
+                )
+                for i in range(ROWS)
+            ),
+            batch_size=5000,
+        )
+
+    def _median_ms(self: BenchSearch, q: str) -> tuple[float, int]:
+        """Median latency of ``ROUNDS`` searches in milliseconds, and the hit count."""
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        url = reverse("search-reminder")
+        samples = []
+        for _ in range(ROUNDS):
+            start = time.perf_counter()
+            res = client.get(url, {"q": q})
+            samples.append((time.perf_counter() - start) * 1000)
+        return statistics.median(samples), len(res.data)
+
+    def test_fts5_against_icontains(self: BenchSearch) -> None:
+        """Compare both backends on a rare word, a word prefix and a common prefix."""
+        if not isinstance(search_backend(), FTS5SearchBackend):
+            self.skipTest("FTS5 is not available.")
+        queries = {
+            "word": self.words[0],
+            "prefix": self.words[1][:4],
+            "two words": f"{self.words[2][:3]} {self.words[3][:3]}",
+            "common prefix": "ab",
+        }
+        print(  # noqa: T201
+            f"\ntitle search over {ROWS} reminders (median of {ROUNDS}):",
+        )
+        for name, q in queries.items():
+            fts5, hits = self._median_ms(q)
+            with override_settings(
+                REMINDER_SEARCH_BACKEND="reminder.search.IcontainsSearchBackend",
+            ):
+                icontains, _ = self._median_ms(q)
+            print(  # noqa: T201
+                f"  {name} {q!r} ({hits} hits): fts5 {fts5:.2f} ms,"
+                f" icontains {icontains:.2f} ms ({icontains / fts5:.1f}x)",
+            )
+            # A common prefix matches early in end_date_time order, so the
+            # scan stops after ``limit`` rows while FTS5 sorts every match.
+            if name != "common prefix":
+                self.assertLess(fts5 * 10, icontains)
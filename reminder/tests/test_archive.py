@@ -0,0 +1,153 @@
+"""Expired reminder archival test module."""
+from __future__ import annotations
+
+import datetime
+from io import StringIO
+from typing import TYPE_CHECKING
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from reminder.archive import archive_batch, archive_cutoff
+from reminder.models import ArchivedReminder, Reminder
+
+if TYPE_CHECKING:
+    from rest_framework.response import Response
+
+DAY = 24 * 3600
+
+
+class TestArchive(APITestCase):
+    """archive_reminders and archived listing tests."""
+
+    def setUp(self: TestArchive) -> None:
+        """Testcase setup."""
+        cache.clear()
+        self.url = reverse("reminder")
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username="test-user",
+            password="test-pass",
+        )
+        self.client.force_authenticate(user=self.user)
+        now = timezone.now()
+        Reminder.objects.bulk_create(
+            [
+                Reminder(
+                    user=self.user,
+                    reminder_title=f"Expired {days}",
+                    end_date_time=now - datetime.timedelta(days=days),
+                    delivered_at=now - datetime.timedelta(days=days)
+                    if days % 2
+                    else None,
+                )
+                for days in (10, 11, 12, 13, 14)
+            ]
+            + [
+                Reminder(
+                    user=self.user,
+                    reminder_title="Recent",
+                    end_date_time=now - datetime.timedelta(days=1),
+                ),
+                Reminder(
+                    user=self.user,
+                    reminder_title="Upcoming",
+                    end_date_time=now + datetime.timedelta(days=1),
+                ),
+            ],
+        )
+
+    def titles(self: TestArchive, **params: str) -> list[str]:
+        """Return the titles of a listing."""
+        res: Response = self.client.get(self.url, params)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        return sorted(reminder["reminder_title"] for reminder in res.data)
+
+    def test_archive_batch(self: TestArchive) -> None:
+        """A batch moves the oldest expired rows with their fields."""
+        expired = Reminder.objects.get(reminder_title="Expired 13")
+        moved = archive_batch(archive_cutoff(7 * DAY), 2)
+        self.assertEqual(moved, 2)
+        archived = ArchivedReminder.objects.get(id=expired.id)
+        self.assertEqual(archived.user, self.user)
+        self.assertEqual(archived.end_date_time, expired.end_date_time)
+        self.assertEqual(archived.delivered_at, expired.delivered_at)
+        self.assertEqual(
+            sorted(ArchivedReminder.objects.values_list("reminder_title", flat=True)),
+            ["Expired 13", "Expired 14"],
+        )
+        self.assertFalse(Reminder.objects.filter(id=expired.id).exists())
+
+    def test_command_archives_in_batches(self: TestArchive) -> None:
+        """Everything past the retention window is moved, nothing else."""
+        out = StringIO()
+        call_command("archive_reminders", batch_size=2, stdout=out)
+        self.assertIn("archived=5", out.getvalue())
+        self.assertNotIn("purged", out.getvalue())
+        self.assertEqual(ArchivedReminder.objects.count(), 5)
+        self.assertEqual(
+            sorted(Reminder.objects.values_list("reminder_title", flat=True)),
+            ["Recent", "Upcoming"],
+        )
+
+    def test_pending_series_is_kept(self: TestArchive) -> None:
+        """A recurring series the dispatcher has not finished is never archived."""
+        ended = timezone.now() - datetime.timedelta(days=30)
+        pending, finished = (
+            Reminder.objects.create(
+                user=self.user,
+                reminder_title=title,
+                end_date_time=ended,
+                recurrence="FREQ=DAILY;COUNT=3",
+                delivered_at=delivered_at,
+            )
+            for title, delivered_at in (("Pending", None), ("Finished", ended))
+        )
+        call_command("archive_reminders", stdout=StringIO())
+        pending.refresh_from_db()
+        self.assertEqual(pending.recurrence, "FREQ=DAILY;COUNT=3")
+        self.assertTrue(ArchivedReminder.objects.filter(id=finished.id).exists())
+
+    def test_command_purges_after_ttl(self: TestArchive) -> None:
+        """Archived rows past the purge TTL are deleted."""
+        call_command("archive_reminders", retention=0, stdout=StringIO())
+        out = StringIO()
+        call_command("archive_reminders", purge_after=0, batch_size=2, stdout=out)
+        self.assertIn("purged=6", out.getvalue())
+        self.assertFalse(ArchivedReminder.objects.exists())
+
+    def test_listing_excludes_archived(self: TestArchive) -> None:
+        """Archived reminders only show up with ?archived=true."""
+        self.assertEqual(len(self.titles()), 7)
+        etag = self.client.get(self.url)["ETag"]
+        archived_etag = self.client.get(self.url, {"archived": "true"})["ETag"]
+        call_command("archive_reminders", stdout=StringIO())
+        self.assertEqual(self.titles(), ["Recent", "Upcoming"])
+        self.assertEqual(self.titles(archived="false"), ["Recent", "Upcoming"])
+        self.assertEqual(
+            self.titles(archived="true"),
+            [f"Expired {days}" for days in (10, 11, 12, 13, 14)],
+        )
+        res: Response = self.client.get(self.url, {"archived": "true"})
+        self.assertIn("archived_at", res.data[0])
+        self.assertNotEqual(res["ETag"], archived_etag)
+        self.assertNotEqual(self.client.get(self.url)["ETag"], etag)
+
+    def test_archived_listing_is_paginated(self: TestArchive) -> None:
+        """Keyset pagination works on the archived listing."""
+        call_command("archive_reminders", stdout=StringIO())
+        res: Response = self.client.get(self.url, {"archived": "true", "page_size": 3})
+        self.assertEqual(len(res.data["results"]), 3)
+        self.assertEqual(res.data["results"][0]["reminder_title"], "Expired 14")
+        res = self.client.get(res.data["next"])
+        self.assertEqual(len(res.data["results"]), 2)
+
+    def test_invalid_archived_param(self: TestArchive) -> None:
+        """Non-boolean values are rejected."""
+        res: Response = self.client.get(self.url, {"archived": "maybe"})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
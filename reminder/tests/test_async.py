@@ -0,0 +1,167 @@
+"""Async (ASGI) views test module."""
+from __future__ import annotations
+
+import asyncio
+import datetime
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from auth.async_views import AsyncLoginView
+from reminder.models import Reminder
+from reminder.views.async_reminder import AsyncReminderView
+
+
+@override_settings(ROOT_URLCONF="config.asgi_urls")
+class TestAsyncViews(TestCase):
+    """Async views under ``config.asgi_urls``."""
+
+    def setUp(self: TestAsyncViews) -> None:
+        """Testcase setup."""
+        cache.clear()
+        self.url = reverse("reminder")
+        self.user = User.objects.create_user(
+            username="test-user",
+            password="test-pass",
+        )
+        self.ouser = User.objects.create_user(
+            username="other-user",
+            password="test-pass",
+        )
+        self.reminder = Reminder.objects.create(
+            reminder_title="Test Title 1",
+            user=self.user,
+            end_date_time=datetime.datetime.now(tz=datetime.timezone.utc)
+            + datetime.timedelta(days=2),
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.headers = {"Authorization": f"Token {self.token.key}"}
+
+    def test_views_are_async(self: TestAsyncViews) -> None:
+        """Django sees the view functions as coroutines."""
+        self.assertTrue(asyncio.iscoroutinefunction(AsyncReminderView.as_view()))
+        self.assertTrue(asyncio.iscoroutinefunction(AsyncLoginView.as_view()))
+
+    async def test_unauthenticated(self: TestAsyncViews) -> None:
+        """Authentication and permissions still apply."""
+        res = await self.async_client.get(self.url)
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    async def test_list_matches_sync_view(self: TestAsyncViews) -> None:
+        """The async listing is byte-identical to the sync one."""
+        res = await self.async_client.get(self.url, headers=self.headers)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        with override_settings(ROOT_URLCONF="config.urls"):
+            client = APIClient()
+            client.credentials(HTTP_AUTHORIZATION=self.headers["Authorization"])
+            await sync_to_async(cache.clear)()
+            sync_res = await sync_to_async(client.get)(self.url)
+        self.assertEqual(res.content, sync_res.content)
+        self.assertEqual(res["ETag"], sync_res["ETag"])
+
+    async def test_window_matches_sync_view(self: TestAsyncViews) -> None:
+        """Window parameters give the same listing on both stacks."""
+        params = {"upcoming": "true", "ordering": "-end_date_time", "limit": "1"}
+        res = await self.async_client.get(self.url, params, headers=self.headers)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.json()), 1)
+        with override_settings(ROOT_URLCONF="config.urls"):
+            client = APIClient()
+            client.credentials(HTTP_AUTHORIZATION=self.headers["Authorization"])
+            sync_res = await sync_to_async(client.get)(self.url, params)
+        self.assertEqual(res.content, sync_res.content)
+
+    async def test_conditional_get(self: TestAsyncViews) -> None:
+        """A matching If-None-Match gets a 304."""
+        res = await self.async_client.get(self.url, headers=self.headers)
+        res = await self.async_client.get(
+            self.url,
+            headers={**self.headers, "If-None-Match": res["ETag"]},
+        )
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    async def test_paginated_list(self: TestAsyncViews) -> None:
+        """Keyset pagination works on the async path."""
+        res = await self.async_client.get(
+            self.url,
+            {"page_size": 1},
+            headers=self.headers,
+        )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.json()["results"]), 1)
+        self.assertIsNone(res.json()["next_cursor"])
+
+    async def test_create(self: TestAsyncViews) -> None:
+        """Single and bulk creates both work and show up in the listing."""
+        await self.async_client.get(self.url, headers=self.headers)
+        res = await self.async_client.post(
+            self.url,
+            {"reminder_title": "New", "end_date_time": "2054-04-11T22:15:13Z"},
+            content_type="application/json",
+            headers=self.headers,
+        )
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(res.json()["user"], self.user.id)
+        res = await self.async_client.post(
+            self.url,
+            [
+                {"reminder_title": f"Bulk {i}", "end_date_time": "2054-04-11T22:15:13Z"}
+                for i in range(3)
+            ],
+            content_type="application/json",
+            headers=self.headers,
+        )
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        res = await self.async_client.get(self.url, headers=self.headers)
+        self.assertEqual(len(res.json()), 5)
+
+    async def test_create_invalid(self: TestAsyncViews) -> None:
+        """Validation errors match the sync view."""
+        res = await self.async_client.post(
+            self.url,
+            {"reminder_title": "New"},
+            content_type="application/json",
+            headers=self.headers,
+        )
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(res.json()["errors"][0]["attr"], "end_date_time")
+
+    async def test_delete(self: TestAsyncViews) -> None:
+        """Deletes are scoped to the owner."""
+        url = reverse("delete-reminder", args=[str(self.reminder.id)])
+        other_token = await Token.objects.acreate(user=self.ouser)
+        res = await self.async_client.delete(
+            url,
+            headers={"Authorization": f"Token {other_token.key}"},
+        )
+        self.assertEqual(res.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+        res = await self.async_client.delete(url, headers=self.headers)
+        self.assertEqual(res.status_code, status.HTTP_202_ACCEPTED)
+        self.assertFalse(await Reminder.objects.filter(id=self.reminder.id).aexists())
+
+    async def test_login_and_logout(self: TestAsyncViews) -> None:
+        """Login returns the user's token and logout revokes it."""
+        res = await self.async_client.post(
+            reverse("login"),
+            {"username": "test-user", "password": "wrong-password"},
+            content_type="application/json",
+        )
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+        res = await self.async_client.post(
+            reverse("login"),
+            {"username": "test-user", "password": "test-pass"},
+            content_type="application/json",
+        )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.json()["data"]["token"], self.token.key)
+        res = await self.async_client.post(reverse("logout"), headers=self.headers)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertFalse(await Token.objects.filter(user=self.user).aexists())
+        res = await self.async_client.get(self.url, headers=self.headers)
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
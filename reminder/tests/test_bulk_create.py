@@ -0,0 +1,127 @@
+"""Bulk reminder creation test module."""
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from reminder.models import Reminder
+
+if TYPE_CHECKING:
+    from rest_framework.response import Response
+
+
+class TestBulkCreateReminders(APITestCase):
+    """POST of a JSON array to ReminderView."""
+
+    def setUp(self: TestBulkCreateReminders) -> None:
+        """Testcase setup."""
+        self.url = reverse("reminder")
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username="test-user",
+            password="test-pass",
+        )
+        self.ouser = User.objects.create_user(
+            username="other-user",
+            password="test-pass",
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def payload(self: TestBulkCreateReminders, count: int) -> list[dict[str, str]]:
+        """Return ``count`` valid reminders."""
+        return [
+            {"reminder_title": f"Title {i}", "end_date_time": "2054-04-11T22:15:13Z"}
+            for i in range(count)
+        ]
+
+    def test_creates_every_reminder(self: TestBulkCreateReminders) -> None:
+        """All items are created for the requesting user and returned."""
+        res: Response = self.client.post(self.url, data=self.payload(3), format="json")
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(res.data), 3)
+        self.assertEqual(
+            [row["reminder_title"] for row in res.data],
+            ["Title 0", "Title 1", "Title 2"],
+        )
+        self.assertEqual(Reminder.objects.filter(user=self.user).count(), 3)
+        self.assertEqual(
+            {
+                str(reminder_id)
+                for reminder_id in Reminder.objects.values_list("id", flat=True)
+            },
+            {row["id"] for row in res.data},
+        )
+
+    def test_user_in_payload_is_ignored(self: TestBulkCreateReminders) -> None:
+        """Reminders cannot be created on behalf of another user."""
+        items = self.payload(2)
+        for item in items:
+            item["user"] = self.ouser.id
+        res: Response = self.client.post(self.url, data=items, format="json")
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Reminder.objects.filter(user=self.user).count(), 2)
+        self.assertEqual(Reminder.objects.filter(user=self.ouser).count(), 0)
+
+    def test_errors_are_reported_per_item(self: TestBulkCreateReminders) -> None:
+        """One invalid item rejects the batch, with its index in the error."""
+        items = self.payload(4)
+        items[1]["reminder_title"] = ""
+        items[3]["end_date_time"] = (
+            datetime.datetime.now(tz=datetime.timezone.utc) - datetime.timedelta(days=1)
+        ).isoformat()
+        res: Response = self.client.post(self.url, data=items, format="json")
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            sorted(error["attr"] for error in res.data["errors"]),
+            ["1.reminder_title", "3.end_date_time"],
+        )
+        self.assertEqual(Reminder.objects.count(), 0)
+
+    def test_non_object_item(self: TestBulkCreateReminders) -> None:
+        """Items that are not objects are reported."""
+        res: Response = self.client.post(
+            self.url,
+            data=[*self.payload(1), "oops"],
+            format="json",
+        )
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(res.data["errors"][0]["attr"], "1.non_field_errors")
+        self.assertEqual(Reminder.objects.count(), 0)
+
+    def test_empty_list(self: TestBulkCreateReminders) -> None:
+        """An empty array is rejected."""
+        res: Response = self.client.post(self.url, data=[], format="json")
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(REMINDER_BULK_MAX_ITEMS=5)
+    def test_max_items(self: TestBulkCreateReminders) -> None:
+        """Arrays longer than ``REMINDER_BULK_MAX_ITEMS`` are rejected."""
+        res: Response = self.client.post(self.url, data=self.payload(6), format="json")
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Reminder.objects.count(), 0)
+
+    @override_settings(REMINDER_BULK_BATCH_SIZE=4)
+    def test_batched_inserts(self: TestBulkCreateReminders) -> None:
+        """Rows are inserted ``REMINDER_BULK_BATCH_SIZE`` at a time."""
+        with CaptureQueriesContext(connection) as ctx:
+            res: Response = self.client.post(
+                self.url,
+                data=self.payload(10),
+                format="json",
+            )
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        inserts = [
+            query["sql"]
+            for query in ctx.captured_queries
+            if query["sql"].startswith("INSERT")
+        ]
+        self.assertEqual(len(inserts), 3)
+        self.assertEqual(Reminder.objects.count(), 10)
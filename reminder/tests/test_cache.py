@@ -0,0 +1,170 @@
+"""Listing cache test module."""
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from reminder import cache as listing_cache
+from reminder.dispatch.backends import LocmemBackend
+from reminder.dispatch.dispatcher import Dispatcher
+from reminder.models import Reminder
+
+if TYPE_CHECKING:
+    from rest_framework.response import Response
+
+
+class TestListingCache(APITestCase):
+    """Per-user listing cache tests."""
+
+    def setUp(self: TestListingCache) -> None:
+        """Testcase setup."""
+        cache.clear()
+        listing_cache.stats.reset()
+        self.url = reverse("reminder")
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username="test-user",
+            password="test-pass",
+        )
+        self.ouser = User.objects.create_user(
+            username="other-user",
+            password="test-pass",
+        )
+        self.reminder = Reminder.objects.create(
+            reminder_title="Test Title 1",
+            user=self.user,
+            end_date_time=datetime.datetime.now(tz=datetime.timezone.utc)
+            + datetime.timedelta(days=2),
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def titles(self: TestListingCache, params: dict | None = None) -> list[str]:
+        """GET the listing and return its titles."""
+        res: Response = self.client.get(self.url, params)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        rows = res.data["results"] if params else res.data
+        return [row["reminder_title"] for row in rows]
+
+    def test_hit_skips_the_listing_query(self: TestListingCache) -> None:
+        """A repeated GET is served from the cache after the ETag marker query."""
+        self.assertEqual(self.titles(), ["Test Title 1"])
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(self.titles(), ["Test Title 1"])
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertEqual(
+            listing_cache.stats.snapshot(),
+            {"hits": 1, "misses": 1, "invalidations": 0},
+        )
+
+    def test_post_invalidates(self: TestListingCache) -> None:
+        """Creating a reminder is visible on the next GET."""
+        self.titles()
+        self.client.post(
+            self.url,
+            data={"reminder_title": "New", "end_date_time": "2054-04-11T22:15:13Z"},
+        )
+        self.assertEqual(self.titles(), ["Test Title 1", "New"])
+        self.assertEqual(listing_cache.stats.snapshot()["invalidations"], 1)
+
+    def test_delete_invalidates(self: TestListingCache) -> None:
+        """Deleting a reminder is visible on the next GET."""
+        self.titles()
+        self.client.delete(reverse("delete-reminder", args=[str(self.reminder.id)]))
+        self.assertEqual(self.titles(), [])
+
+    def test_bulk_delete_invalidates(self: TestListingCache) -> None:
+        """Bulk deletes are visible on the next GET."""
+        self.titles()
+        self.client.post(
+            reverse("bulk-delete-reminder"),
+            data={"ids": [str(self.reminder.id)]},
+            format="json",
+        )
+        self.assertEqual(self.titles(), [])
+
+    def test_cache_is_per_user(self: TestListingCache) -> None:
+        """Another user's writes do not invalidate this user's listing."""
+        self.titles()
+        self.client.force_authenticate(user=self.ouser)
+        self.assertEqual(self.titles(), [])
+        self.client.post(
+            self.url,
+            data={"reminder_title": "Other", "end_date_time": "2054-04-11T22:15:13Z"},
+        )
+        self.client.force_authenticate(user=self.user)
+        self.titles()
+        self.assertEqual(listing_cache.stats.snapshot()["hits"], 1)
+
+    def test_query_params_are_cached_separately(self: TestListingCache) -> None:
+        """Paginated and plain listings do not share an entry."""
+        self.assertEqual(self.titles(), ["Test Title 1"])
+        self.assertEqual(self.titles({"page_size": 10}), ["Test Title 1"])
+        self.assertEqual(listing_cache.stats.snapshot()["misses"], 2)
+
+    def test_dispatch_invalidates(self: TestListingCache) -> None:
+        """Delivery by the dispatcher shows up in the owner's listing."""
+        Reminder.objects.filter(id=self.reminder.id).update(
+            end_date_time=datetime.datetime.now(tz=datetime.timezone.utc)
+            - datetime.timedelta(seconds=1),
+        )
+        listing_cache.invalidate_listing(self.user.id)
+        self.assertIsNone(self.client.get(self.url).data[0]["delivered_at"])
+        Dispatcher([LocmemBackend()]).tick()
+        self.assertIsNotNone(self.client.get(self.url).data[0]["delivered_at"])
+
+    def test_writes_from_other_processes(self: TestListingCache) -> None:
+        """Writes that bump another process's cache are never served stale."""
+        res = self.client.get(self.url)
+        etag = res["ETag"]
+        # The dispatcher and other workers invalidate their own cache, not
+        # this one.
+        with mock.patch("reminder.dispatch.dispatcher.invalidate_listing"):
+            Reminder.objects.filter(id=self.reminder.id).update(
+                end_date_time=datetime.datetime.now(tz=datetime.timezone.utc)
+                - datetime.timedelta(seconds=1),
+            )
+            Dispatcher([LocmemBackend()]).tick()
+        self.assertIsNotNone(self.client.get(self.url).data[0]["delivered_at"])
+        self.assertEqual(
+            self.client.get(self.url, headers={"If-None-Match": etag}).status_code,
+            status.HTTP_200_OK,
+        )
+        Reminder.objects.create(
+            reminder_title="Imported",
+            user=self.user,
+            end_date_time="2054-04-11T22:15:13Z",
+        )
+        self.assertEqual(self.titles(), ["Test Title 1", "Imported"])
+        self.assertEqual(listing_cache.stats.snapshot()["invalidations"], 0)
+
+    def test_evicted_version_does_not_resurrect_entries(self: TestListingCache) -> None:
+        """Losing the version key never serves an old entry."""
+        version = listing_cache.listing_version(self.user.id)
+        cache.delete(listing_cache.VERSION_KEY.format(user_id=self.user.id))
+        self.assertNotEqual(listing_cache.listing_version(self.user.id), version)
+        cache.delete(listing_cache.VERSION_KEY.format(user_id=self.user.id))
+        listing_cache.invalidate_listing(self.user.id)
+        self.assertNotEqual(listing_cache.listing_version(self.user.id), version)
+
+    @override_settings(REMINDER_LISTING_CACHE_ENABLED=False)
+    def test_disabled(self: TestListingCache) -> None:
+        """With the cache disabled every GET hits the database."""
+        self.titles()
+        with CaptureQueriesContext(connection) as ctx:
+            self.titles()
+        # The ETag marker and the listing itself.
+        self.assertEqual(len(ctx.captured_queries), 2)
+        self.assertEqual(
+            listing_cache.stats.snapshot(),
+            {"hits": 0, "misses": 0, "invalidations": 0},
+        )
@@ -0,0 +1,171 @@
+"""Reminder management commands test module."""
+from __future__ import annotations
+
+import datetime
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase
+
+from reminder.models import Reminder
+
+
+class TestExplainReminderQueries(TestCase):
+    """explain_reminder_queries tests."""
+
+    def setUp(self: TestExplainReminderQueries) -> None:
+        """Testcase setup."""
+        self.user = User.objects.create_user(
+            username="test-user",
+            password="test-pass",
+        )
+
+    def test_prints_plan_for_every_query(self: TestExplainReminderQueries) -> None:
+        """Every hot query gets a heading and a plan."""
+        out = StringIO()
+        call_command("explain_reminder_queries", user_id=self.user.id, stdout=out)
+        output = out.getvalue()
+        for name in [
+            "listing",
+            "listing page (keyset)",
+            "upcoming for user",
+            "window, newest first",
+            "dispatcher refill",
+            "dispatcher refill (keyset)",
+            "archive batch",
+        ]:
+            self.assertIn(f"== {name}\n", output)
+
+    def test_queries_use_composite_indexes(self: TestExplainReminderQueries) -> None:
+        """On SQLite the plans range-scan the composite indexes without a sort."""
+        if connection.vendor != "sqlite":
+            self.skipTest("Plan text is backend specific.")
+        out = StringIO()
+        call_command("explain_reminder_queries", user_id=self.user.id, stdout=out)
+        sections = dict(
+            section.split("\n", 1) for section in out.getvalue().split("== ")[1:]
+        )
+        for name in [
+            "listing",
+            "listing page (keyset)",
+            "upcoming for user",
+            "window, newest first",
+        ]:
+            self.assertIn("reminder_user_end_idx", sections[name])
+            self.assertNotIn("TEMP B-TREE", sections[name])
+        self.assertIn(
+            "(user_id=? AND end_date_time>?)",
+            sections["listing page (keyset)"],
+        )
+        self.assertIn(
+            "(user_id=? AND end_date_time>? AND end_date_time<?)",
+            sections["window, newest first"],
+        )
+        for name in ["dispatcher refill", "dispatcher refill (keyset)"]:
+            self.assertIn("reminder_pending_idx", sections[name])
+            self.assertNotIn("TEMP B-TREE", sections[name])
+        self.assertIn("reminder_end_idx", sections["archive batch"])
+        self.assertNotIn("TEMP B-TREE", sections["archive batch"])
+
+
+class TestImportReminders(TestCase):
+    """import_reminders tests."""
+
+    def setUp(self: TestImportReminders) -> None:
+        """Testcase setup."""
+        self.user = User.objects.create_user(
+            username="test-user",
+            password="test-pass",
+        )
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / "reminders.ndjson"
+        end = datetime.datetime.now(tz=datetime.timezone.utc) + datetime.timedelta(
+            days=1,
+        )
+        records = [
+            {"reminder_title": f"Imported {i}", "end_date_time": end.isoformat()}
+            for i in range(5)
+        ]
+        records[3]["end_date_time"] = "2001-01-01T00:00:00Z"
+        self.path.write_text("".join(f"{json.dumps(record)}\n" for record in records))
+        self.checkpoint = self.path.with_name("reminders.ndjson.checkpoint")
+
+    def call(self: TestImportReminders, **options: object) -> tuple[str, str]:
+        """Run the command and return its stdout and stderr."""
+        out, err = StringIO(), StringIO()
+        call_command(
+            "import_reminders",
+            str(self.path),
+            stdout=out,
+            stderr=err,
+            **{"user": "test-user", "batch_size": 2, **options},
+        )
+        return out.getvalue(), err.getvalue()
+
+    def test_imports_and_reports(self: TestImportReminders) -> None:
+        """Valid rows are imported, invalid ones reported by row number."""
+        out, err = self.call(progress_interval=0)
+        self.assertEqual(Reminder.objects.filter(user=self.user).count(), 4)
+        self.assertIn("rows=2 created=2 invalid=0", out)
+        self.assertIn("rows=5 created=4 invalid=1", out)
+        self.assertIn("rows/s", out)
+        self.assertIn("row 4: ", err)
+        self.assertFalse(self.checkpoint.exists())
+
+    def test_resumes_from_checkpoint(self: TestImportReminders) -> None:
+        """Rows before the checkpoint are skipped; a replayed batch is not duplicated."""
+        # The second batch is inserted, then the import dies before its
+        # checkpoint is written.
+        with mock.patch(
+            "reminder.importer.invalidate_listing",
+            side_effect=[None, RuntimeError],
+        ), self.assertRaises(RuntimeError):
+            self.call()
+        Reminder.objects.filter(reminder_title="Imported 4").delete()
+        out, _ = self.call()
+        self.assertIn("Resuming after row 2", out)
+        # "Imported 2" was replayed, not created again.
+        self.assertIn("created=1", out)
+        self.assertEqual(
+            sorted(Reminder.objects.values_list("reminder_title", flat=True)),
+            ["Imported 0", "Imported 1", "Imported 2", "Imported 4"],
+        )
+        self.assertFalse(self.checkpoint.exists())
+
+    def test_refuses_checkpoint_of_another_import(
+        self: TestImportReminders,
+    ) -> None:
+        """A checkpoint is only resumed by the same user and file."""
+        with mock.patch(
+            "reminder.importer.invalidate_listing",
+            side_effect=[None, RuntimeError],
+        ), self.assertRaises(RuntimeError):
+            self.call()
+        User.objects.create_user(username="other-user", password="test-pass")
+        with self.assertRaisesMessage(CommandError, "'test-user'"):
+            self.call(user="other-user")
+        self.path.write_text(self.path.read_text().replace("Imported", "Renamed"))
+        with self.assertRaisesMessage(CommandError, "different file"):
+            self.call()
+        self.assertFalse(Reminder.objects.filter(reminder_title__startswith="Renamed"))
+
+    def test_csv(self: TestImportReminders) -> None:
+        """CSV is picked from the extension; its header names the fields."""
+        self.path = self.path.with_suffix(".csv")
+        self.path.write_text(
+            "reminder_title,end_date_time\r\nFrom CSV,2054-04-11T22:15:13Z\r\n",
+        )
+        self.call()
+        self.assertEqual(Reminder.objects.get().reminder_title, "From CSV")
+
+    def test_unknown_user(self: TestImportReminders) -> None:
+        """A missing user is a command error."""
+        with self.assertRaises(CommandError):
+            call_command("import_reminders", str(self.path), user="nobody")
@@ -0,0 +1,335 @@
+"""Due-reminder dispatcher test module."""
+from __future__ import annotations
+
+import datetime
+import importlib
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.apps import apps
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from reminder.dispatch.backends import FileBackend, LocmemBackend, get_backends
+from reminder.dispatch.dispatcher import Dispatcher, LagStats
+from reminder.dispatch.scheduler import DueQueue
+from reminder.models import Reminder
+
+NOW = datetime.datetime(2030, 1, 1, 12, 0, tzinfo=datetime.timezone.utc)
+
+
+class FailingBackend(LocmemBackend):
+    """Backend that always fails."""
+
+    def deliver(self: FailingBackend, _reminders: list[Reminder]) -> None:
+        """Raise instead of delivering."""
+        raise ConnectionError
+
+
+class DispatchTestCase(TestCase):
+    """Shared setup with a controllable clock."""
+
+    def setUp(self: DispatchTestCase) -> None:
+        """Testcase setup."""
+        self.user = User.objects.create_user(
+            username="test-user",
+            password="test-pass",
+        )
+        self.now = NOW
+        LocmemBackend.outbox.clear()
+
+    def clock(self: DispatchTestCase) -> datetime.datetime:
+        """Return the fake current time."""
+        return self.now
+
+    def make(self: DispatchTestCase, seconds: float, title: str = "Title") -> Reminder:
+        """Create a reminder due ``seconds`` after ``NOW``."""
+        return Reminder.objects.create(
+            reminder_title=title,
+            user=self.user,
+            end_date_time=NOW + datetime.timedelta(seconds=seconds),
+        )
+
+    def dispatcher(self: DispatchTestCase, **kwargs: float) -> Dispatcher:
+        """Build a dispatcher on the locmem backend and fake clock."""
+        kwargs.setdefault("window", 60)
+        return Dispatcher([LocmemBackend()], clock=self.clock, **kwargs)
+
+
+class TestDueQueue(DispatchTestCase):
+    """DueQueue tests."""
+
+    def test_pops_in_due_order_up_to_now(self: TestDueQueue) -> None:
+        """Only due reminders are popped, earliest first."""
+        queue = DueQueue()
+        late, early, future = self.make(5), self.make(1), self.make(30)
+        for reminder in [late, future, early]:
+            queue.push(reminder)
+        self.assertFalse(queue.push(early))
+        self.assertEqual(len(queue), 3)
+        self.assertEqual(queue.next_due(), early.end_date_time)
+        due = queue.pop_due(NOW + datetime.timedelta(seconds=10), limit=10)
+        self.assertEqual(due, [early, late])
+        self.assertNotIn(early.id, queue)
+        self.assertIn(future.id, queue)
+
+    def test_pop_limit(self: TestDueQueue) -> None:
+        """At most ``limit`` reminders are popped."""
+        queue = DueQueue()
+        for i in range(5):
+            queue.push(self.make(i))
+        self.assertEqual(
+            len(queue.pop_due(NOW + datetime.timedelta(minutes=1), limit=2)),
+            2,
+        )
+        self.assertEqual(len(queue), 3)
+
+
+class TestDispatcher(DispatchTestCase):
+    """Dispatcher tests."""
+
+    def test_delivers_due_reminders_once(self: TestDispatcher) -> None:
+        """Due reminders are delivered once and marked delivered."""
+        due = [self.make(-5), self.make(0)]
+        future = self.make(30)
+        dispatcher = self.dispatcher()
+        self.assertEqual(dispatcher.tick(), 2)
+        self.assertEqual(
+            sorted(r.id for r in LocmemBackend.outbox),
+            sorted(r.id for r in due),
+        )
+        self.assertEqual(
+            Reminder.objects.filter(delivered_at=NOW).count(),
+            2,
+        )
+        self.assertEqual(dispatcher.tick(), 0)
+
+        self.now += datetime.timedelta(seconds=30)
+        self.assertEqual(dispatcher.tick(), 1)
+        self.assertEqual(LocmemBackend.outbox[-1].id, future.id)
+        self.assertEqual(len(LocmemBackend.outbox), 3)
+
+    def test_refill_is_bounded_by_window_and_incremental(self: TestDispatcher) -> None:
+        """Refill loads only the window and resumes from its watermark."""
+        for seconds in [1, 2, 3, 120]:
+            self.make(seconds)
+        dispatcher = self.dispatcher(batch_size=2)
+        self.assertEqual(dispatcher.refill(NOW), 3)
+        self.assertEqual(dispatcher.refill(NOW), 0)
+        self.make(61)
+        self.assertEqual(dispatcher.refill(NOW + datetime.timedelta(seconds=5)), 1)
+        self.assertEqual(len(dispatcher.queue), 4)
+
+    def test_max_queue(self: TestDispatcher) -> None:
+        """The in-memory queue never grows past ``max_queue``."""
+        for seconds in range(10):
+            self.make(seconds)
+        dispatcher = self.dispatcher(max_queue=4)
+        self.assertEqual(dispatcher.refill(NOW), 4)
+        self.now += datetime.timedelta(seconds=20)
+        self.assertEqual(dispatcher.tick(), 4)
+        self.assertEqual(dispatcher.tick(), 4)
+        self.assertEqual(dispatcher.tick(), 2)
+
+    def test_rescan_picks_up_late_arrivals(self: TestDispatcher) -> None:
+        """Reminders created behind the watermark are delivered after a rescan."""
+        self.make(10)
+        dispatcher = self.dispatcher(rescan_interval=5)
+        dispatcher.tick()
+        late = self.make(5)
+        self.now += datetime.timedelta(seconds=6)
+        self.assertEqual(dispatcher.tick(), 1)
+        self.assertEqual(LocmemBackend.outbox[-1].id, late.id)
+
+    def test_rescan_respects_max_queue(self: TestDispatcher) -> None:
+        """A backlog behind the watermark is queued no faster than it drains."""
+        self.make(10)
+        dispatcher = self.dispatcher(max_queue=4, rescan_interval=5)
+        dispatcher.tick()
+        for seconds in range(5):
+            self.make(seconds)
+        self.now += datetime.timedelta(seconds=5)
+        self.assertEqual(dispatcher.rescan(), 3)
+        self.assertEqual(len(dispatcher.queue), 4)
+        # The three due rows drain the queue, so the rest are rescanned
+        # without waiting for the next rescan.
+        self.assertEqual(dispatcher.tick(), 3)
+        self.assertEqual(dispatcher.tick(), 2)
+        self.assertEqual(len(LocmemBackend.outbox), 5)
+
+    def test_deleted_reminder_is_not_delivered(self: TestDispatcher) -> None:
+        """A reminder deleted after it was queued is skipped."""
+        reminder = self.make(5)
+        dispatcher = self.dispatcher()
+        dispatcher.tick()
+        reminder.delete()
+        self.now += datetime.timedelta(seconds=5)
+        self.assertEqual(dispatcher.tick(), 0)
+        self.assertEqual(LocmemBackend.outbox, [])
+
+    def test_failed_delivery_is_retried(self: TestDispatcher) -> None:
+        """A failing backend leaves the batch pending for the next rescan."""
+        reminder = self.make(0)
+        dispatcher = Dispatcher(
+            [FailingBackend()],
+            window=60,
+            rescan_interval=5,
+            clock=self.clock,
+        )
+        with self.assertLogs("reminder.dispatch", level="ERROR"):
+            self.assertEqual(dispatcher.tick(), 0)
+        self.assertEqual(dispatcher.failed, 1)
+        reminder.refresh_from_db()
+        self.assertIsNone(reminder.delivered_at)
+
+        dispatcher.backends = [LocmemBackend()]
+        self.now += datetime.timedelta(seconds=5)
+        self.assertEqual(dispatcher.tick(), 1)
+
+    def test_migration_marks_past_reminders_delivered(
+        self: TestDispatcher,
+    ) -> None:
+        """Reminders already due when delivered_at is added are not fired."""
+        migration = importlib.import_module(
+            "reminder.migrations.0003_reminder_delivered_at",
+        )
+        past = Reminder.objects.create(
+            reminder_title="Past",
+            user=self.user,
+            end_date_time=timezone.now() - datetime.timedelta(days=1),
+        )
+        future = Reminder.objects.create(
+            reminder_title="Future",
+            user=self.user,
+            end_date_time=timezone.now() + datetime.timedelta(days=1),
+        )
+        migration.mark_past_reminders_delivered(apps, None)
+        past.refresh_from_db()
+        future.refresh_from_db()
+        self.assertEqual(past.delivered_at, past.end_date_time)
+        self.assertIsNone(future.delivered_at)
+
+    def test_lag_stats(self: TestDispatcher) -> None:
+        """Lag is measured from the due time to delivery."""
+        self.make(-2)
+        self.make(-1)
+        dispatcher = self.dispatcher()
+        dispatcher.tick()
+        stats = dispatcher.stats()
+        self.assertEqual(stats["delivered"], 2)
+        self.assertEqual(stats["lag_p50_ms"], 1000)
+        self.assertEqual(stats["lag_p99_ms"], 2000)
+
+    def test_lag_percentiles(self: TestDispatcher) -> None:
+        """Nearest-rank percentiles over the samples."""
+        lag = LagStats()
+        self.assertEqual(lag.percentiles((50,)), {50: 0.0})
+        for sample in range(1, 101):
+            lag.record(sample)
+        self.assertEqual(lag.percentiles(), {50: 50, 95: 95, 99: 99})
+
+
+class TestBackends(DispatchTestCase):
+    """Delivery backend tests."""
+
+    def test_file_backend_writes_json_lines(self: TestBackends) -> None:
+        """Each reminder becomes one JSON line."""
+        reminder = self.make(0, title="Water plants")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "due.jsonl"
+            backend = FileBackend(path=path)
+            backend.deliver([reminder])
+            backend.close()
+            lines = path.read_text().splitlines()
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(
+            json.loads(lines[0]),
+            {
+                "id": str(reminder.id),
+                "user": self.user.id,
+                "reminder_title": "Water plants",
+                "end_date_time": reminder.end_date_time.isoformat(),
+            },
+        )
+
+    @override_settings(
+        REMINDER_DISPATCH_BACKENDS=[
+            {"BACKEND": "reminder.dispatch.backends.LogBackend"},
+            {"BACKEND": "reminder.dispatch.backends.LocmemBackend"},
+        ],
+    )
+    def test_get_backends_from_settings(self: TestBackends) -> None:
+        """Backends are built from ``REMINDER_DISPATCH_BACKENDS``."""
+        self.assertEqual(
+            [type(backend).__name__ for backend in get_backends()],
+            ["LogBackend", "LocmemBackend"],
+        )
+
+
+class TestRunDispatcherCommand(DispatchTestCase):
+    """run_dispatcher command tests."""
+
+    @override_settings(
+        REMINDER_DISPATCH_BACKENDS=[
+            {"BACKEND": "reminder.dispatch.backends.LocmemBackend"},
+        ],
+    )
+    def test_once(self: TestRunDispatcherCommand) -> None:
+        """``--once`` delivers what is due and reports lag."""
+        overdue = Reminder.objects.create(
+            reminder_title="Overdue",
+            user=self.user,
+            end_date_time=datetime.datetime.now(tz=datetime.timezone.utc)
+            - datetime.timedelta(minutes=1),
+        )
+        out = StringIO()
+        call_command("run_dispatcher", once=True, stdout=out)
+        self.assertEqual([r.id for r in LocmemBackend.outbox], [overdue.id])
+        self.assertIn("delivered=1", out.getvalue())
+        self.assertIn("lag p50=", out.getvalue())
+
+
+class TestRecurringDispatch(DispatchTestCase):
+    """Recurring reminders roll forward instead of being marked delivered."""
+
+    def make_series(self: TestRecurringDispatch, rule: str) -> Reminder:
+        """Create a recurring reminder starting at ``NOW``."""
+        return Reminder.objects.create(
+            reminder_title="Series",
+            user=self.user,
+            end_date_time=NOW,
+            recurrence=rule,
+            recurrence_start=NOW,
+        )
+
+    def test_rolls_forward_until_the_last_occurrence(
+        self: TestRecurringDispatch,
+    ) -> None:
+        """Each delivery moves end_date_time on; the last one marks it delivered."""
+        series = self.make_series("FREQ=DAILY;INTERVAL=1;COUNT=2")
+        dispatcher = self.dispatcher()
+        self.assertEqual(dispatcher.tick(), 1)
+        series.refresh_from_db()
+        self.assertEqual(series.end_date_time, NOW + datetime.timedelta(days=1))
+        self.assertIsNone(series.delivered_at)
+        self.assertEqual(Reminder.objects.count(), 1)
+
+        self.now += datetime.timedelta(days=1)
+        self.assertEqual(dispatcher.tick(), 1)
+        series.refresh_from_db()
+        self.assertEqual(series.end_date_time, NOW + datetime.timedelta(days=1))
+        self.assertEqual(series.delivered_at, self.now)
+        self.assertEqual(len(LocmemBackend.outbox), 2)
+
+    def test_skips_missed_occurrences(self: TestRecurringDispatch) -> None:
+        """After downtime only the latest due occurrence fires, then the next is scheduled."""
+        series = self.make_series("FREQ=DAILY;INTERVAL=1")
+        self.now += datetime.timedelta(days=3, hours=1)
+        self.assertEqual(self.dispatcher().tick(), 1)
+        series.refresh_from_db()
+        self.assertEqual(series.end_date_time, NOW + datetime.timedelta(days=4))
+        self.assertEqual(len(LocmemBackend.outbox), 1)
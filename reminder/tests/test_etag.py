@@ -0,0 +1,137 @@
+"""Conditional listing (ETag / If-None-Match) test module."""
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from reminder.dispatch.backends import LocmemBackend
+from reminder.dispatch.dispatcher import Dispatcher
+from reminder.models import Reminder
+
+if TYPE_CHECKING:
+    from rest_framework.response import Response
+
+
+class TestListingETag(APITestCase):
+    """ETag support on ReminderView.get."""
+
+    def setUp(self: TestListingETag) -> None:
+        """Testcase setup."""
+        cache.clear()
+        self.url = reverse("reminder")
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username="test-user",
+            password="test-pass",
+        )
+        self.ouser = User.objects.create_user(
+            username="other-user",
+            password="test-pass",
+        )
+        self.reminder = Reminder.objects.create(
+            reminder_title="Test Title 1",
+            user=self.user,
+            end_date_time=datetime.datetime.now(tz=datetime.timezone.utc)
+            + datetime.timedelta(days=2),
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def etag(self: TestListingETag, params: dict | None = None) -> str:
+        """GET the listing and return its ETag."""
+        res: Response = self.client.get(self.url, params)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        return res["ETag"]
+
+    def test_strong_etag(self: TestListingETag) -> None:
+        """Listings carry a stable strong ETag."""
+        etag = self.etag()
+        self.assertTrue(etag.startswith('"'))
+        self.assertEqual(self.etag(), etag)
+
+    def test_if_none_match_returns_304(self: TestListingETag) -> None:
+        """A matching If-None-Match gets an empty 304."""
+        etag = self.etag()
+        res: Response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(res["ETag"], etag)
+        self.assertEqual(res.content, b"")
+
+    def test_if_none_match_lists(self: TestListingETag) -> None:
+        """Any ETag of a list, or ``*``, matches."""
+        etag = self.etag()
+        for header in [f'"stale", {etag}', "*"]:
+            res: Response = self.client.get(self.url, HTTP_IF_NONE_MATCH=header)
+            self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED, header)
+        res = self.client.get(self.url, HTTP_IF_NONE_MATCH='"stale"')
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    @override_settings(REMINDER_LISTING_CACHE_ENABLED=False)
+    def test_conditional_hit_runs_one_lightweight_query(self: TestListingETag) -> None:
+        """Without the listing cache a 304 costs one aggregate query."""
+        etag = self.etag()
+        with CaptureQueriesContext(connection) as ctx:
+            res: Response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(len(ctx.captured_queries), 1)
+        sql = ctx.captured_queries[0]["sql"]
+        self.assertIn("COUNT(*)", sql)
+        self.assertIn('MAX("reminder_reminder"."updated_at")', sql)
+        self.assertNotIn("reminder_title", sql)
+
+    def test_conditional_hit_on_cached_listing_checks_the_marker(
+        self: TestListingETag,
+    ) -> None:
+        """With the listing cache warm a 304 still checks the current marker."""
+        etag = self.etag()
+        with CaptureQueriesContext(connection) as ctx:
+            res: Response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(len(ctx.captured_queries), 1)
+
+    @override_settings(REMINDER_LISTING_CACHE_ENABLED=False)
+    def test_marker_uses_covering_index(self: TestListingETag) -> None:
+        """On SQLite the marker is answered from the index alone."""
+        if connection.vendor != "sqlite":
+            self.skipTest("Plan text is backend specific.")
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(self.url, HTTP_IF_NONE_MATCH="*")
+        with connection.cursor() as cursor:
+            # SQLite logs the statement with its parameters inlined.
+            cursor.execute("EXPLAIN QUERY PLAN " + ctx.captured_queries[0]["sql"])
+            plan = " ".join(str(row[-1]) for row in cursor.fetchall())
+        self.assertIn("COVERING INDEX reminder_user_updated_idx", plan)
+
+    def test_writes_change_the_etag(self: TestListingETag) -> None:
+        """Create, delete and dispatch each produce a new ETag."""
+        etags = [self.etag()]
+        self.client.post(
+            self.url,
+            data={"reminder_title": "New", "end_date_time": "2054-04-11T22:15:13Z"},
+        )
+        etags.append(self.etag())
+        self.client.delete(reverse("delete-reminder", args=[str(self.reminder.id)]))
+        etags.append(self.etag())
+        Reminder.objects.filter(user=self.user).update(
+            end_date_time=datetime.datetime.now(tz=datetime.timezone.utc)
+            - datetime.timedelta(seconds=1),
+        )
+        Dispatcher([LocmemBackend()]).tick()
+        etags.append(self.etag())
+        self.assertEqual(len(set(etags)), 4)
+
+    def test_etag_depends_on_user_and_params(self: TestListingETag) -> None:
+        """Different representations have different ETags."""
+        plain = self.etag()
+        paginated = self.etag({"page_size": 5})
+        self.client.force_authenticate(user=self.ouser)
+        other = self.etag()
+        self.assertEqual(len({plain, paginated, other}), 3)
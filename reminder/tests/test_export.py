@@ -0,0 +1,172 @@
+"""Streaming export test module."""
+from __future__ import annotations
+
+import datetime
+import json
+import tracemalloc
+from typing import TYPE_CHECKING
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient, APITestCase
+
+from reminder.models import Reminder
+from reminder.serializers import ReminderSerializer
+
+if TYPE_CHECKING:
+    from django.http import StreamingHttpResponse
+
+MEMORY_ROWS = 10_000
+# Peak traced memory allowed while streaming, whatever the row count.
+MEMORY_BOUND = 16 * 1024 * 1024
+
+
+def seed(user: User, count: int) -> None:
+    """Create ``count`` reminders for ``user``."""
+    base = datetime.datetime(2054, 4, 11, 22, 15, 13, tzinfo=datetime.timezone.utc)
+    Reminder.objects.bulk_create(
+        (
+            Reminder(
+                user=user,
+                reminder_title=f"Export ⏰ {i}",
+                end_date_time=base + datetime.timedelta(seconds=i % 3, microseconds=i),
+            )
+            for i in range(count)
+        ),
+        batch_size=1000,
+    )
+
+
+@override_settings(REMINDER_EXPORT_CHUNK_SIZE=2)
+class TestExportReminderView(APITestCase):
+    """ExportReminderView tests."""
+
+    def setUp(self: TestExportReminderView) -> None:
+        """Testcase setup."""
+        self.url = reverse("export-reminder")
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username="test-user",
+            password="test-pass",
+        )
+        ouser = User.objects.create_user(username="other-user", password="test-pass")
+        seed(self.user, 5)
+        seed(ouser, 3)
+        self.client.force_authenticate(user=self.user)
+        self.reminders = Reminder.objects.filter(user=self.user).order_by(
+            "end_date_time",
+            "id",
+        )
+
+    def test_unauthenticated(self: TestExportReminderView) -> None:
+        """Exports require a logged in user."""
+        self.client.force_authenticate(user=None)
+        res: StreamingHttpResponse = self.client.get(self.url)
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_json(self: TestExportReminderView) -> None:
+        """The JSON export spans several chunks and matches the rendered listing."""
+        res: StreamingHttpResponse = self.client.get(self.url)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertTrue(res.streaming)
+        self.assertEqual(res["Content-Type"], "application/json")
+        self.assertEqual(
+            res["Content-Disposition"],
+            'attachment; filename="reminders.json"',
+        )
+        self.assertEqual(
+            b"".join(res.streaming_content),
+            JSONRenderer().render(ReminderSerializer(self.reminders, many=True).data),
+        )
+
+    def test_ndjson(self: TestExportReminderView) -> None:
+        """NDJSON has one serialized reminder per line."""
+        res: StreamingHttpResponse = self.client.get(
+            self.url,
+            {"export_format": "ndjson"},
+        )
+        self.assertEqual(res["Content-Type"], "application/x-ndjson")
+        lines = b"".join(res.streaming_content).decode().splitlines()
+        self.assertEqual(
+            [json.loads(line) for line in lines],
+            ReminderSerializer(self.reminders, many=True).data,
+        )
+
+    def test_empty(self: TestExportReminderView) -> None:
+        """No reminders give an empty array or an empty NDJSON body."""
+        Reminder.objects.filter(user=self.user).delete()
+        res: StreamingHttpResponse = self.client.get(self.url)
+        self.assertEqual(b"".join(res.streaming_content), b"[]")
+        res = self.client.get(self.url, {"export_format": "ndjson"})
+        self.assertEqual(b"".join(res.streaming_content), b"")
+
+    def test_unknown_format(self: TestExportReminderView) -> None:
+        """Unknown formats are rejected before streaming starts."""
+        res: StreamingHttpResponse = self.client.get(self.url, {"export_format": "xml"})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(ROOT_URLCONF="config.asgi_urls")
+    async def test_async_matches_sync(self: TestExportReminderView) -> None:
+        """The async export streams the same bytes."""
+        token = await Token.objects.acreate(user=self.user)
+        res = await self.async_client.get(
+            self.url,
+            {"export_format": "ndjson"},
+            headers={"Authorization": f"Token {token.key}"},
+        )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        body = b"".join([chunk async for chunk in res.streaming_content])
+        with override_settings(ROOT_URLCONF="config.urls"):
+            sync_res = await sync_to_async(self.client.get)(
+                self.url,
+                {"export_format": "ndjson"},
+            )
+            sync_body = await sync_to_async(b"".join)(sync_res.streaming_content)
+        self.assertEqual(body, sync_body)
+
+
+class TestExportMemory(APITestCase):
+    """Peak memory of an export does not grow with the row count.
+
+    ``bench_export`` runs the same check over a million reminders.
+    """
+
+    def setUp(self: TestExportMemory) -> None:
+        """Testcase setup."""
+        self.client = APIClient()
+        self.small = User.objects.create_user(username="small", password="test-pass")
+        self.large = User.objects.create_user(username="large", password="test-pass")
+        seed(self.small, settings.REMINDER_EXPORT_CHUNK_SIZE)
+        seed(self.large, MEMORY_ROWS)
+
+    def peak(self: TestExportMemory, user: User, export_format: str) -> tuple[int, int]:
+        """Return the exported row count and peak traced memory while streaming."""
+        self.client.force_authenticate(user=user)
+        res: StreamingHttpResponse = self.client.get(
+            reverse("export-reminder"),
+            {"export_format": export_format},
+        )
+        rows = 0
+        tracemalloc.start()
+        try:
+            for chunk in res.streaming_content:
+                rows += chunk.count(b"\n" if export_format == "ndjson" else b'"id"')
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return rows, peak
+
+    def test_peak_memory_is_bounded(self: TestExportMemory) -> None:
+        """Exporting five chunks peaks no higher than exporting one."""
+        for export_format in ("json", "ndjson"):
+            _, baseline = self.peak(self.small, export_format)
+            rows, peak = self.peak(self.large, export_format)
+            self.assertEqual(rows, MEMORY_ROWS)
+            self.assertLess(peak, MEMORY_BOUND)
+            self.assertLess(peak, baseline * 1.5)
@@ -0,0 +1,107 @@
+"""Fast read path serializer test module."""
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient, APITestCase
+
+from reminder.models import Reminder
+from reminder.serializers import FastReminderSerializer, ReminderSerializer
+
+if TYPE_CHECKING:
+    from rest_framework.response import Response
+
+
+class TestFastReminderSerializer(APITestCase):
+    """Golden tests: the fast path renders the same bytes as ReminderSerializer."""
+
+    def setUp(self: TestFastReminderSerializer) -> None:
+        """Testcase setup."""
+        cache.clear()
+        self.url = reverse("reminder")
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username="test-user",
+            password="test-pass",
+        )
+        ouser = User.objects.create_user(username="other-user", password="test-pass")
+        base = datetime.datetime(2054, 4, 11, 22, 15, 13, tzinfo=datetime.timezone.utc)
+        Reminder.objects.bulk_create(
+            [
+                Reminder(
+                    user=self.user,
+                    reminder_title="Whole seconds",
+                    end_date_time=base,
+                ),
+                Reminder(
+                    user=self.user,
+                    reminder_title="Microseconds",
+                    end_date_time=base + datetime.timedelta(microseconds=123456),
+                    delivered_at=base - datetime.timedelta(days=1, microseconds=1),
+                ),
+                Reminder(
+                    user=self.user,
+                    reminder_title='Ünïcødé ⏰ "quoted"',
+                    end_date_time=base + datetime.timedelta(days=400),
+                ),
+                Reminder(user=ouser, reminder_title="Other user", end_date_time=base),
+            ],
+        )
+        self.reminders = Reminder.objects.filter(user=self.user)
+        self.client.force_authenticate(user=self.user)
+
+    def render_both(self: TestFastReminderSerializer) -> tuple[bytes, bytes]:
+        """Render the listing through both serializers."""
+        fast = FastReminderSerializer()
+        return (
+            JSONRenderer().render(ReminderSerializer(self.reminders, many=True).data),
+            JSONRenderer().render(fast.to_representation(fast.rows(self.reminders))),
+        )
+
+    def test_identical_bytes(self: TestFastReminderSerializer) -> None:
+        """Keys, order, UUIDs, datetimes, nulls and unicode all match."""
+        golden, fast = self.render_both()
+        self.assertEqual(fast, golden)
+        self.assertIn(b'"delivered_at":null', fast)
+        self.assertIn(b".123456Z", fast)
+
+    def test_identical_bytes_in_another_timezone(
+        self: TestFastReminderSerializer,
+    ) -> None:
+        """Datetimes follow the active time zone as DRF's do."""
+        with timezone.override("Asia/Kolkata"):
+            golden, fast = self.render_both()
+        self.assertEqual(fast, golden)
+        self.assertIn(b"+05:30", fast)
+
+    def test_listing_endpoint(self: TestFastReminderSerializer) -> None:
+        """GET /api/reminder/ serves exactly the ModelSerializer output."""
+        res: Response = self.client.get(self.url)
+        golden = JSONRenderer().render(
+            ReminderSerializer(self.reminders, many=True).data,
+        )
+        self.assertEqual(res.content, golden)
+
+    def test_paginated_endpoint(self: TestFastReminderSerializer) -> None:
+        """Pages are identical too and their cursors still chain."""
+        ordered = list(self.reminders.order_by("end_date_time", "id"))
+        res: Response = self.client.get(self.url, {"page_size": 2})
+        self.assertEqual(
+            JSONRenderer().render(res.data["results"]),
+            JSONRenderer().render(ReminderSerializer(ordered[:2], many=True).data),
+        )
+        res = self.client.get(
+            self.url,
+            {"page_size": 2, "cursor": res.data["next_cursor"]},
+        )
+        self.assertEqual(
+            JSONRenderer().render(res.data["results"]),
+            JSONRenderer().render(ReminderSerializer(ordered[2:], many=True).data),
+        )
+        self.assertIsNone(res.data["next_cursor"])
@@ -0,0 +1,192 @@
+"""Server-sent events feed test module."""
+from __future__ import annotations
+
+import asyncio
+import datetime
+import json
+import tracemalloc
+from typing import TYPE_CHECKING
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+
+from config.profiling import request_sql
+from reminder.cache import invalidate_listing
+from reminder.feed import (
+    CHANGED,
+    KEEPALIVE,
+    RESYNC,
+    EventStream,
+    Subscription,
+    broker,
+)
+from reminder.models import Reminder
+
+if TYPE_CHECKING:
+    from django.http import StreamingHttpResponse
+
+IDLE_STREAMS = 10_000
+IDLE_BUDGET = IDLE_STREAMS * 3 * 1024  # bytes
+
+
+async def next_event(stream: object, timeout: float = 5) -> bytes:
+    """Read the next chunk of a stream, skipping keep-alives."""
+    while True:
+        chunk = await asyncio.wait_for(anext(stream), timeout)
+        if chunk != KEEPALIVE:
+            return chunk
+
+
+@override_settings(
+    ROOT_URLCONF="config.asgi_urls",
+    REMINDER_FEED_POLL_INTERVAL=0.05,
+    REMINDER_FEED_KEEPALIVE=3600,
+)
+class TestFeed(TestCase):
+    """FeedView and FeedBroker tests."""
+
+    def setUp(self: TestFeed) -> None:
+        """Testcase setup."""
+        cache.clear()
+        self.url = reverse("reminder-feed")
+        self.user = User.objects.create_user(
+            username="test-user",
+            password="test-pass",
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.headers = {"Authorization": f"Token {self.token.key}"}
+
+    async def open_stream(self: TestFeed) -> tuple[StreamingHttpResponse, object]:
+        """Open a feed, read its preamble and return the response and its stream."""
+        res = await self.async_client.get(self.url, headers=self.headers)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res["Content-Type"], "text/event-stream")
+        stream = aiter(res.streaming_content)
+        self.assertTrue((await next_event(stream)).startswith(b"retry: "))
+        # Servers close the response when the stream ends, which unsubscribes.
+        # The test's event loop cancels the broker task when it ends.
+        self.addCleanup(res.close)
+        return res, stream
+
+    async def test_unauthenticated(self: TestFeed) -> None:
+        """Token auth applies to the feed."""
+        res = await self.async_client.get(self.url)
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    async def test_due_event(self: TestFeed) -> None:
+        """A reminder is pushed once when it comes due."""
+        _, stream = await self.open_stream()
+        end = datetime.datetime.now(tz=datetime.timezone.utc) + datetime.timedelta(
+            seconds=0.2,
+        )
+        reminder = await Reminder.objects.acreate(
+            reminder_title="Soon",
+            user=self.user,
+            end_date_time=end,
+        )
+        event = await next_event(stream)
+        name, data = event.decode().strip().split("\n")
+        self.assertEqual(name, "event: due")
+        payload = json.loads(data.removeprefix("data: "))
+        self.assertEqual(payload["reminder"], str(reminder.id))
+        self.assertEqual(payload["reminder_title"], "Soon")
+
+    async def test_poll_does_not_inherit_request_context(self: TestFeed) -> None:
+        """Polls are not logged in the profile of the request that started them."""
+        sql: list[dict] = []
+        token = request_sql.set(sql)
+        try:
+            await self.open_stream()
+        finally:
+            request_sql.reset(token)
+        logged = len(sql)
+        await asyncio.sleep(0.2)
+        self.assertEqual(len(sql), logged)
+
+    async def test_changed_event(self: TestFeed) -> None:
+        """A write to the listing pushes ``changed``."""
+        _, stream = await self.open_stream()
+        await sync_to_async(invalidate_listing)(self.user.id)
+        self.assertEqual(await next_event(stream), CHANGED)
+
+    @override_settings(REMINDER_FEED_KEEPALIVE=0.01)
+    async def test_keepalive(self: TestFeed) -> None:
+        """Quiet streams send keep-alive comments."""
+        _, stream = await self.open_stream()
+        self.assertEqual(await asyncio.wait_for(anext(stream), 5), KEEPALIVE)
+
+    @override_settings(REMINDER_FEED_MAX_AGE=0.05, REMINDER_FEED_KEEPALIVE=0.01)
+    async def test_max_age(self: TestFeed) -> None:
+        """Streams end after the maximum age and release their subscription."""
+        _, stream = await self.open_stream()
+        chunks = [chunk async for chunk in stream]
+        self.assertTrue(all(chunk == KEEPALIVE for chunk in chunks))
+        self.assertNotIn(self.user.id, broker.subscribers)
+
+    @override_settings(REMINDER_FEED_MAX_PER_USER=1)
+    async def test_connection_cap(self: TestFeed) -> None:
+        """Streams beyond the per-user cap get 429 until one closes."""
+        first, _ = await self.open_stream()
+        res = await self.async_client.get(self.url, headers=self.headers)
+        self.assertEqual(res.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        await sync_to_async(first.close)()
+        await self.open_stream()
+
+    @override_settings(REMINDER_FEED_MAX_PER_USER=2)
+    async def test_connection_cap_under_concurrent_opens(self: TestFeed) -> None:
+        """Feeds opened at once still respect the cap, before any is read."""
+        responses = await asyncio.gather(
+            *(self.async_client.get(self.url, headers=self.headers) for _ in range(4)),
+        )
+        for res in responses:
+            self.addCleanup(res.close)
+        self.assertEqual(
+            sorted(res.status_code for res in responses),
+            [status.HTTP_200_OK] * 2 + [status.HTTP_429_TOO_MANY_REQUESTS] * 2,
+        )
+        self.assertEqual(len(broker.subscribers[self.user.id]), 2)
+
+    @override_settings(REMINDER_FEED_QUEUE_SIZE=3)
+    def test_backlog_is_bounded(self: TestFeed) -> None:
+        """A backlog that overflows collapses to a single ``resync``."""
+        subscription = Subscription(self.user.id)
+        for n in range(3):
+            subscription.push(b"%d" % n)
+        self.assertEqual(subscription.events, [b"0", b"1", b"2"])
+        subscription.push(b"3")
+        self.assertEqual(subscription.events, [RESYNC])
+        subscription.push(b"4")
+        self.assertEqual(subscription.events, [RESYNC, b"4"])
+
+    @override_settings(REMINDER_FEED_POLL_INTERVAL=3600)
+    async def test_idle_subscribers_memory(self: TestFeed) -> None:
+        """Ten thousand idle streams fit in the memory budget."""
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            streams = [
+                aiter(EventStream(broker.subscribe(user_id)))
+                for user_id in range(IDLE_STREAMS)
+            ]
+            for stream in streams:
+                await anext(stream)
+            # Each stream waits for its next event, as under an ASGI server.
+            waiting = [asyncio.ensure_future(anext(stream)) for stream in streams]
+            await asyncio.sleep(0)
+            used = tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(len(broker.subscribers), IDLE_STREAMS)
+        for task in waiting:
+            task.cancel()
+        await asyncio.gather(*waiting, return_exceptions=True)
+        for stream in streams:
+            await stream.aclose()
+        await broker.stop()
+        self.assertEqual(broker.subscribers, {})
+        self.assertLess(used, IDLE_BUDGET)
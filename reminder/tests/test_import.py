@@ -0,0 +1,142 @@
+"""Bulk import endpoint test module."""
+from __future__ import annotations
+
+import csv
+import datetime
+import json
+from typing import TYPE_CHECKING
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from reminder.models import Reminder
+
+if TYPE_CHECKING:
+    from rest_framework.response import Response
+
+
+@override_settings(REMINDER_IMPORT_BATCH_SIZE=2)
+class TestImportReminderView(APITestCase):
+    """ImportReminderView tests."""
+
+    def setUp(self: TestImportReminderView) -> None:
+        """Testcase setup."""
+        cache.clear()
+        self.url = reverse("import-reminder")
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username="test-user",
+            password="test-pass",
+        )
+        self.client.force_authenticate(user=self.user)
+        self.end = (
+            datetime.datetime.now(tz=datetime.timezone.utc) + datetime.timedelta(days=1)
+        ).isoformat()
+
+    def post(self: TestImportReminderView, body: str, content_type: str) -> Response:
+        """POST a raw body."""
+        return self.client.generic("POST", self.url, body.encode(), content_type)
+
+    def test_unauthenticated(self: TestImportReminderView) -> None:
+        """Imports require a logged in user."""
+        self.client.force_authenticate(user=None)
+        res: Response = self.post("", "application/x-ndjson")
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_ndjson(self: TestImportReminderView) -> None:
+        """Valid lines are imported; invalid ones are reported by record number."""
+        lines = [
+            json.dumps({"reminder_title": "First", "end_date_time": self.end}),
+            "{not json",
+            json.dumps(
+                {"reminder_title": "Past", "end_date_time": "2001-01-01T00:00:00Z"},
+            ),
+            "",
+            json.dumps({"reminder_title": "x" * 21, "end_date_time": self.end}),
+            json.dumps(
+                {"reminder_title": "Ünïcødé", "end_date_time": self.end, "user": 999},
+            ),
+            json.dumps(["not", "an", "object"]),
+        ]
+        res: Response = self.post("\n".join(lines), "application/x-ndjson")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data["rows"], 6)
+        self.assertEqual(res.data["created"], 2)
+        self.assertEqual(res.data["invalid"], 4)
+        self.assertEqual([error["row"] for error in res.data["errors"]], [2, 3, 4, 6])
+        self.assertIn("end_date_time", res.data["errors"][1]["errors"])
+        self.assertIn("reminder_title", res.data["errors"][2]["errors"])
+        self.assertEqual(
+            sorted(
+                Reminder.objects.filter(user=self.user).values_list(
+                    "reminder_title",
+                    flat=True,
+                ),
+            ),
+            ["First", "Ünïcødé"],
+        )
+
+    def test_csv(self: TestImportReminderView) -> None:
+        """CSV rows are imported across several batches."""
+        rows = "".join(f'"Title, {i}",{self.end}\r\n' for i in range(5))
+        res: Response = self.post(
+            f"reminder_title,end_date_time\r\n{rows}",
+            "text/csv; charset=utf-8",
+        )
+        self.assertEqual(res.data["created"], 5)
+        self.assertTrue(Reminder.objects.filter(reminder_title="Title, 4").exists())
+
+    def test_invalidates_listing(self: TestImportReminderView) -> None:
+        """Imported reminders show up in the cached listing."""
+        self.assertEqual(self.client.get(reverse("reminder")).data, [])
+        self.post(
+            json.dumps({"reminder_title": "First", "end_date_time": self.end}),
+            "application/x-ndjson",
+        )
+        self.assertEqual(len(self.client.get(reverse("reminder")).data), 1)
+
+    def test_unsupported_media_type(self: TestImportReminderView) -> None:
+        """Other bodies are rejected."""
+        res: Response = self.post("[]", "application/json")
+        self.assertEqual(res.status_code, status.HTTP_415_UNSUPPORTED_MEDIA_TYPE)
+
+    def test_invalid_utf8(self: TestImportReminderView) -> None:
+        """Undecodable bodies are a parse error."""
+        res: Response = self.client.generic("POST", self.url, b"\xff\xfe\n", "text/csv")
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_invalid_utf8_after_a_batch(self: TestImportReminderView) -> None:
+        """Batches committed before an undecodable line are reported as created."""
+        line = json.dumps({"reminder_title": "Before", "end_date_time": self.end})
+        body = f"{line}\n{line}\n{line}\n".encode() + b"\xff\n" + line.encode()
+        res: Response = self.client.generic(
+            "POST",
+            self.url,
+            body,
+            "application/x-ndjson",
+        )
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(res.data["created"], 2)
+        self.assertEqual(res.data["rows"], 2)
+        self.assertIn("not valid UTF-8", res.data["detail"])
+        self.assertEqual(Reminder.objects.filter(user=self.user).count(), 2)
+
+    def test_csv_reader_errors(self: TestImportReminderView) -> None:
+        """Rows the CSV reader rejects are row errors; a bad header is a parse error."""
+        limit = csv.field_size_limit(40)
+        self.addCleanup(csv.field_size_limit, limit)
+        res: Response = self.post(
+            f"reminder_title,end_date_time\r\nOK,{self.end}\r\n"
+            f"{'x' * 50},{self.end}\r\nAlso OK,{self.end}\r\n",
+            "text/csv",
+        )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data["created"], 2)
+        self.assertEqual(res.data["errors"][0]["row"], 2)
+
+        res = self.post(f"{'x' * 50}\r\n", "text/csv")
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,166 @@
+"""Keyset pagination test module."""
+from __future__ import annotations
+
+import base64
+import datetime
+import json
+import uuid
+from typing import TYPE_CHECKING
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from reminder.models import Reminder
+from reminder.pagination import ReminderCursorPagination
+
+if TYPE_CHECKING:
+    from rest_framework.response import Response
+
+
+class TestReminderCursorPagination(APITestCase):
+    """Cursor paginated ReminderView.get tests."""
+
+    def setUp(self: TestReminderCursorPagination) -> None:
+        """Testcase setup."""
+        cache.clear()
+        self.url = reverse("reminder")
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username="test-user",
+            password="test-pass",
+        )
+        self.ouser = User.objects.create_user(
+            username="other-user",
+            password="test-pass",
+        )
+        base = datetime.datetime.now(tz=datetime.timezone.utc) + datetime.timedelta(
+            days=1,
+        )
+        # Pairs share an end_date_time so the id tie-breaker is exercised.
+        Reminder.objects.bulk_create(
+            Reminder(
+                reminder_title=f"Title {i}",
+                user=self.user,
+                end_date_time=base + datetime.timedelta(minutes=i // 2),
+            )
+            for i in range(25)
+        )
+        Reminder.objects.create(
+            reminder_title="Other",
+            user=self.ouser,
+            end_date_time=base,
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def _walk(self: TestReminderCursorPagination, page_size: int) -> list[list[str]]:
+        """Follow ``next`` links to the end and return the ids of each page."""
+        pages = []
+        url = f"{self.url}?page_size={page_size}"
+        while url:
+            res: Response = self.client.get(url)
+            self.assertEqual(res.status_code, status.HTTP_200_OK)
+            pages.append([row["id"] for row in res.data["results"]])
+            url = res.data["next"]
+        return pages
+
+    def test_unpaginated_by_default(self: TestReminderCursorPagination) -> None:
+        """Without pagination params the plain list is returned."""
+        res: Response = self.client.get(self.url)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertIsInstance(res.data, list)
+        self.assertEqual(len(res.data), 25)
+
+    def test_walk_returns_every_reminder_once_in_order(
+        self: TestReminderCursorPagination,
+    ) -> None:
+        """Walking all pages yields each of the user's reminders once, ordered."""
+        pages = self._walk(page_size=4)
+        self.assertEqual([len(page) for page in pages], [4] * 6 + [1])
+        ids = [reminder_id for page in pages for reminder_id in page]
+        expected = [
+            str(reminder_id)
+            for reminder_id in Reminder.objects.filter(user=self.user)
+            .order_by("end_date_time", "id")
+            .values_list("id", flat=True)
+        ]
+        self.assertEqual(ids, expected)
+
+    def test_last_page_has_no_next(self: TestReminderCursorPagination) -> None:
+        """A page that fits everything has no continuation."""
+        res: Response = self.client.get(self.url, {"page_size": 100})
+        self.assertEqual(len(res.data["results"]), 25)
+        self.assertIsNone(res.data["next"])
+        self.assertIsNone(res.data["next_cursor"])
+
+    @override_settings(REMINDER_PAGE_SIZE=10, REMINDER_MAX_PAGE_SIZE=20)
+    def test_page_size_default_and_maximum(self: TestReminderCursorPagination) -> None:
+        """Empty cursor uses the default size and large sizes are clamped."""
+        res: Response = self.client.get(self.url, {"cursor": ""})
+        self.assertEqual(len(res.data["results"]), 10)
+        res = self.client.get(self.url, {"page_size": 1000})
+        self.assertEqual(len(res.data["results"]), 20)
+
+    def test_invalid_page_size(self: TestReminderCursorPagination) -> None:
+        """Non positive or non numeric page sizes are rejected."""
+        for page_size in ["0", "-3", "abc"]:
+            res: Response = self.client.get(self.url, {"page_size": page_size})
+            self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertEqual(res.data["errors"][0]["attr"], "page_size")
+
+    def test_invalid_cursor(self: TestReminderCursorPagination) -> None:
+        """Tampered cursors are rejected."""
+        for cursor in [
+            "garbage",
+            "e30",
+            ReminderCursorPagination.encode_cursor(
+                datetime.datetime.now(tz=datetime.timezone.utc),
+                uuid.uuid4(),
+            )[:-4],
+        ]:
+            res: Response = self.client.get(self.url, {"cursor": cursor})
+            self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST, cursor)
+            self.assertEqual(res.data["errors"][0]["attr"], "cursor")
+
+    def test_cursor_field_types(self: TestReminderCursorPagination) -> None:
+        """Well-formed cursors with values of the wrong type are rejected."""
+        now = datetime.datetime.now(tz=datetime.timezone.utc)
+        for position in [
+            [now.isoformat(), 5],
+            [now.isoformat(), None],
+            [12345, uuid.uuid4().hex],
+            {"end_date_time": now.isoformat(), "id": 5},
+            [now.isoformat(), uuid.uuid4().hex, "extra"],
+        ]:
+            cursor = base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+            res: Response = self.client.get(self.url, {"cursor": cursor})
+            self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST, position)
+            self.assertEqual(res.data["errors"][0]["attr"], "cursor")
+
+    def test_naive_cursor(self: TestReminderCursorPagination) -> None:
+        """A cursor without a UTC offset is rejected."""
+        cursor = ReminderCursorPagination.encode_cursor(
+            datetime.datetime(2030, 1, 1),  # noqa: DTZ001
+            uuid.uuid4(),
+        )
+        res: Response = self.client.get(self.url, {"cursor": cursor})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(res.data["errors"][0]["attr"], "cursor")
+
+    def test_deep_page_uses_keyset_not_offset(
+        self: TestReminderCursorPagination,
+    ) -> None:
+        """Following a cursor issues one range query without OFFSET."""
+        first: Response = self.client.get(self.url, {"page_size": 5})
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(first.data["next"])
+        # The first query is the ETag marker, the second fetches the page.
+        self.assertEqual(len(ctx.captured_queries), 2)
+        sql = ctx.captured_queries[1]["sql"].upper()
+        self.assertNotIn("OFFSET", sql)
+        self.assertIn("LIMIT 6", sql)
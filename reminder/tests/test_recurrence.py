@@ -0,0 +1,211 @@
+"""Recurring reminder test module."""
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from reminder.models import Reminder
+from reminder.recurrence import Recurrence
+
+if TYPE_CHECKING:
+    from rest_framework.response import Response
+
+START = datetime.datetime(2030, 1, 31, 9, 0, tzinfo=datetime.timezone.utc)
+
+
+def at(*args: int) -> datetime.datetime:
+    """Return a UTC datetime at 09:00."""
+    return datetime.datetime(*args, 9, 0, tzinfo=datetime.timezone.utc)
+
+
+class TestRecurrence(SimpleTestCase):
+    """Rule parsing and lazy expansion tests."""
+
+    def test_parse_and_canonical_text(self: TestRecurrence) -> None:
+        """Rules are normalised; unsupported or malformed ones are rejected."""
+        self.assertEqual(
+            str(Recurrence.parse("rrule:freq=weekly;count=3")),
+            "FREQ=WEEKLY;INTERVAL=1;COUNT=3",
+        )
+        self.assertEqual(
+            str(Recurrence.parse("FREQ=DAILY;UNTIL=20300301T000000Z")),
+            "FREQ=DAILY;INTERVAL=1;UNTIL=20300301T000000Z",
+        )
+        for rule in [
+            "",
+            "FREQ=HOURLY",
+            "FREQ=DAILY;BYDAY=MO",
+            "FREQ=DAILY;INTERVAL=0",
+            "FREQ=DAILY;COUNT=x",
+            "FREQ=DAILY;COUNT=2;UNTIL=20300301T000000Z",
+            "FREQ=DAILY;UNTIL=2030-03-01",
+            "FREQ=DAILY;FREQ=WEEKLY",
+        ]:
+            with self.subTest(rule=rule), self.assertRaises(ValueError):
+                Recurrence.parse(rule)
+
+    def test_window_jumps_to_first_occurrence(self: TestRecurrence) -> None:
+        """Only occurrences inside [since, before) are produced."""
+        rule = Recurrence.parse("FREQ=WEEKLY;INTERVAL=2")
+        self.assertEqual(
+            list(rule.occurrences(START, since=at(2031, 1, 1), before=at(2031, 2, 1))),
+            [at(2031, 1, 2), at(2031, 1, 16), at(2031, 1, 30)],
+        )
+
+    def test_count_includes_occurrences_before_the_window(self: TestRecurrence) -> None:
+        """COUNT bounds the whole series, not the window."""
+        rule = Recurrence.parse("FREQ=DAILY;COUNT=3")
+        self.assertEqual(
+            list(rule.occurrences(START)),
+            [START, at(2030, 2, 1), at(2030, 2, 2)],
+        )
+        self.assertEqual(
+            list(rule.occurrences(START, since=at(2030, 2, 2))),
+            [at(2030, 2, 2)],
+        )
+        self.assertEqual(list(rule.occurrences(START, since=at(2030, 2, 3))), [])
+
+    def test_monthly_skips_short_months(self: TestRecurrence) -> None:
+        """As in RFC 5545, months without the start day have no occurrence."""
+        rule = Recurrence.parse("FREQ=MONTHLY;COUNT=3")
+        self.assertEqual(
+            list(rule.occurrences(START)),
+            [START, at(2030, 3, 31), at(2030, 5, 31)],
+        )
+        self.assertEqual(
+            list(rule.occurrences(START, since=at(2030, 4, 1))),
+            [at(2030, 5, 31)],
+        )
+
+    def test_until_is_inclusive(self: TestRecurrence) -> None:
+        """An occurrence exactly at UNTIL is part of the series."""
+        rule = Recurrence.parse("FREQ=DAILY;UNTIL=20300202T090000Z")
+        self.assertEqual(
+            list(rule.occurrences(START)),
+            [START, at(2030, 2, 1), at(2030, 2, 2)],
+        )
+
+    def test_after(self: TestRecurrence) -> None:
+        """The next occurrence is strictly after the given moment."""
+        rule = Recurrence.parse("FREQ=DAILY;COUNT=2")
+        self.assertEqual(rule.after(START, START), at(2030, 2, 1))
+        self.assertIsNone(rule.after(START, at(2030, 2, 1)))
+
+
+class TestRecurringReminders(APITestCase):
+    """Creating recurring reminders and listing their occurrences."""
+
+    def setUp(self: TestRecurringReminders) -> None:
+        """Testcase setup."""
+        cache.clear()
+        self.url = reverse("reminder-occurrences")
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username="test-user",
+            password="test-pass",
+        )
+        self.client.force_authenticate(user=self.user)
+        self.start = datetime.datetime.now(tz=datetime.timezone.utc).replace(
+            microsecond=0,
+        ) + datetime.timedelta(days=1)
+
+    def create(self: TestRecurringReminders, **data: str) -> Response:
+        """POST a reminder starting at ``self.start``."""
+        return self.client.post(
+            reverse("reminder"),
+            {
+                "reminder_title": "Daily",
+                "end_date_time": self.start.isoformat(),
+                **data,
+            },
+        )
+
+    def iso(self: TestRecurringReminders, **offset: float) -> str:
+        """Return ``self.start`` plus ``offset`` as rendered by the API."""
+        when = self.start + datetime.timedelta(**offset)
+        return when.isoformat().replace("+00:00", "Z")
+
+    def window(self: TestRecurringReminders, days_from: float, days_to: float) -> dict:
+        """Return window query params relative to ``self.start``."""
+        return {
+            "from": (self.start + datetime.timedelta(days=days_from)).isoformat(),
+            "to": (self.start + datetime.timedelta(days=days_to)).isoformat(),
+        }
+
+    def test_create_stores_one_row(self: TestRecurringReminders) -> None:
+        """The rule is stored once, canonical, with the first occurrence."""
+        res: Response = self.create(recurrence="freq=daily;count=365")
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(res.data["recurrence"], "FREQ=DAILY;INTERVAL=1;COUNT=365")
+        reminder = Reminder.objects.get()
+        self.assertEqual(reminder.recurrence_start, self.start)
+
+    def test_create_rejects_bad_rules(self: TestRecurringReminders) -> None:
+        """Malformed rules and an UNTIL before the start are rejected."""
+        for rule in ["FREQ=YEARLY", "FREQ=DAILY;UNTIL=20000101T000000Z"]:
+            with self.subTest(rule=rule):
+                res: Response = self.create(recurrence=rule)
+                self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertEqual(res.data["errors"][0]["attr"], "recurrence")
+        self.assertFalse(Reminder.objects.exists())
+
+    def test_occurrences_in_window(self: TestRecurringReminders) -> None:
+        """Series and one-off reminders are merged in time order."""
+        self.create(recurrence="FREQ=DAILY")
+        self.create(
+            reminder_title="Once",
+            end_date_time=(
+                self.start + datetime.timedelta(days=2, hours=1)
+            ).isoformat(),
+        )
+        self.create(
+            reminder_title="Later",
+            end_date_time=(self.start + datetime.timedelta(days=30)).isoformat(),
+        )
+        res: Response = self.client.get(self.url, self.window(1, 4))
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [(item["reminder_title"], item["occurs_at"]) for item in res.data],
+            [
+                ("Daily", self.iso(days=1)),
+                ("Daily", self.iso(days=2)),
+                ("Once", self.iso(days=2, hours=1)),
+                ("Daily", self.iso(days=3)),
+            ],
+        )
+
+    def test_finished_series_are_not_read(self: TestRecurringReminders) -> None:
+        """A delivered series ending before the window is filtered out in SQL."""
+        self.create(recurrence="FREQ=DAILY;COUNT=2")
+        Reminder.objects.update(
+            end_date_time=self.start + datetime.timedelta(days=1),
+            delivered_at=self.start + datetime.timedelta(days=1),
+        )
+        with self.assertNumQueries(1):
+            res: Response = self.client.get(self.url, self.window(5, 10))
+        self.assertEqual(res.data, [])
+
+    @override_settings(REMINDER_OCCURRENCE_LIMIT=3)
+    def test_limit(self: TestRecurringReminders) -> None:
+        """An endless series stops at the occurrence limit."""
+        self.create(recurrence="FREQ=DAILY")
+        res: Response = self.client.get(self.url, self.window(0, 300))
+        self.assertEqual(len(res.data), 3)
+
+    def test_window_validation(self: TestRecurringReminders) -> None:
+        """The window must be non-empty and bounded."""
+        for params in [
+            self.window(1, 1),
+            self.window(0, 400),
+            {"to": self.start.isoformat()},
+        ]:
+            with self.subTest(params=params):
+                res: Response = self.client.get(self.url, params)
+                self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
@@ -6,6 +6,9 @@ import uuid
 from typing import TYPE_CHECKING
 
 from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient, APITestCase
@@ -21,6 +24,7 @@ class TestReminderView(APITestCase):
 
     def setUp(self: TestReminderView) -> None:
         """Testcase setup."""
+        cache.clear()
         self.url = reverse("reminder")
         self.client = APIClient()
         self.user = User.objects.create_user(
@@ -227,11 +231,27 @@ class TestDeleteReminderView(APITestCase):
         self.assertEqual(Reminder.objects.all().count(), 1)
 
     def test_delete_unauthenticated(self: TestDeleteReminderView) -> None:
-        """Test delete deletes reminder given id."""
+        """Test unauthenticated delete is rejected."""
         self.assertEqual(Reminder.objects.all().count(), 2)
         res: Response = self.client.delete(self.url)
-        self.assertEqual(res.status_code, status.HTTP_202_ACCEPTED)
-        self.assertEqual(Reminder.objects.all().count(), 1)
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(Reminder.objects.all().count(), 2)
+
+    def test_delete_other_users_reminder(self: TestDeleteReminderView) -> None:
+        """Test a reminder of another user cannot be deleted."""
+        self.client.force_authenticate(user=self.user)
+        url = reverse("delete-reminder", args=[str(self.reminder2.id)])
+        res: Response = self.client.delete(url)
+        self.assertEqual(res.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+        self.assertTrue(Reminder.objects.filter(id=self.reminder2.id).exists())
+
+    def test_delete_is_a_single_query(self: TestDeleteReminderView) -> None:
+        """Test delete issues one DELETE without fetching the row."""
+        self.client.force_authenticate(user=self.user)
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.delete(self.url)
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertTrue(ctx.captured_queries[0]["sql"].startswith("DELETE"))
 
     def test_delete_with_bad_uuid(self: TestDeleteReminderView) -> None:
         """Test delete with bad UUID."""
@@ -240,3 +260,96 @@ class TestDeleteReminderView(APITestCase):
         res: Response = self.client.delete(self.bad_url)
         self.assertEqual(res.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
         self.assertEqual(Reminder.objects.all().count(), 2)
+
+
+class TestBulkDeleteReminderView(APITestCase):
+    """BulkDeleteReminderView tests."""
+
+    def setUp(self: TestBulkDeleteReminderView) -> None:
+        """Testcase setup."""
+        self.url = reverse("bulk-delete-reminder")
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username="test-user",
+            password="test-pass",
+        )
+        self.ouser = User.objects.create_user(
+            username="other-user",
+            password="test-pass",
+        )
+        now = datetime.datetime.now(tz=datetime.timezone.utc)
+        self.expired = Reminder.objects.create(
+            reminder_title="Expired",
+            user=self.user,
+            end_date_time=now - datetime.timedelta(days=1),
+        )
+        self.upcoming = Reminder.objects.create(
+            reminder_title="Upcoming",
+            user=self.user,
+            end_date_time=now + datetime.timedelta(days=1),
+        )
+        self.other = Reminder.objects.create(
+            reminder_title="Other",
+            user=self.ouser,
+            end_date_time=now - datetime.timedelta(days=1),
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def test_delete_by_ids(self: TestBulkDeleteReminderView) -> None:
+        """Test only the user's reminders among the ids are deleted."""
+        ids = [str(self.expired.id), str(self.upcoming.id), str(self.other.id)]
+        with CaptureQueriesContext(connection) as ctx:
+            res: Response = self.client.post(self.url, data={"ids": ids}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data, {"deleted": 2})
+        self.assertEqual(list(Reminder.objects.all()), [self.other])
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertTrue(ctx.captured_queries[0]["sql"].startswith("DELETE"))
+
+    def test_delete_expired_before(self: TestBulkDeleteReminderView) -> None:
+        """Test the cut-off deletes only the user's expired reminders."""
+        res: Response = self.client.post(
+            self.url,
+            data={
+                "expired_before": datetime.datetime.now(
+                    tz=datetime.timezone.utc,
+                ).isoformat(),
+            },
+            format="json",
+        )
+        self.assertEqual(res.data, {"deleted": 1})
+        self.assertFalse(Reminder.objects.filter(id=self.expired.id).exists())
+        self.assertEqual(Reminder.objects.count(), 2)
+
+    def test_ids_and_cut_off_combine(self: TestBulkDeleteReminderView) -> None:
+        """Test both selectors must match."""
+        res: Response = self.client.post(
+            self.url,
+            data={
+                "ids": [str(self.upcoming.id)],
+                "expired_before": datetime.datetime.now(
+                    tz=datetime.timezone.utc,
+                ).isoformat(),
+            },
+            format="json",
+        )
+        self.assertEqual(res.data, {"deleted": 0})
+        self.assertEqual(Reminder.objects.count(), 3)
+
+    def test_requires_a_selector(self: TestBulkDeleteReminderView) -> None:
+        """Test an empty selection is rejected instead of deleting everything."""
+        for payload in [{}, {"ids": []}, {"ids": ["not-a-uuid"]}]:
+            res: Response = self.client.post(self.url, data=payload, format="json")
+            self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST, payload)
+        self.assertEqual(Reminder.objects.count(), 3)
+
+    def test_unauthenticated(self: TestBulkDeleteReminderView) -> None:
+        """Test unauthenticated users cannot bulk delete."""
+        self.client.force_authenticate(user=None)
+        res: Response = self.client.post(
+            self.url,
+            data={"ids": [str(self.expired.id)]},
+            format="json",
+        )
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(Reminder.objects.count(), 3)
@@ -0,0 +1,230 @@
+"""Reminder title search test module."""
+from __future__ import annotations
+
+import datetime
+from io import StringIO
+from typing import TYPE_CHECKING
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from reminder.models import Reminder
+from reminder.search import FTS5SearchBackend, search_backend, sqlite_has_fts5
+
+if TYPE_CHECKING:
+    from rest_framework.response import Response
+
+ICONTAINS = "reminder.search.IcontainsSearchBackend"
+
+
+class TestSearchReminders(APITestCase):
+    """SearchReminderView tests."""
+
+    def setUp(self: TestSearchReminders) -> None:
+        """Testcase setup."""
+        self.url = reverse("search-reminder")
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username="test-user",
+            password="test-pass",
+        )
+        self.ouser = User.objects.create_user(
+            username="other-user",
+            password="test-pass",
+        )
+        end = datetime.datetime.now(tz=datetime.timezone.utc) + datetime.timedelta(
+            days=1,
+        )
+        for offset, title in enumerate(
+            ["Buy milk", "Call mum", "Dentist visit", "Café meeting", "milkshake run"],
+        ):
+            Reminder.objects.create(
+                reminder_title=title,
+                user=self.user,
+                end_date_time=end + datetime.timedelta(hours=offset),
+            )
+        Reminder.objects.create(
+            reminder_title="Buy milk",
+            user=self.ouser,
+            end_date_time=end,
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def titles(self: TestSearchReminders, q: str, **params: object) -> list[str]:
+        """Search and return the matching titles."""
+        res: Response = self.client.get(self.url, {"q": q, **params})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        return [row["reminder_title"] for row in res.data]
+
+    def test_default_backend(self: TestSearchReminders) -> None:
+        """SQLite with FTS5 gets the indexed backend."""
+        if connection.vendor != "sqlite" or not sqlite_has_fts5():
+            self.skipTest("FTS5 is SQLite only.")
+        self.assertIsInstance(search_backend(), FTS5SearchBackend)
+
+    def test_prefix_match(self: TestSearchReminders) -> None:
+        """Words match by prefix, case and accent insensitively, in listing order."""
+        self.assertEqual(self.titles("mil"), ["Buy milk", "milkshake run"])
+        self.assertEqual(self.titles("MILK"), ["Buy milk", "milkshake run"])
+        self.assertEqual(self.titles("cafe"), ["Café meeting"])
+        self.assertEqual(self.titles("milk", limit=1), ["Buy milk"])
+
+    def test_every_word_must_match(self: TestSearchReminders) -> None:
+        """Several words narrow the search."""
+        self.assertEqual(self.titles("bu mi"), ["Buy milk"])
+        self.assertEqual(self.titles("buy mum"), [])
+
+    def test_only_own_reminders(self: TestSearchReminders) -> None:
+        """Other users' reminders never match."""
+        res: Response = self.client.get(self.url, {"q": "buy"})
+        self.assertEqual(len(res.data), 1)
+        self.assertEqual(
+            Reminder.objects.get(id=res.data[0]["id"]).user_id,
+            self.user.id,
+        )
+
+    def test_operators_are_plain_words(self: TestSearchReminders) -> None:
+        """FTS5 syntax in the query is searched for literally."""
+        for q in ['"milk', "milk OR mum", "NOT milk", "owner:u1", "mi*lk", "(milk"]:
+            res: Response = self.client.get(self.url, {"q": q})
+            self.assertEqual(res.status_code, status.HTTP_200_OK, q)
+        self.assertEqual(self.titles("milk OR mum"), [])
+
+    def test_index_follows_writes(self: TestSearchReminders) -> None:
+        """Creates, bulk creates, title changes and deletes are searchable at once."""
+        res: Response = self.client.post(
+            reverse("reminder"),
+            [
+                {
+                    "reminder_title": "Water plants",
+                    "end_date_time": datetime.datetime.now(tz=datetime.timezone.utc)
+                    + datetime.timedelta(days=3),
+                },
+            ],
+            format="json",
+        )
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self.titles("water"), ["Water plants"])
+
+        reminder = Reminder.objects.get(reminder_title="Water plants")
+        Reminder.objects.filter(id=reminder.id).update(reminder_title="Feed cat")
+        self.assertEqual(self.titles("water"), [])
+        self.assertEqual(self.titles("feed"), ["Feed cat"])
+
+        res = self.client.delete(reverse("delete-reminder", args=[reminder.id]))
+        self.assertEqual(res.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(self.titles("feed"), [])
+
+    def test_invalid_query(self: TestSearchReminders) -> None:
+        """Missing, empty, wordless and over-long queries are rejected."""
+        for params in [
+            {},
+            {"q": ""},
+            {"q": "!?"},
+            {"q": "x" * 21},
+            {"q": "a", "limit": 0},
+        ]:
+            res: Response = self.client.get(self.url, params)
+            self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST, params)
+
+    def test_one_indexed_query(self: TestSearchReminders) -> None:
+        """A search is one query driven by the index, not a scan of the user's rows."""
+        if not isinstance(search_backend(), FTS5SearchBackend):
+            self.skipTest("FTS5 is not available.")
+        with CaptureQueriesContext(connection) as ctx:
+            self.titles("milk")
+        self.assertEqual(len(ctx.captured_queries), 1)
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {ctx.captured_queries[0]['sql']}")
+            plan = " ".join(row[-1] for row in cursor.fetchall())
+        self.assertIn("VIRTUAL TABLE", plan)
+        self.assertNotIn("reminder_user_end_idx", plan)
+
+    @override_settings(REMINDER_SEARCH_BACKEND=ICONTAINS)
+    def test_icontains_fallback(self: TestSearchReminders) -> None:
+        """The fallback matches substrings and still only the user's reminders."""
+        self.assertEqual(self.titles("milk"), ["Buy milk", "milkshake run"])
+        self.assertEqual(self.titles("ilk"), ["Buy milk", "milkshake run"])
+        self.assertEqual(self.titles("buy"), ["Buy milk"])
+
+
+class TestRebuildSearchIndex(APITestCase):
+    """rebuild_search_index tests."""
+
+    def setUp(self: TestRebuildSearchIndex) -> None:
+        """Testcase setup."""
+        if not isinstance(search_backend(), FTS5SearchBackend):
+            self.skipTest("FTS5 is not available.")
+        self.user = User.objects.create_user(
+            username="test-user",
+            password="test-pass",
+        )
+        end = datetime.datetime.now(tz=datetime.timezone.utc) + datetime.timedelta(
+            days=1,
+        )
+        Reminder.objects.bulk_create(
+            Reminder(reminder_title=f"Task {n}", user=self.user, end_date_time=end)
+            for n in range(5)
+        )
+
+    def search(self: TestRebuildSearchIndex, q: str) -> int:
+        """Return the number of the user's reminders matching ``q``."""
+        return FTS5SearchBackend().search(self.user, [q]).count()
+
+    def test_triggers_exist(self: TestRebuildSearchIndex) -> None:
+        """Migrations that remake reminder_reminder must keep the sync triggers."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'reminder_reminder'",
+            )
+            triggers = {row[0] for row in cursor.fetchall()}
+        self.assertEqual(
+            triggers,
+            {
+                "reminder_search_insert",
+                "reminder_search_delete",
+                "reminder_search_update",
+            },
+        )
+
+    def test_migrate_restores_lost_triggers(self: TestRebuildSearchIndex) -> None:
+        """``migrate`` recreates triggers a table remake dropped and re-indexes."""
+        with connection.cursor() as cursor:
+            cursor.execute("DROP TRIGGER reminder_search_insert")
+        Reminder.objects.create(
+            reminder_title="Unindexed",
+            user=self.user,
+            end_date_time=datetime.datetime.now(tz=datetime.timezone.utc)
+            + datetime.timedelta(days=1),
+        )
+        self.assertEqual(self.search("unindexed"), 0)
+        with self.assertLogs("reminder.search", "WARNING"):
+            call_command("migrate", verbosity=0)
+        self.test_triggers_exist()
+        self.assertEqual(self.search("unindexed"), 1)
+        self.assertEqual(self.search("task"), 5)
+
+    def test_rebuild_restores_lost_index(self: TestRebuildSearchIndex) -> None:
+        """Rebuilding re-indexes every reminder exactly once."""
+        with connection.cursor() as cursor:
+            cursor.execute("DELETE FROM reminder_search")
+        self.assertEqual(self.search("task"), 0)
+        out = StringIO()
+        call_command("rebuild_search_index", stdout=out)
+        self.assertEqual(out.getvalue(), "indexed=5\n")
+        self.assertEqual(self.search("task"), 5)
+        call_command("rebuild_search_index", stdout=StringIO())
+        self.assertEqual(self.search("task"), 5)
+
+    @override_settings(REMINDER_SEARCH_BACKEND=ICONTAINS)
+    def test_rebuild_without_index(self: TestRebuildSearchIndex) -> None:
+        """Backends without an index have nothing to rebuild."""
+        out = StringIO()
+        call_command("rebuild_search_index", stdout=out)
+        self.assertIn("nothing to do", out.getvalue())
@@ -0,0 +1,213 @@
+"""Listing time window (from/to, upcoming, limit, ordering) test module."""
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from reminder.models import Reminder
+
+if TYPE_CHECKING:
+    from rest_framework.response import Response
+
+
+def iso(moment: datetime.datetime) -> str:
+    """Format a datetime the way the API does."""
+    return moment.isoformat().replace("+00:00", "Z")
+
+
+class TestListingWindow(APITestCase):
+    """Window query parameters on ReminderView.get."""
+
+    def setUp(self: TestListingWindow) -> None:
+        """Testcase setup."""
+        cache.clear()
+        self.url = reverse("reminder")
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username="test-user",
+            password="test-pass",
+        )
+        self.ouser = User.objects.create_user(
+            username="other-user",
+            password="test-pass",
+        )
+        self.now = datetime.datetime.now(tz=datetime.timezone.utc).replace(
+            microsecond=0,
+        )
+        self.days = [self.now + datetime.timedelta(days=day) for day in range(-2, 5)]
+        Reminder.objects.bulk_create(
+            Reminder(reminder_title=f"Day {day}", user=self.user, end_date_time=end)
+            for day, end in enumerate(self.days, -2)
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def ends(self: TestListingWindow, params: dict) -> list[str]:
+        """GET the listing and return the end times of its rows."""
+        res: Response = self.client.get(self.url, params)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        return [row["end_date_time"] for row in res.data]
+
+    def seed_outside(self: TestListingWindow, count: int) -> None:
+        """Add ``count`` reminders before and after the window and for another user."""
+        far = datetime.timedelta(days=365)
+        Reminder.objects.bulk_create(
+            Reminder(
+                reminder_title="Outside",
+                user=user,
+                end_date_time=self.now + sign * (far + datetime.timedelta(minutes=n)),
+            )
+            for n in range(count)
+            for sign in (-1, 1)
+            for user in (self.user, self.ouser)
+        )
+
+    def test_from_to_is_half_open(self: TestListingWindow) -> None:
+        """``from`` is inclusive, ``to`` exclusive, rows come oldest first."""
+        ends = self.ends({"from": iso(self.days[1]), "to": iso(self.days[4])})
+        self.assertEqual(ends, [iso(day) for day in self.days[1:4]])
+
+    def test_single_bound(self: TestListingWindow) -> None:
+        """Either bound may be given alone."""
+        self.assertEqual(
+            self.ends({"from": iso(self.days[5])}),
+            [iso(day) for day in self.days[5:]],
+        )
+        self.assertEqual(
+            self.ends({"to": iso(self.days[1])}),
+            [iso(self.days[0])],
+        )
+
+    def test_upcoming(self: TestListingWindow) -> None:
+        """``upcoming=true`` leaves out reminders that have ended."""
+        with mock.patch(
+            "django.utils.timezone.now",
+            return_value=self.now + datetime.timedelta(seconds=1),
+        ):
+            ends = self.ends({"upcoming": "true"})
+        self.assertEqual(ends, [iso(day) for day in self.days[3:]])
+        self.assertEqual(len(self.ends({"upcoming": "false"})), len(self.days))
+
+    def test_limit_and_descending_ordering(self: TestListingWindow) -> None:
+        """``limit`` caps the rows in the requested order."""
+        self.assertEqual(
+            self.ends({"limit": 2}),
+            [iso(day) for day in self.days[:2]],
+        )
+        self.assertEqual(
+            self.ends({"ordering": "-end_date_time", "limit": 2}),
+            [iso(day) for day in self.days[:-3:-1]],
+        )
+
+    @override_settings(REMINDER_MAX_PAGE_SIZE=3)
+    def test_limit_is_clamped(self: TestListingWindow) -> None:
+        """Large limits are clamped to the maximum page size."""
+        self.assertEqual(len(self.ends({"limit": 1000})), 3)
+
+    def test_invalid_parameters(self: TestListingWindow) -> None:
+        """Malformed or contradictory parameters are rejected."""
+        for params, attr in [
+            ({"from": "yesterday"}, "from"),
+            ({"from": iso(self.days[2]), "to": iso(self.days[2])}, "to"),
+            ({"upcoming": "maybe"}, "upcoming"),
+            ({"limit": "0"}, "limit"),
+            ({"ordering": "reminder_title"}, "ordering"),
+            ({"limit": 2, "page_size": 2}, "limit"),
+            ({"ordering": "-end_date_time", "cursor": ""}, "ordering"),
+        ]:
+            res: Response = self.client.get(self.url, params)
+            self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST, params)
+            self.assertEqual(res.data["errors"][0]["attr"], attr, params)
+
+    def test_bounds_apply_to_pages(self: TestListingWindow) -> None:
+        """Keyset pages stay inside the window."""
+        params = {"from": iso(self.days[1]), "to": iso(self.days[5]), "page_size": 3}
+        res: Response = self.client.get(self.url, params)
+        ends = [row["end_date_time"] for row in res.data["results"]]
+        res = self.client.get(res.data["next"])
+        ends += [row["end_date_time"] for row in res.data["results"]]
+        self.assertIsNone(res.data["next"])
+        self.assertEqual(ends, [iso(day) for day in self.days[1:5]])
+
+    def test_archived_window(self: TestListingWindow) -> None:
+        """The archived listing accepts the same window."""
+        call = {"archived": "true", "ordering": "-end_date_time", "limit": 5}
+        res: Response = self.client.get(self.url, call)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data, [])
+
+    @override_settings(REMINDER_LISTING_CACHE_ENABLED=False)
+    def test_queries_do_not_depend_on_rows_outside_window(
+        self: TestListingWindow,
+    ) -> None:
+        """Rows outside the window change neither the query count nor the SQL."""
+        params = {
+            "from": iso(self.days[1]),
+            "to": iso(self.days[5]),
+            "ordering": "-end_date_time",
+            "limit": 3,
+        }
+        captured = []
+        for outside in (10, 1000):
+            self.seed_outside(outside)
+            with CaptureQueriesContext(connection) as ctx:
+                res: Response = self.client.get(self.url, params)
+            self.assertEqual(
+                [row["end_date_time"] for row in res.data],
+                [iso(day) for day in self.days[4:1:-1]],
+            )
+            captured.append([query["sql"] for query in ctx.captured_queries])
+        self.assertEqual(captured[0], captured[1])
+        # The ETag marker, then the window itself.
+        self.assertEqual(len(captured[0]), 2)
+        sql = captured[0][1].upper()
+        self.assertIn("LIMIT 3", sql)
+        self.assertIn('ORDER BY "REMINDER_REMINDER"."END_DATE_TIME" DESC', sql)
+        self.assertNotIn("OFFSET", sql)
+
+        if connection.vendor == "sqlite":
+            with connection.cursor() as cursor:
+                cursor.execute(f"EXPLAIN QUERY PLAN {captured[0][1]}")
+                details = " ".join(row[-1] for row in cursor.fetchall())
+            self.assertIn("reminder_user_end_idx", details)
+            self.assertNotIn("TEMP B-TREE", details)
+
+    @override_settings(REMINDER_LISTING_CACHE_ENABLED=False)
+    def test_upcoming_query_count_constant(self: TestListingWindow) -> None:
+        """``upcoming`` costs the same two queries however many reminders have ended."""
+        counts = []
+        for outside in (10, 1000):
+            self.seed_outside(outside)
+            with CaptureQueriesContext(connection) as ctx:
+                self.client.get(self.url, {"upcoming": "true", "limit": 2})
+            counts.append(len(ctx.captured_queries))
+        self.assertEqual(counts, [2, 2])
+
+    def test_upcoming_etag_moves_when_first_row_ends(
+        self: TestListingWindow,
+    ) -> None:
+        """An upcoming listing is not cached and its ETag changes as time passes."""
+        params = {"upcoming": "true"}
+        res: Response = self.client.get(self.url, params)
+        etag = res["ETag"]
+        self.assertEqual(
+            self.client.get(self.url, params, HTTP_IF_NONE_MATCH=etag).status_code,
+            status.HTTP_304_NOT_MODIFIED,
+        )
+        later = self.days[3] + datetime.timedelta(seconds=1)
+        with mock.patch("django.utils.timezone.now", return_value=later):
+            res = self.client.get(self.url, params, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [row["end_date_time"] for row in res.data],
+            [iso(day) for day in self.days[4:]],
+        )
@@ -2,9 +2,22 @@
 
 from django.urls import path
 
-from .views.reminder import DeleteReminderView, ReminderView
+from .views.reminder import (
+    BulkDeleteReminderView,
+    DeleteReminderView,
+    ExportReminderView,
+    ImportReminderView,
+    OccurrenceView,
+    ReminderView,
+    SearchReminderView,
+)
 
 urlpatterns = [
     path("", ReminderView.as_view(), name="reminder"),
+    path("occurrences/", OccurrenceView.as_view(), name="reminder-occurrences"),
+    path("search/", SearchReminderView.as_view(), name="search-reminder"),
+    path("export/", ExportReminderView.as_view(), name="export-reminder"),
+    path("import/", ImportReminderView.as_view(), name="import-reminder"),
+    path("bulk-delete/", BulkDeleteReminderView.as_view(), name="bulk-delete-reminder"),
     path("<uuid:reminder_id>/", DeleteReminderView.as_view(), name="delete-reminder"),
 ]
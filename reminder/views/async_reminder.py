@@ -0,0 +1,174 @@
+"""Async reminder views, served by ``config.asgi_urls`` under ASGI."""
+
+from __future__ import annotations
+
+import typing
+from typing import TYPE_CHECKING
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from rest_framework import status
+from rest_framework.exceptions import Throttled
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.serializers import ListSerializer
+
+from config.async_api import AsyncAPIView
+from config.querybudget import query_budget
+from reminder import cache as listing_cache
+from reminder.etag import alisting_etag, etag_matches
+from reminder.export import aexport_chunks, requested_format
+from reminder.feed import EventStream, broker
+from reminder.models import Reminder
+from reminder.pagination import ReminderCursorPagination
+from reminder.views.reminder import (
+    create_budget,
+    create_serializer,
+    export_response,
+    listing_source,
+)
+from reminder.window import listing_window, window_queryset
+
+if TYPE_CHECKING:
+    import uuid
+
+    from rest_framework.request import Request
+
+
+class AsyncReminderView(AsyncAPIView):
+    """Async counterpart of ``ReminderView``."""
+
+    permission_classes: typing.ClassVar = [IsAuthenticated]
+
+    @query_budget(4)
+    async def get(self: AsyncReminderView, request: Request) -> Response:
+        """GET method, see ``ReminderView.get``."""
+        window = listing_window(request)
+        etag = await alisting_etag(request)
+        if etag_matches(request, etag):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        key = await listing_cache.alisting_key(request)
+        data = await listing_cache.aget_listing(key, etag)
+        if data is None:
+            data = await self.list_reminders(request, window)
+            await listing_cache.aset_listing(key, (etag, data))
+
+        return Response(data=data, status=status.HTTP_200_OK, headers={"ETag": etag})
+
+    async def list_reminders(
+        self: AsyncReminderView,
+        request: Request,
+        window: dict,
+    ) -> list | dict:
+        """Serialize the user's reminders in ``window``, paginated if requested."""
+        serializer, reminders = listing_source(request)
+        paginator = ReminderCursorPagination()
+        paginated = paginator.is_requested(request)
+        reminders = window_queryset(reminders, window, paginated=paginated)
+        if paginated:
+            page = await paginator.apaginate_queryset(
+                serializer.rows(reminders, named=True),
+                request,
+                view=self,
+            )
+            return paginator.get_paginated_data(serializer.to_representation(page))
+
+        return serializer.to_representation(
+            [row async for row in serializer.rows(reminders)],
+        )
+
+    @query_budget(create_budget)
+    async def post(self: AsyncReminderView, request: Request) -> Response:
+        """POST: create one reminder, or a JSON array of them."""
+        serializer = create_serializer(request)
+        if isinstance(serializer, ListSerializer):
+            # Batched inserts need a transaction, which is sync-only.
+            await sync_to_async(serializer.save)(user=request.user)
+        else:
+            serializer.instance = await Reminder.objects.acreate(
+                user=request.user,
+                **serializer.validated_data,
+            )
+        await listing_cache.ainvalidate_listing(request.user.id)
+
+        return Response(data=serializer.data, status=status.HTTP_201_CREATED)
+
+
+class AsyncExportReminderView(AsyncAPIView):
+    """Async counterpart of ``ExportReminderView``."""
+
+    permission_classes: typing.ClassVar = [IsAuthenticated]
+
+    @query_budget(1)
+    async def get(
+        self: AsyncExportReminderView,
+        request: Request,
+    ) -> StreamingHttpResponse:
+        """GET method, see ``ExportReminderView.get``."""
+        # Under ASGI a sync iterator would be buffered whole before sending.
+        export_format = requested_format(request)
+        return export_response(
+            aexport_chunks(
+                Reminder.objects.filter(user=request.user),
+                export_format,
+                settings.REMINDER_EXPORT_CHUNK_SIZE,
+            ),
+            export_format,
+        )
+
+
+class FeedView(AsyncAPIView):
+    """Push due and changed reminders to the client as server-sent events."""
+
+    permission_classes: typing.ClassVar = [IsAuthenticated]
+
+    @query_budget(1)
+    async def get(self: FeedView, request: Request) -> StreamingHttpResponse:
+        """GET method.
+
+        Streams ``text/event-stream``: a ``due`` event per occurrence as it
+        comes due, ``changed`` when the listing changed, and ``resync`` if
+        events were dropped. Served only under ASGI, where an idle stream
+        holds no thread. At most ``REMINDER_FEED_MAX_PER_USER`` streams per
+        user, 429 beyond that.
+        """
+        version = (
+            await listing_cache.alisting_version(request.user.id)
+            if settings.REMINDER_LISTING_CACHE_ENABLED
+            else None
+        )
+        # Checking the cap and taking a slot with no await in between keeps
+        # concurrent opens from all getting under the cap.
+        subscription = broker.subscribe(request.user.id, version)
+        if subscription is None:
+            msg = f"At most {settings.REMINDER_FEED_MAX_PER_USER} open feeds per user."
+            raise Throttled(detail=msg)
+        return StreamingHttpResponse(
+            EventStream(subscription),
+            content_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+
+class AsyncDeleteReminderView(AsyncAPIView):
+    """Async counterpart of ``DeleteReminderView``."""
+
+    permission_classes: typing.ClassVar = [IsAuthenticated]
+
+    @query_budget(2)
+    async def delete(
+        self: AsyncDeleteReminderView,
+        request: Request,
+        reminder_id: uuid.UUID,
+    ) -> Response:
+        """Delete method."""
+        deleted, _ = await Reminder.objects.filter(
+            id=reminder_id,
+            user=request.user,
+        ).adelete()
+        if not deleted:
+            return Response(status=status.HTTP_422_UNPROCESSABLE_ENTITY)
+        await listing_cache.ainvalidate_listing(request.user.id)
+        return Response(status=status.HTTP_202_ACCEPTED)
@@ -2,76 +2,392 @@
 
 from __future__ import annotations
 
+import codecs
+import csv
 import typing
+from itertools import islice
 from typing import TYPE_CHECKING
 
+from django.conf import settings
+from django.http import StreamingHttpResponse
 from rest_framework import status
-from rest_framework.exceptions import APIException, ValidationError
+from rest_framework.exceptions import (
+    APIException,
+    UnsupportedMediaType,
+    ValidationError,
+)
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from reminder.models import Reminder
-from reminder.serializers import ReminderSerializer
+from config.querybudget import batches, insert_batches, query_budget
+from reminder import cache as listing_cache
+from reminder.archive import archived_requested
+from reminder.etag import etag_matches, listing_etag
+from reminder.export import CONTENT_TYPES, export_chunks, requested_format
+from reminder.importer import IMPORT_FORMATS, PARSERS, ReminderImporter
+from reminder.models import ArchivedReminder, Reminder, occurring_between
+from reminder.pagination import ReminderCursorPagination
+from reminder.recurrence import merge_occurrences
+from reminder.search import search_backend, search_terms
+from reminder.serializers import (
+    ArchivedReminderSerializer,
+    BulkDeleteSerializer,
+    FastReminderSerializer,
+    OccurrenceSerializer,
+    OccurrenceWindowSerializer,
+    ReminderSerializer,
+    SearchQuerySerializer,
+)
+from reminder.window import listing_window, window_queryset
 
 if TYPE_CHECKING:
     import uuid
 
+    from django.db.models import QuerySet
+    from django.http import HttpRequest, HttpResponse
     from rest_framework.request import Request
 
 
+def create_serializer(request: Request) -> ReminderSerializer:
+    """Validate a create payload: one reminder, or a JSON array of them."""
+    many = isinstance(request.data, list)
+    serializer = ReminderSerializer(
+        data=request.data,
+        many=many,
+        **(
+            {"max_length": settings.REMINDER_BULK_MAX_ITEMS, "allow_empty": False}
+            if many
+            else {}
+        ),
+    )
+
+    if not serializer.is_valid():
+        raise ValidationError(
+            detail=serializer.errors,
+            code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        )
+    return serializer
+
+
+def create_budget(_request: HttpRequest, response: HttpResponse) -> int:
+    """Query budget of a create: the token lookup and the inserts.
+
+    A JSON array is inserted in ``REMINDER_BULK_BATCH_SIZE`` batches, or
+    smaller ones if the database allows fewer parameters, inside a savepoint,
+    which costs two more queries.
+    """
+    data = getattr(response, "data", None)
+    if response.status_code != status.HTTP_201_CREATED or not isinstance(data, list):
+        return 2
+    return 3 + insert_batches(Reminder, len(data), settings.REMINDER_BULK_BATCH_SIZE)
+
+
+def import_budget(_request: HttpRequest, response: HttpResponse) -> int:
+    """Query budget of an import: the token lookup and the batched inserts."""
+    created = getattr(response, "data", {}).get("created", 0)
+    # Every REMINDER_IMPORT_BATCH_SIZE batch may end with a short insert.
+    return (
+        1
+        + insert_batches(Reminder, created, settings.REMINDER_BULK_BATCH_SIZE)
+        + batches(created, settings.REMINDER_IMPORT_BATCH_SIZE)
+    )
+
+
+def listing_source(request: Request) -> tuple[FastReminderSerializer, QuerySet]:
+    """Return the serializer and rows of the live or, if asked, archived listing."""
+    if archived_requested(request):
+        return (
+            FastReminderSerializer(ArchivedReminderSerializer),
+            ArchivedReminder.objects.filter(user=request.user),
+        )
+    return FastReminderSerializer(), Reminder.objects.filter(user=request.user)
+
+
 class ReminderView(APIView):
     """Reminder api view."""
 
     permission_classes: typing.ClassVar = [IsAuthenticated]
 
-    def get(self: ReminderView, request: Request) -> None:
+    @query_budget(4)
+    def get(self: ReminderView, request: Request) -> Response:
         """GET method.
 
-        Returns list of reminders.
+        Returns list of reminders. Passing ``page_size`` or ``cursor`` switches
+        to keyset pagination ordered by ``(end_date_time, id)``.
+
+        Responses carry an ETag; a matching ``If-None-Match`` gets a 304
+        before any reminder is read or serialized.
+
+        Archived reminders are left out; ``?archived=true`` lists only them.
+
+        ``from``/``to``, ``upcoming``, ``limit`` and ``ordering`` narrow the
+        listing in the database, see :mod:`reminder.window`.
         """
-        user = request.user
-        reminders = Reminder.objects.filter(user=user)
-        serializer = ReminderSerializer(reminders, many=True)
+        window = listing_window(request)
+        etag = listing_etag(request)
+        if etag_matches(request, etag):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        key = listing_cache.listing_key(request)
+        data = listing_cache.get_listing(key, etag)
+        if data is None:
+            data = self.list_reminders(request, window)
+            listing_cache.set_listing(key, (etag, data))
+
+        return Response(data=data, status=status.HTTP_200_OK, headers={"ETag": etag})
 
-        return Response(data=serializer.data, status=status.HTTP_200_OK)
+    def list_reminders(
+        self: ReminderView,
+        request: Request,
+        window: dict,
+    ) -> list | dict:
+        """Serialize the user's reminders in ``window``, paginated if requested."""
+        serializer, reminders = listing_source(request)
+        paginator = ReminderCursorPagination()
+        paginated = paginator.is_requested(request)
+        reminders = window_queryset(reminders, window, paginated=paginated)
+        if paginated:
+            # Named rows expose end_date_time and id for the next cursor.
+            page = paginator.paginate_queryset(
+                serializer.rows(reminders, named=True),
+                request,
+                view=self,
+            )
+            return paginator.get_paginated_data(serializer.to_representation(page))
+
+        return serializer.to_representation(serializer.rows(reminders))
 
+    @query_budget(create_budget)
     def post(self: ReminderView, request: Request) -> Response:
-        """POST: create new reminder."""
-        data = request.data.copy()
-        data["user"] = request.user.id
-        serializer = ReminderSerializer(data=data)
+        """POST: create new reminder.
 
-        if not serializer.is_valid():
+        A JSON array creates every reminder in it, or none of them if any
+        item is invalid.
+        """
+        serializer = create_serializer(request)
+        serializer.save(user=request.user)
+        listing_cache.invalidate_listing(request.user.id)
+
+        return Response(data=serializer.data, status=status.HTTP_201_CREATED)
+
+
+def export_response(
+    streaming_content: object,
+    export_format: str,
+) -> StreamingHttpResponse:
+    """Wrap export chunks in a download response."""
+    return StreamingHttpResponse(
+        streaming_content,
+        content_type=CONTENT_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="reminders.{export_format}"',
+        },
+    )
+
+
+class OccurrenceView(APIView):
+    """Occurrences of the user's reminders in a time window."""
+
+    permission_classes: typing.ClassVar = [IsAuthenticated]
+
+    @query_budget(2)
+    def get(self: OccurrenceView, request: Request) -> Response:
+        """GET method.
+
+        Lists every occurrence in ``[from, to)`` in time order, at most
+        ``REMINDER_OCCURRENCE_LIMIT``. Recurring reminders are expanded on the
+        fly from their rule; only one row per reminder is read.
+        """
+        window = OccurrenceWindowSerializer(data=request.query_params)
+        if not window.is_valid():
             raise ValidationError(
-                detail=serializer.errors,
-                code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=window.errors,
+                code=status.HTTP_400_BAD_REQUEST,
+            )
+        since, before = window.validated_data["from"], window.validated_data["to"]
+
+        reminders = Reminder.objects.filter(
+            occurring_between(since, before),
+            user=request.user,
+        ).only(
+            "id",
+            "reminder_title",
+            "end_date_time",
+            "recurrence",
+            "recurrence_start",
+        )
+        occurrences = merge_occurrences(
+            (reminder, reminder.occurrences(since, before)) for reminder in reminders
+        )
+        data = [
+            {
+                "reminder": reminder.id,
+                "reminder_title": reminder.reminder_title,
+                "occurs_at": occurs_at,
+            }
+            for occurs_at, reminder in islice(
+                occurrences,
+                settings.REMINDER_OCCURRENCE_LIMIT,
+            )
+        ]
+        return Response(
+            data=OccurrenceSerializer(data, many=True).data,
+            status=status.HTTP_200_OK,
+        )
+
+
+class SearchReminderView(APIView):
+    """Search the user's reminders by title."""
+
+    permission_classes: typing.ClassVar = [IsAuthenticated]
+
+    @query_budget(3)
+    def get(self: SearchReminderView, request: Request) -> Response:
+        """GET method.
+
+        Lists the reminders with a title word starting with every word of
+        ``q``, ordered by ``(end_date_time, id)``, at most ``limit``
+        (``REMINDER_SEARCH_LIMIT`` by default). The ``icontains`` fallback
+        matches words anywhere in the title.
+        """
+        query = SearchQuerySerializer(data=request.query_params)
+        if not query.is_valid():
+            raise ValidationError(
+                detail=query.errors,
+                code=status.HTTP_400_BAD_REQUEST,
             )
+        limit = query.validated_data.get("limit", settings.REMINDER_SEARCH_LIMIT)
+        reminders = (
+            search_backend()
+            .search(request.user, search_terms(query.validated_data["q"]))
+            .order_by("end_date_time", "id")[:limit]
+        )
+        serializer = FastReminderSerializer()
+        return Response(
+            data=serializer.to_representation(serializer.rows(reminders)),
+            status=status.HTTP_200_OK,
+        )
+
+
+class ExportReminderView(APIView):
+    """Stream every reminder of the user."""
+
+    permission_classes: typing.ClassVar = [IsAuthenticated]
+
+    @query_budget(1)
+    def get(self: ExportReminderView, request: Request) -> StreamingHttpResponse:
+        """GET method.
+
+        Streams the user's reminders ordered by ``(end_date_time, id)`` as a
+        JSON array, or as NDJSON with ``?export_format=ndjson``. Memory use
+        does not grow with the number of reminders.
+        """
+        export_format = requested_format(request)
+        return export_response(
+            export_chunks(
+                Reminder.objects.filter(user=request.user),
+                export_format,
+                settings.REMINDER_EXPORT_CHUNK_SIZE,
+            ),
+            export_format,
+        )
+
+
+class ImportReminderView(APIView):
+    """Bulk import reminders from an NDJSON or CSV request body."""
 
-        reminder = serializer.save()
-        serialized = ReminderSerializer(reminder).data
+    permission_classes: typing.ClassVar = [IsAuthenticated]
+
+    @query_budget(import_budget)
+    def post(self: ImportReminderView, request: Request) -> Response:
+        """POST: import the body, sent as ``application/x-ndjson`` or ``text/csv``.
 
-        return Response(data=serialized, status=status.HTTP_201_CREATED)
+        The body is parsed as it is read and inserted in batches. Invalid rows
+        are skipped and reported; valid rows are imported regardless. If the
+        body stops being readable partway, the batches before it stay
+        imported: the response is a 400 with the summary up to the last
+        committed row and the reason in ``detail``.
+        """
+        media_type = request.content_type.split(";")[0].strip()
+        if media_type not in IMPORT_FORMATS:
+            raise UnsupportedMediaType(media_type)
+
+        importer = ReminderImporter(request.user)
+        lines = codecs.iterdecode(request.stream or (), "utf-8")
+        try:
+            importer.run(PARSERS[IMPORT_FORMATS[media_type]](lines))
+        except UnicodeDecodeError:
+            detail = f"Body is not valid UTF-8 after row {importer.rows}."
+        except csv.Error as exc:
+            detail = f"Body is not valid CSV: {exc}."
+        else:
+            return Response(data=importer.summary(), status=status.HTTP_200_OK)
+
+        return Response(
+            data={
+                **importer.summary(),
+                "rows": importer.committed_rows,
+                "detail": detail,
+            },
+            status=status.HTTP_400_BAD_REQUEST,
+        )
 
 
 class DeleteReminderView(APIView):
     """Delete Reminder view."""
 
+    permission_classes: typing.ClassVar = [IsAuthenticated]
+
+    @query_budget(2)
     def delete(
         self: DeleteReminderView,
-        _request: Request,
+        request: Request,
         reminder_id: uuid.UUID,
     ) -> Response:
         """Delete method."""
+        # Reminder has no dependants or delete signals, so Django issues a
+        # single user-scoped DELETE without fetching the row first.
         try:
-            reminder = Reminder.objects.get(id=reminder_id)
-        except Reminder.DoesNotExist:
-            return Response(status=status.HTTP_422_UNPROCESSABLE_ENTITY)
-        try:
-            reminder.delete()
+            deleted, _ = Reminder.objects.filter(
+                id=reminder_id,
+                user=request.user,
+            ).delete()
         except Exception as e:  # noqa: BLE001
             raise APIException(  # noqa: B904
                 detail=e,
                 code=status.HTTP_304_NOT_MODIFIED,
             )
+        if not deleted:
+            return Response(status=status.HTTP_422_UNPROCESSABLE_ENTITY)
+        listing_cache.invalidate_listing(request.user.id)
         return Response(status=status.HTTP_202_ACCEPTED)
+
+
+class BulkDeleteReminderView(APIView):
+    """Delete many reminders with one query."""
+
+    permission_classes: typing.ClassVar = [IsAuthenticated]
+
+    @query_budget(2)
+    def post(self: BulkDeleteReminderView, request: Request) -> Response:
+        """POST: delete the user's reminders matching ``ids`` and/or ``expired_before``."""
+        serializer = BulkDeleteSerializer(data=request.data)
+        if not serializer.is_valid():
+            raise ValidationError(
+                detail=serializer.errors,
+                code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            )
+
+        reminders = Reminder.objects.filter(user=request.user)
+        if "ids" in serializer.validated_data:
+            reminders = reminders.filter(id__in=serializer.validated_data["ids"])
+        if "expired_before" in serializer.validated_data:
+            reminders = reminders.filter(
+                end_date_time__lt=serializer.validated_data["expired_before"],
+            )
+        deleted, _ = reminders.delete()
+        if deleted:
+            listing_cache.invalidate_listing(request.user.id)
+
+        return Response(data={"deleted": deleted}, status=status.HTTP_200_OK)
@@ -0,0 +1,96 @@
+"""Server-side time window of reminder listings.
+
+``from`` and ``to`` bound ``end_date_time`` to ``[from, to)``,
+``upcoming=true`` keeps reminders that have not ended yet, ``limit`` caps the
+number of rows and ``ordering`` is ``end_date_time`` or ``-end_date_time``.
+Every combination is one range scan of the ``(user, end_date_time, id)``
+index, read forwards or backwards, so rows outside the window are never read.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.utils import timezone
+from rest_framework import serializers, status
+from rest_framework.exceptions import ValidationError
+
+from reminder.serializers import ListingWindowSerializer
+
+if TYPE_CHECKING:
+    import datetime
+
+    from django.db.models import QuerySet
+    from rest_framework.request import Request
+
+UPCOMING_QUERY_PARAM = "upcoming"
+WINDOW_QUERY_PARAMS = ("from", "to", UPCOMING_QUERY_PARAM, "limit", "ordering")
+
+
+def upcoming_requested(request: Request) -> bool:
+    """Check ``?upcoming=true``, which makes the listing depend on the current time."""
+    raw = request.query_params.get(UPCOMING_QUERY_PARAM)
+    if raw is None:
+        return False
+    try:
+        return serializers.BooleanField().to_internal_value(raw)
+    except serializers.ValidationError as exc:
+        raise serializers.ValidationError({UPCOMING_QUERY_PARAM: exc.detail}) from None
+
+
+def listing_window(request: Request) -> dict:
+    """Return the validated window parameters, or an empty dict if none were given."""
+    if not any(param in request.query_params for param in WINDOW_QUERY_PARAMS):
+        return {}
+    serializer = ListingWindowSerializer(data=request.query_params)
+    if not serializer.is_valid():
+        raise ValidationError(
+            detail=serializer.errors,
+            code=status.HTTP_400_BAD_REQUEST,
+        )
+    return serializer.validated_data
+
+
+def window_queryset(
+    queryset: QuerySet,
+    window: dict,
+    *,
+    paginated: bool = False,
+    now: datetime.datetime | None = None,
+) -> QuerySet:
+    """Restrict ``queryset`` to ``window`` and order and cap it as asked.
+
+    A paginated listing is ordered and sliced by the paginator, so only the
+    bounds apply; ``limit`` and a descending ``ordering`` are rejected.
+    """
+    if not window:
+        return queryset
+    if "from" in window:
+        queryset = queryset.filter(end_date_time__gte=window["from"])
+    if "to" in window:
+        queryset = queryset.filter(end_date_time__lt=window["to"])
+    if window["upcoming"]:
+        queryset = queryset.filter(end_date_time__gte=now or timezone.now())
+
+    descending = window.get("ordering", "end_date_time").startswith("-")
+    if paginated:
+        conflicts = {
+            param: "Cannot be combined with page_size or cursor."
+            for param, conflicting in (
+                ("limit", "limit" in window),
+                ("ordering", descending),
+            )
+            if conflicting
+        }
+        if conflicts:
+            raise ValidationError(conflicts, code=status.HTTP_400_BAD_REQUEST)
+        return queryset
+
+    queryset = (
+        queryset.order_by("-end_date_time", "-id")
+        if descending
+        else queryset.order_by("end_date_time", "id")
+    )
+    if "limit" in window:
+        queryset = queryset[: window["limit"]]
+    return queryset